@@ -0,0 +1,354 @@
+"""
+Meeting Transcription HTTP Job API
+==================================
+Lets other services (e.g. a recording bot) submit meetings without a browser
+session. Runs alongside the Streamlit UI and uses the same pipeline and
+model cache as the app.
+
+Requests are served by an async FastAPI layer; inference runs in a small
+thread pool, so a slow Whisper job never blocks other connections. Jobs are
+checkpointed (see JobCheckpoint in the app), so resubmitting a recording with
+the same settings after a crash resumes from the last finished stage.
+
+Endpoints:
+    POST /jobs                      multipart: audio file + meeting_info (JSON),
+                                    optional model_size, decoding_profile, deadline_seconds,
+                                    lang, spoken_language (ISO code or "auto";
+                                    default: lang) and priority ("interactive" or
+                                    "batch", the default) -> {"job_id": ...}
+    GET  /jobs/{job_id}             status, overall progress and per-stage progress
+                                    (finished jobs expire, see API_JOB_TTL_SECONDS)
+    DELETE /jobs/{job_id}           cancel a queued or running job
+    GET  /jobs/{job_id}/report/{fmt}  fmt = txt | md | json | ndjson | pdf; ?full=true keeps
+                                    Whisper's complete segments in json/ndjson,
+                                    ?gzip=true downloads the report gzipped
+    GET  /resources                 CPU cores and torch threads per running job
+    GET  /metrics                   Prometheus counters and histograms
+
+Usage:
+    python api-server-script.py --port 8000 --workers 2
+
+Example:
+    curl -F audio=@meeting.m4a -F 'meeting_info={"title": "Weekly Sync"}' localhost:8000/jobs
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import uvicorn
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+APP_PATH = Path(__file__).resolve().parent / "meeting-transcription-app.py"
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+REPORT_MEDIA_TYPES = {
+    "txt": "text/plain",
+    "md": "text/markdown",
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "pdf": "application/pdf",
+}
+
+DEFAULT_MEETING_INFO = {
+    "title": "Untitled Meeting",
+    "date": "N/A",
+    "time": "N/A",
+    "location": "Not specified",
+    "organizer": "Not specified",
+    "attendees": "Not specified"
+}
+
+
+def load_app_module():
+    """Import the Streamlit app file as a module (its filename is not importable)"""
+    spec = importlib.util.spec_from_file_location("meeting_transcription_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+meeting_app = load_app_module()
+whisper_languages = set(meeting_app.whisper.tokenizer.LANGUAGES)
+api = FastAPI(title="Meeting Transcription API")
+
+# Job records live in memory. A finished job (with its report) is kept for
+# API_JOB_TTL_SECONDS, and only the API_MAX_FINISHED_JOBS most recent ones;
+# queued and running jobs are never evicted
+JOB_TTL_SECONDS = float(os.environ.get("API_JOB_TTL_SECONDS", "3600"))
+MAX_FINISHED_JOBS = int(os.environ.get("API_MAX_FINISHED_JOBS", "100"))
+FINISHED_STATUSES = ("done", "failed", "cancelled")
+
+jobs = {}
+jobs_lock = threading.Lock()
+executor = ThreadPoolExecutor(max_workers=int(os.environ.get("API_WORKERS", "2")))
+
+
+def update_job(job_id, **fields):
+    """Thread-safe update of a job record"""
+    with jobs_lock:
+        jobs[job_id].update(fields)
+
+
+def evict_finished_jobs():
+    """Forget expired finished jobs and the oldest beyond MAX_FINISHED_JOBS (call with jobs_lock held)"""
+    now = time.time()
+    finished = sorted((job["finished_at"], job_id) for job_id, job in jobs.items()
+                      if job["status"] in FINISHED_STATUSES)
+    excess = len(finished) - MAX_FINISHED_JOBS
+    for i, (finished_at, job_id) in enumerate(finished):
+        if i < excess or now - finished_at > JOB_TTL_SECONDS:
+            del jobs[job_id]
+
+
+def find_job(job_id):
+    """The job record, or None if it never existed or has expired"""
+    with jobs_lock:
+        evict_finished_jobs()
+        return jobs.get(job_id)
+
+
+def run_job(job_id, audio_path, meeting_info, model_size, decoding_profile, deadline_seconds, lang,
+            spoken_language, priority, instrumentation, checkpoint):
+    """Run the pipeline for one job (called on an executor thread)"""
+    stage_names = list(meeting_app.PIPELINE_STAGES.values())
+
+    def on_progress(progress, message):
+        update_job(job_id, progress=round(progress, 3), message=message)
+
+    def on_stage(stage, stage_progress):
+        with jobs_lock:
+            stages = jobs[job_id]["stages"]
+            for name in stage_names[:stage_names.index(stage)]:
+                stages[name] = 1.0
+            stages[stage] = round(stage_progress, 3)
+
+    update_job(job_id, status="running", started_at=time.time())
+    try:
+        report_data = meeting_app.process_meeting(
+            audio_path,
+            meeting_info,
+            model_size=model_size,
+            lang=lang,
+            progress_callback=on_progress,
+            stage_callback=on_stage,
+            instrumentation=instrumentation,
+            spoken_language=spoken_language,
+            decoding_profile=decoding_profile,
+            deadline_seconds=deadline_seconds,
+            checkpoint=checkpoint,
+            priority=priority
+        )
+        update_job(job_id, status="done", progress=1.0, finished_at=time.time(), result=report_data)
+    except meeting_app.JobCancelled:
+        update_job(job_id, status="cancelled", finished_at=time.time())
+    except Exception as e:
+        update_job(job_id, status="failed", finished_at=time.time(), error=str(e))
+    finally:
+        checkpoint.release()
+        with jobs_lock:
+            evict_finished_jobs()
+        try:
+            os.unlink(audio_path)
+        except OSError:
+            pass
+
+
+@api.post("/jobs", status_code=202)
+async def create_job(
+    audio: UploadFile = File(...),
+    meeting_info: str = Form("{}"),
+    model_size: str = Form("base"),
+    decoding_profile: str = Form(None),
+    deadline_seconds: float = Form(None),
+    lang: str = Form("en"),
+    spoken_language: str = Form(None),
+    priority: str = Form("batch"),
+):
+    suffix = Path(audio.filename or "").suffix.lower()
+    if suffix.lstrip(".") not in meeting_app.SUPPORTED_AUDIO_FORMATS:
+        raise HTTPException(status_code=415, detail=f"Unsupported audio format: {suffix or 'unknown'}")
+    if model_size not in ("tiny", "base", "small", "medium"):
+        raise HTTPException(status_code=422, detail=f"Unknown model size: {model_size}")
+    decoding_profile = decoding_profile or meeting_app.DEFAULT_DECODING_PROFILE
+    if decoding_profile not in meeting_app.DECODING_PROFILES:
+        raise HTTPException(status_code=422, detail=f"Unknown decoding profile: {decoding_profile}")
+    if spoken_language not in (None, "auto") and spoken_language not in whisper_languages:
+        raise HTTPException(status_code=422, detail=f"Unknown spoken language: {spoken_language}")
+    if priority not in meeting_app.JOB_PRIORITIES:
+        raise HTTPException(status_code=422, detail=f"Unknown priority: {priority}")
+    try:
+        info = {**DEFAULT_MEETING_INFO, **json.loads(meeting_info)}
+    except (json.JSONDecodeError, TypeError) as e:
+        raise HTTPException(status_code=422, detail=f"meeting_info must be a JSON object: {e}")
+
+    job_id = uuid.uuid4().hex
+    instrumentation = meeting_app.JobInstrumentation(job_id=job_id)
+
+    # Stream the upload to disk without holding it all in memory; disk writes
+    # (and hashing below) run on threads so they never stall the event loop
+    with instrumentation.stage("upload"):
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+            while chunk := await audio.read(UPLOAD_CHUNK_SIZE):
+                await asyncio.to_thread(tmp_file.write, chunk)
+            tmp_path = tmp_file.name
+
+    settings = {
+        "model_size": model_size,
+        "decoding_profile": decoding_profile,
+        "spoken_language": spoken_language or lang,
+        "deadline_seconds": deadline_seconds,
+    }
+
+    def submit_checkpoint():
+        checkpoint = meeting_app.JobCheckpoint.for_recording(tmp_path, info, **settings)
+        checkpoint.submit(**settings)
+        return checkpoint
+
+    checkpoint = await asyncio.to_thread(submit_checkpoint)
+    
+    instrumentation.queued_at = time.time()
+    with jobs_lock:
+        evict_finished_jobs()
+        jobs[job_id] = {
+            "status": "queued",
+            "job_key": checkpoint.job_key,
+            "progress": 0.0,
+            "message": "",
+            "stages": {name: 0.0 for name in meeting_app.PIPELINE_STAGES.values()},
+            "created_at": time.time(),
+            "result": None,
+            "error": None,
+        }
+
+    loop = asyncio.get_running_loop()
+    loop.run_in_executor(executor, run_job, job_id, tmp_path, info, model_size,
+                         decoding_profile, deadline_seconds, lang, spoken_language, priority,
+                         instrumentation, checkpoint)
+    return {"job_id": job_id, "status": "queued"}
+
+
+@api.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    with jobs_lock:
+        evict_finished_jobs()
+        job = jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        status = {key: value for key, value in job.items() if key != "result"}
+        status["stages"] = dict(job["stages"])
+        if job["result"] is not None:
+            status["stats"] = job["result"]["stats"]
+            status["plan"] = job["result"]["plan"]
+            status["timings"] = job["result"]["timings"]
+            # A PDF still rendering is listed; fetching it waits for the render
+            status["formats"] = [fmt for fmt in REPORT_MEDIA_TYPES
+                                 if fmt != "pdf" or "pdf_future" in job["result"] or job["result"]["pdf_available"]]
+    status["job_id"] = job_id
+    return status
+
+
+@api.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    job = find_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] in FINISHED_STATUSES:
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+    # The pipeline notices the marker at its next progress update
+    meeting_app.JobCheckpoint(job["job_key"]).cancel()
+    return {"job_id": job_id, "status": "cancelling"}
+
+
+@api.get("/jobs/{job_id}/report/{fmt}")
+async def get_report(job_id: str, fmt: str, full: bool = False, gzip: bool = False):
+    if fmt not in REPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=404, detail=f"Unknown report format: {fmt}")
+    job = find_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] != "done":
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+
+    result = job["result"]
+    if fmt == "pdf":
+        await asyncio.to_thread(meeting_app.resolve_pdf, result)
+        if not result["pdf_available"]:
+            raise HTTPException(status_code=404, detail=f"PDF unavailable: {result['pdf_error']}")
+        chunks = [result["pdf"]]
+    elif fmt in ("json", "ndjson"):
+        # Streamed segment by segment instead of serialized into one string
+        chunks = meeting_app.export_chunks(result, fmt, full=full)
+    else:
+        chunks = [result["text"]]
+
+    filename = f"meeting_report_{job_id}.{fmt}"
+    media_type = REPORT_MEDIA_TYPES[fmt]
+    if gzip:
+        chunks = meeting_app.gzip_chunks(chunks)
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@api.get("/resources")
+async def resources():
+    return meeting_app.get_cpu_governor().allocation()
+
+
+@api.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    if meeting_app.prometheus_client is None:
+        raise HTTPException(status_code=501, detail="prometheus_client is not installed")
+    meeting_app.get_metrics()
+    return PlainTextResponse(
+        meeting_app.prometheus_client.generate_latest(),
+        media_type=meeting_app.prometheus_client.CONTENT_TYPE_LATEST
+    )
+
+
+@api.get("/health")
+async def health():
+    with jobs_lock:
+        evict_finished_jobs()
+        counts = {}
+        for job in jobs.values():
+            counts[job["status"]] = counts.get(job["status"], 0) + 1
+    return {"status": "ok", "jobs": counts}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the meeting pipeline over HTTP")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port (default: 8000)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Concurrent inference jobs (default: $API_WORKERS or 2)")
+    args = parser.parse_args()
+
+    if args.workers:
+        global executor
+        executor = ThreadPoolExecutor(max_workers=args.workers)
+
+    # WARMUP_MODELS loads models while the server already accepts requests
+    if meeting_app.WARMUP_MODELS:
+        meeting_app.start_model_warmup()
+
+    uvicorn.run(api, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+"""
+Batch Meeting Transcription Script
+==================================
+Process a backlog of recordings without clicking through the Streamlit UI.
+Reuses AudioTranscriber, MeetingAnalyzer and ReportGenerator from the app and
+spreads files across a pool of worker processes. Each worker loads its models
+once and keeps them for every file it handles.
+
+A manifest.json in the output directory records every finished file, so an
+interrupted run picks up where it stopped when started again. Within a file,
+finished pipeline stages (and transcription spans) are checkpointed, so a
+long recording resumes mid-way instead of starting over.
+
+Usage:
+    python batch-transcribe-script.py recordings/ --output reports/
+
+Or with a glob, more workers and selected formats:
+    python batch-transcribe-script.py "recordings/**/*.m4a" --workers 4 --formats txt json pdf
+
+JSON reports and the NDJSON transcript ("ndjson", one segment per line) are
+streamed to disk segment by segment; add --gzip to compress them.
+"""
+
+import argparse
+import glob
+import importlib.util
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parent / "meeting-transcription-app.py"
+REPORT_FORMATS = ["txt", "md", "pdf", "json", "ndjson"]
+# Kept in step with the app's SUPPORTED_AUDIO_FORMATS and report languages; the parent
+# process only lists files and hands them out, so it never imports the app (torch, Whisper)
+AUDIO_FORMATS = ["mp3", "wav", "m4a", "webm", "mp4", "flac", "ogg"]
+LANGUAGES = ["en", "es", "fr", "zh", "de", "bn"]
+MANIFEST_NAME = "manifest.json"
+
+_app = None
+
+
+def load_app_module():
+    """Import the Streamlit app file as a module (its filename is not importable)"""
+    spec = importlib.util.spec_from_file_location("meeting_transcription_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def init_worker(model_size, workers, spoken_language=None):
+    """Load all models once per worker process and give it its share of the cores
+    
+    The Whisper checkpoint is the one process_meeting routes the batch's
+    spoken language to (e.g. base.en for English), not the multilingual one.
+    """
+    global _app
+    _app = load_app_module()
+    governor = _app.get_cpu_governor()
+    governor.set_cores(governor.cores // workers)
+    _app.load_whisper_model(_app.AudioTranscriber.route(model_size, spoken_language)[0])
+    _app.load_ai_models()
+
+
+def process_file(audio_path, output_dir, formats, model_size, decoding_profile, deadline_seconds, lang,
+                 spoken_language, location, organizer, queued_at, full_json=False, compress=False, stem=None):
+    """Process one recording inside a worker and write the requested formats as <stem>.<fmt>"""
+    started = time.time()
+    instrumentation = _app.JobInstrumentation(queued_at=queued_at)
+    stem = stem or Path(audio_path).stem
+    recorded_at = datetime.fromtimestamp(os.path.getmtime(audio_path))
+    meeting_info = {
+        "title": Path(audio_path).stem,
+        "date": recorded_at.strftime("%Y-%m-%d"),
+        "time": recorded_at.strftime("%H:%M"),
+        "location": location,
+        "organizer": organizer,
+        "attendees": "Not specified"
+    }
+
+    checkpoint = None
+    try:
+        settings = {
+            "model_size": model_size,
+            "decoding_profile": decoding_profile,
+            "spoken_language": spoken_language or lang,
+            "deadline_seconds": deadline_seconds,
+        }
+        checkpoint = _app.JobCheckpoint.for_recording(audio_path, meeting_info, **settings)
+        checkpoint.submit(**settings)
+        report_data = _app.process_meeting(audio_path, meeting_info, model_size=model_size, lang=lang,
+                                           instrumentation=instrumentation, spoken_language=spoken_language,
+                                           decoding_profile=decoding_profile, deadline_seconds=deadline_seconds,
+                                           checkpoint=checkpoint, priority="batch")
+
+        outputs = []
+        for fmt in formats:
+            out_path = Path(output_dir) / f"{stem}.{fmt}"
+            if fmt in ("txt", "md"):
+                out_path.write_text(report_data["text"], encoding="utf-8")
+            elif fmt in ("json", "ndjson"):
+                if compress:
+                    out_path = out_path.with_name(f"{out_path.name}.gz")
+                _app.write_export(out_path, report_data, fmt, full=full_json, compress=compress)
+            elif fmt == "pdf":
+                if not _app.resolve_pdf(report_data)["pdf_available"]:
+                    continue
+                out_path.write_bytes(report_data["pdf"])
+            outputs.append(str(out_path))
+
+        return {
+            "status": "done",
+            "outputs": outputs,
+            "audio_seconds": report_data["stats"]["audio_seconds"],
+            "language": report_data["stats"]["language"],
+            "plan": {key: report_data["plan"][key] for key in
+                     ("model_size", "decoding_profile", "summary_mode", "predicted_total", "meets_deadline")},
+            "processing_seconds": time.time() - started,
+            "queue_wait_seconds": report_data["stats"]["queue_wait_seconds"],
+            "stage_seconds": report_data["timings"],
+            "resumed_stages": report_data["resumed_stages"],
+            "completed_at": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "status": "failed",
+            "error": str(e),
+            "processing_seconds": time.time() - started,
+            "completed_at": datetime.now().isoformat()
+        }
+    finally:
+        if checkpoint:
+            checkpoint.release()
+
+
+def find_audio_files(source, recursive=False):
+    """Expand a directory or glob pattern into a sorted list of audio files"""
+    extensions = {f".{ext}" for ext in AUDIO_FORMATS}
+    if os.path.isdir(source):
+        pattern = "**/*" if recursive else "*"
+        candidates = Path(source).glob(pattern)
+    else:
+        candidates = (Path(p) for p in glob.glob(source, recursive=True))
+    return sorted(str(p.resolve()) for p in candidates if p.is_file() and p.suffix.lower() in extensions)
+
+
+def output_stems(audio_files):
+    """Report file stem per recording, unique within the batch
+    
+    A recording is named after its file stem unless another recording shares
+    it (same name in another directory, or meeting.mp3 next to meeting.wav).
+    Those are named after their path below the common directory, extension
+    included: team-a/meeting.wav -> team-a__meeting.wav.
+    """
+    counts = {}
+    for f in audio_files:
+        counts[Path(f).stem] = counts.get(Path(f).stem, 0) + 1
+    root = Path(os.path.commonpath(audio_files)) if audio_files else None
+    if root in (Path(f) for f in audio_files):  # A single file
+        root = root.parent
+    return {
+        f: Path(f).stem if counts[Path(f).stem] == 1 else "__".join(Path(f).relative_to(root).parts)
+        for f in audio_files
+    }
+
+
+def worker_died_result(error):
+    """Manifest entry for a file whose worker process was killed (e.g. out of memory)"""
+    return {
+        "status": "failed",
+        "error": f"Worker process died while processing this file ({error})",
+        "processing_seconds": None,
+        "completed_at": datetime.now().isoformat()
+    }
+
+
+def load_manifest(output_dir):
+    """Load the resumable manifest, or start a fresh one"""
+    path = Path(output_dir) / MANIFEST_NAME
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return {"files": {}}
+
+
+def save_manifest(output_dir, manifest):
+    """Write the manifest atomically so a crash never leaves it half-written"""
+    path = Path(output_dir) / MANIFEST_NAME
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-process meeting recordings into reports")
+    parser.add_argument("source", help="Directory of recordings or a glob pattern (quote it)")
+    parser.add_argument("--output", default="reports", help="Directory for reports and manifest (default: reports)")
+    parser.add_argument("--formats", nargs="+", default=["txt", "json"], choices=REPORT_FORMATS,
+                        help="Report formats to write (default: txt json)")
+    parser.add_argument("--model", default="base", choices=["tiny", "base", "small", "medium", "large"],
+                        help="Whisper model size (default: base)")
+    parser.add_argument("--profile", default="balanced", choices=["fast", "balanced", "accurate"],
+                        help="Whisper decoding profile (default: balanced)")
+    parser.add_argument("--deadline-minutes", type=float, default=None,
+                        help="Per-file target completion time; lowers --model/--profile/analysis depth to fit")
+    parser.add_argument("--lang", default="en", choices=LANGUAGES, help="Report language (default: en)")
+    parser.add_argument("--spoken-language", default=None, choices=["auto"] + LANGUAGES,
+                        help="Language spoken in the recordings, or 'auto' to detect per file (default: --lang)")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="Number of worker processes (default: half the CPU cores)")
+    parser.add_argument("--recursive", action="store_true", help="Search directories recursively")
+    parser.add_argument("--location", default="Not specified", help="Location recorded in every report")
+    parser.add_argument("--organizer", default="Not specified", help="Organizer recorded in every report")
+    parser.add_argument("--retry-failed", action="store_true", help="Reprocess files that failed in a previous run")
+    parser.add_argument("--full-json", action="store_true",
+                        help="Keep Whisper's complete segments (token ids included) in json/ndjson")
+    parser.add_argument("--gzip", action="store_true", help="Write json/ndjson reports gzipped (.gz)")
+
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    manifest = load_manifest(args.output)
+
+    audio_files = find_audio_files(args.source, recursive=args.recursive)
+    retry_statuses = {"failed"} if args.retry_failed else set()
+    pending = [
+        f for f in audio_files
+        if f not in manifest["files"] or manifest["files"][f]["status"] in retry_statuses
+    ]
+
+    print("\n" + "="*60)
+    print("   BATCH MEETING TRANSCRIPTION")
+    print("="*60)
+    print(f"\nFound {len(audio_files)} recordings, {len(audio_files) - len(pending)} already in manifest")
+    print(f"Processing {len(pending)} with {args.workers} workers ({args.model} model, {args.profile} profile)\n")
+
+    if not pending:
+        print("Nothing to do.")
+        sys.exit(0)
+
+    started = time.time()
+    done_count = 0
+    failed_files = []
+    audio_seconds = 0.0
+    stems = output_stems(audio_files)
+    queue = deque(pending)
+    finished_count = 0
+
+    # Spawn keeps torch/OpenMP state out of the children
+    context = multiprocessing.get_context("spawn")
+    while queue:
+        # At most one file per worker is handed out, so a worker killed mid-file (e.g. by the
+        # OOM killer) only fails the files in flight; the rest go to a fresh pool
+        broken = False
+        with ProcessPoolExecutor(max_workers=args.workers, mp_context=context,
+                                 initializer=init_worker,
+                                 initargs=(args.model, args.workers, args.spoken_language or args.lang)) as executor:
+            running = {}
+            while running or (queue and not broken):
+                while queue and not broken and len(running) < args.workers:
+                    f = queue.popleft()
+                    future = executor.submit(process_file, f, args.output, args.formats, args.model, args.profile,
+                                             args.deadline_minutes * 60 if args.deadline_minutes else None,
+                                             args.lang, args.spoken_language, args.location, args.organizer,
+                                             time.time(), args.full_json, args.gzip, stems[f])
+                    running[future] = f
+
+                completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    audio_path = running.pop(future)
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool as e:
+                        broken = True
+                        result = worker_died_result(e)
+                    manifest["files"][audio_path] = result
+                    save_manifest(args.output, manifest)
+                    finished_count += 1
+
+                    if result["status"] == "done":
+                        done_count += 1
+                        audio_seconds += result["audio_seconds"]
+                        print(f"✅ [{finished_count}/{len(pending)}] {Path(audio_path).name} "
+                              f"({result['processing_seconds']:.1f}s)")
+                    else:
+                        failed_files.append(audio_path)
+                        print(f"❌ [{finished_count}/{len(pending)}] {Path(audio_path).name}: {result['error']}")
+
+        if broken and queue:
+            print(f"⚠️  A worker process died; restarting the pool for the remaining {len(queue)} files")
+
+    elapsed_hours = (time.time() - started) / 3600
+
+    # Summary
+    print("\n" + "="*60)
+    print("   BATCH SUMMARY")
+    print("="*60)
+    print(f"\n✅ Processed: {done_count}/{len(pending)} files")
+    print(f"   Wall time:   {elapsed_hours * 3600:.1f}s")
+    print(f"   Throughput:  {done_count / elapsed_hours:.1f} files/hour")
+    print(f"   Audio rate:  {(audio_seconds / 3600) / elapsed_hours:.2f} audio-hours/hour")
+
+    if failed_files:
+        print(f"❌ Failed: {len(failed_files)} (rerun with --retry-failed)")
+        sys.exit(1)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
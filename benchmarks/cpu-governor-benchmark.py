@@ -0,0 +1,145 @@
+"""
+CPU Governor Contention Benchmark
+=================================
+Runs concurrent inference jobs inside one process, the way several
+Streamlit sessions or API jobs share a server, with and without the app's
+CpuGovernor:
+
+- off: torch's default, every job's ops use every core, so N jobs run
+  N x cores threads
+- on: the governor gives each running job cores // jobs threads and pauses
+  batch jobs while interactive ones run
+
+Each job runs a fixed number of forward passes through one shared
+transformer encoder (a stand-in for BART/Whisper compute that needs no
+downloads) and passes the governor's checkpoint between passes, as the
+pipeline does between model calls. Batch jobs start first; interactive jobs
+arrive --interactive-delay seconds later. Reported per mode:
+
+- wall time and throughput (jobs per second)
+- interactive and batch job latency p50/max
+
+Usage:
+    python benchmarks/cpu-governor-benchmark.py --batch-jobs 4 --interactive-jobs 2 --steps 20
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime
+
+import torch
+
+import stubs
+
+
+def build_model(d_model, layers):
+    layer = torch.nn.TransformerEncoderLayer(d_model=d_model, nhead=8, dim_feedforward=4 * d_model,
+                                             batch_first=True)
+    return torch.nn.TransformerEncoder(layer, num_layers=layers).eval()
+
+
+def run_job(model, inputs, steps, governor, job_id, priority, delay, start_barrier, results):
+    start_barrier.wait()
+    time.sleep(delay)
+    submitted = time.perf_counter()
+    governor.register(job_id, priority)
+    try:
+        with torch.no_grad():
+            for _ in range(steps):
+                governor.checkpoint(job_id)
+                model(inputs)
+    finally:
+        governor.release(job_id)
+    results.append({"priority": priority, "latency": time.perf_counter() - submitted,
+                    "finished": time.perf_counter()})
+
+
+def summarize(latencies):
+    if not latencies:
+        return {"p50": None, "max": None}
+    return {"p50": statistics.median(latencies), "max": max(latencies)}
+
+
+def run_mode(app, enabled, model, inputs, args):
+    """All jobs of one scenario in threads, with the governor on or off"""
+    governor = app.CpuGovernor(enabled=enabled)
+    torch.set_num_threads(governor.cores)
+    jobs = ([("batch", 0.0)] * args.batch_jobs
+            + [("interactive", args.interactive_delay)] * args.interactive_jobs)
+    barrier = threading.Barrier(len(jobs) + 1)
+    results = []
+    threads = [
+        threading.Thread(target=run_job, args=(model, inputs, args.steps, governor, f"{priority}-{i}", priority,
+                                               delay, barrier, results))
+        for i, (priority, delay) in enumerate(jobs)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    return {
+        "governor": "on" if enabled else "off",
+        "cores": governor.cores,
+        "wall_seconds": wall,
+        "throughput_jobs_per_second": len(results) / wall,
+        "interactive_latency_seconds": summarize([r["latency"] for r in results if r["priority"] == "interactive"]),
+        "batch_latency_seconds": summarize([r["latency"] for r in results if r["priority"] == "batch"]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare concurrent inference with and without the CPU governor")
+    parser.add_argument("--batch-jobs", type=int, default=4, help="Batch jobs started at once (default: 4)")
+    parser.add_argument("--interactive-jobs", type=int, default=2, help="Interactive jobs (default: 2)")
+    parser.add_argument("--interactive-delay", type=float, default=0.5,
+                        help="Seconds after the batch jobs that interactive jobs arrive (default: 0.5)")
+    parser.add_argument("--steps", type=int, default=20, help="Forward passes per job (default: 20)")
+    parser.add_argument("--d-model", type=int, default=512, help="Encoder width (default: 512)")
+    parser.add_argument("--layers", type=int, default=4, help="Encoder layers (default: 4)")
+    parser.add_argument("--tokens", type=int, default=256, help="Sequence length per pass (default: 256)")
+    parser.add_argument("--output", default="cpu-governor-results.json", help="Where to write JSON results")
+    args = parser.parse_args()
+
+    app = stubs.load_app_module()
+    torch.manual_seed(0)
+    model = build_model(args.d_model, args.layers)
+    inputs = torch.randn(1, args.tokens, args.d_model)
+    with torch.no_grad():
+        model(inputs)
+
+    modes = []
+    print(f"\n{'governor':>8} {'cores':>6} {'wall':>8} {'jobs/s':>8} {'interactive p50':>16} {'batch p50':>10}")
+    for enabled in (False, True):
+        mode = run_mode(app, enabled, model, inputs, args)
+        modes.append(mode)
+        interactive, batch = mode["interactive_latency_seconds"], mode["batch_latency_seconds"]
+        print(f"{mode['governor']:>8} {mode['cores']:>6} {mode['wall_seconds']:>7.2f}s "
+              f"{mode['throughput_jobs_per_second']:>8.2f} "
+              f"{interactive['p50'] or 0:>15.2f}s {batch['p50'] or 0:>9.2f}s")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "benchmark": "cpu-governor",
+            "generated_at": datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "torch": torch.__version__,
+            "batch_jobs": args.batch_jobs,
+            "interactive_jobs": args.interactive_jobs,
+            "steps": args.steps,
+            "modes": modes,
+        }, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Decoding Profile Benchmark
+==========================
+Transcribes real recordings with each named decoding profile
+(DECODING_PROFILES in the app) and reports, per profile:
+
+- real-time factor (transcription seconds per second of audio)
+- fallback windows: 30 s windows Whisper had to re-decode at a higher
+  temperature, and the total number of extra decoding passes
+- segment and word counts, to spot profiles that drop or repeat text
+
+Unlike the other benchmarks this one uses the real Whisper model, since
+fallbacks depend on what the model actually hears. Audio decoding, model
+loading and language detection happen before timing starts.
+
+Usage:
+    python benchmarks/decoding-profile-benchmark.py meeting.m4a noisy-call.wav --model base
+    python benchmarks/decoding-profile-benchmark.py recordings/*.wav --profiles fast accurate --language en
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import stubs
+
+
+def prepare(app, audio_path, model_size, language):
+    """Decode, resolve the language and load the model outside the timed region"""
+    digest = app.AudioTranscriber.content_hash(audio_path)
+    audio = app.AudioTranscriber.load_audio(audio_path, digest)
+    if language == "auto":
+        language = app.AudioTranscriber.cached_language(digest) or app.AudioTranscriber.detect_language(
+            app.load_whisper_model(model_size), audio
+        )
+    app.load_whisper_model(app.AudioTranscriber.route(model_size, language, digest)[0])
+    return audio, language
+
+
+def run_profile(app, audio, model_size, language, profile, repeat):
+    """Transcribe `repeat` times with one profile; returns the median run's numbers"""
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = app.AudioTranscriber.transcribe(audio, model_size=model_size, language=language,
+                                                 decoding_profile=profile)
+        runs.append((time.perf_counter() - started, result))
+
+    seconds = statistics.median(elapsed for elapsed, _ in runs)
+    result = runs[0][1]
+    windows = len({segment["seek"] for segment in result["segments"]})
+    return {
+        "transcribe_seconds": seconds,
+        "windows": windows,
+        "fallback_windows": result["fallback_windows"],
+        "fallback_decodes": result["fallback_decodes"],
+        "segments": len(result["segments"]),
+        "words": len(result["text"].split()),
+        "whisper_model": result["model"],
+    }
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=stubs.APP_PATH.parent,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Whisper decoding profiles on real recordings")
+    parser.add_argument("audio", nargs="+", help="Recordings to transcribe")
+    parser.add_argument("--model", default="base", choices=["tiny", "base", "small", "medium"],
+                        help="Whisper model size (default: base)")
+    parser.add_argument("--profiles", nargs="+", default=["fast", "balanced", "accurate"],
+                        choices=["fast", "balanced", "accurate"], help="Profiles to compare (default: all)")
+    parser.add_argument("--language", default="auto",
+                        help="Spoken language hint, or 'auto' to detect once per file (default: auto)")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per profile and file (default: 1)")
+    parser.add_argument("--output", default="decoding-profile-results.json",
+                        help="Where to write machine-readable results")
+    args = parser.parse_args()
+
+    app = stubs.load_app_module()
+
+    files = []
+    for audio_path in args.audio:
+        audio, language = prepare(app, audio_path, args.model, args.language)
+        audio_seconds = len(audio) / app.whisper.audio.SAMPLE_RATE
+        print(f"\n🎧 {Path(audio_path).name} ({audio_seconds:.0f}s, {language})")
+        print(f"   {'profile':<10} {'RTF':>7} {'fallback windows':>17} {'extra passes':>13} {'segments':>9}")
+
+        profiles = {}
+        for profile in args.profiles:
+            run = run_profile(app, audio, args.model, language, profile, args.repeat)
+            run["realtime_factor"] = run["transcribe_seconds"] / audio_seconds if audio_seconds else None
+            profiles[profile] = run
+            print(f"   {profile:<10} {run['realtime_factor']:>7.3f} "
+                  f"{run['fallback_windows']:>8}/{run['windows']:<8} {run['fallback_decodes']:>13} "
+                  f"{run['segments']:>9}")
+
+        files.append({"audio": str(audio_path), "audio_seconds": audio_seconds, "language": language,
+                      "profiles": profiles})
+
+    totals = {}
+    total_audio = sum(f["audio_seconds"] for f in files)
+    print(f"\n📊 All files ({total_audio:.0f}s of audio)")
+    for profile in args.profiles:
+        seconds = sum(f["profiles"][profile]["transcribe_seconds"] for f in files)
+        totals[profile] = {
+            "realtime_factor": seconds / total_audio if total_audio else None,
+            "fallback_windows": sum(f["profiles"][profile]["fallback_windows"] for f in files),
+            "fallback_decodes": sum(f["profiles"][profile]["fallback_decodes"] for f in files),
+        }
+        print(f"   {profile:<10} RTF {totals[profile]['realtime_factor']:.3f}   "
+              f"{totals[profile]['fallback_decodes']} extra passes")
+
+    report = {
+        "benchmark": "decoding-profiles",
+        "commit": current_commit(),
+        "generated_at": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "model": args.model,
+        "repeat": args.repeat,
+        "profile_options": {name: app.DECODING_PROFILES[name] for name in args.profiles},
+        "files": files,
+        "totals": totals,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Live Meeting Replay Benchmark
+=============================
+Replays a recording at real-time speed (or --speed times faster) the way a
+meeting recorder would - appending to a growing WAV file, or streaming into
+a local socket - while the app's LiveTranscriber follows it. Reports:
+
+- transcript lag: how far the committed transcript trails the live audio
+  after each decoded window (p50/max), and decode time per window
+- finalize latency: seconds from the end of the meeting to the finished
+  report (all formats rendered)
+- word accuracy of the live transcript against a reference (duplicated
+  and missing words), which shows whether overlapping windows are
+  deduplicated correctly
+
+With --stub the recording is synthesized from stubs.synthetic_transcript()
+as tones that stubs.ToneWhisperModel "recognizes", the analysis models are
+the stand-ins, and the synthetic text is the reference, so the run needs no
+downloads. Otherwise --audio is transcribed by the real models, and the
+reference (if --reference is not given) is a batch transcription of the
+same file.
+
+Usage:
+    python benchmarks/live-replay.py --stub --words 800 --speed 4
+    python benchmarks/live-replay.py --audio meeting.wav --model base --transport socket
+"""
+
+import argparse
+import difflib
+import json
+import platform
+import re
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+import stubs
+
+SAMPLE_RATE = 16000
+
+
+def wav_header(sample_rate=SAMPLE_RATE):
+    """Header of a 16-bit mono WAV whose length is not known yet (as streaming recorders write it)"""
+    unknown = (0xFFFFFFFF).to_bytes(4, "little")
+    fmt = ((1).to_bytes(2, "little") + (1).to_bytes(2, "little") + sample_rate.to_bytes(4, "little")
+           + (sample_rate * 2).to_bytes(4, "little") + (2).to_bytes(2, "little") + (16).to_bytes(2, "little"))
+    return b"RIFF" + unknown + b"WAVE" + b"fmt " + len(fmt).to_bytes(4, "little") + fmt + b"data" + unknown
+
+
+def replay(audio, write, chunk_seconds, speed):
+    """Hand audio to write() chunk by chunk, paced like a live recording; returns when the last chunk went out"""
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+    chunk_bytes = int(chunk_seconds * SAMPLE_RATE) * 2
+    started = time.perf_counter()
+    for i, offset in enumerate(range(0, len(pcm), chunk_bytes)):
+        delay = started + i * chunk_seconds / speed - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        write(pcm[offset:offset + chunk_bytes])
+    return time.perf_counter()
+
+
+def start_recorder(app, audio, transport, chunk_seconds, speed, work_dir, result):
+    """Start the replay on a thread; returns the live source the transcriber should read"""
+    if transport == "socket":
+        source = app.SocketSource(0)
+
+        def record():
+            with socket.create_connection(("127.0.0.1", source.port)) as connection:
+                result["ended_at"] = replay(audio, connection.sendall, chunk_seconds, speed)
+    else:
+        path = Path(work_dir) / "meeting.wav"
+        source = app.GrowingFileSource(path, poll_seconds=0.05)
+
+        def record():
+            with open(path, "wb") as f:
+                f.write(wav_header())
+
+                def write(data):
+                    f.write(data)
+                    f.flush()
+
+                result["ended_at"] = replay(audio, write, chunk_seconds, speed)
+            Path(f"{path}.done").touch()
+
+    threading.Thread(target=record, daemon=True).start()
+    return source
+
+
+def word_differences(reference, text):
+    """Words the live transcript added (e.g. duplicated at window edges) or lost, against the reference"""
+    def normalize(words):
+        return [re.sub(r"[^\w']", "", word.lower()) for word in words.split()]
+
+    expected, actual = normalize(reference), normalize(text)
+    matcher = difflib.SequenceMatcher(a=expected, b=actual, autojunk=False)
+    extra = missing = 0
+    for op, a_start, a_end, b_start, b_end in matcher.get_opcodes():
+        if op in ("insert", "replace"):
+            extra += b_end - b_start
+        if op in ("delete", "replace"):
+            missing += a_end - a_start
+    return {"reference_words": len(expected), "live_words": len(actual), "extra_words": extra,
+            "missing_words": missing}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recording in real time through LiveTranscriber")
+    parser.add_argument("--audio", default=None, help="Recording to replay (any format ffmpeg reads)")
+    parser.add_argument("--reference", default=None, help="Text file with the expected transcript")
+    parser.add_argument("--stub", action="store_true", help="Synthetic tone recording and stand-in models")
+    parser.add_argument("--words", type=int, default=600, help="Synthetic transcript size with --stub (default: 600)")
+    parser.add_argument("--call-cost", type=float, default=0.0,
+                        help="Seconds each stand-in model call takes with --stub (default: 0)")
+    parser.add_argument("--model", default="base", help="Whisper model size (default: base)")
+    parser.add_argument("--transport", default="file", choices=["file", "socket"],
+                        help="Growing WAV file or local TCP socket (default: file)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed, 1 = real time (default: 1)")
+    parser.add_argument("--chunk-seconds", type=float, default=0.25,
+                        help="Audio per write, as a recorder flushes it (default: 0.25)")
+    parser.add_argument("--step", type=float, default=None, help="Seconds of new audio per decode")
+    parser.add_argument("--overlap", type=float, default=None, help="Seconds at the live edge kept tentative")
+    parser.add_argument("--output", default="live-replay-results.json", help="Where to write JSON results")
+    args = parser.parse_args()
+    if not args.stub and not args.audio:
+        parser.error("give --audio, or --stub for a synthetic recording")
+
+    app = stubs.load_app_module()
+    if args.stub:
+        transcription = stubs.synthetic_transcript(args.words)
+        stubs.install_stub_models(app, transcription)
+        tone_model = stubs.ToneWhisperModel()
+        app.load_whisper_model = lambda model_size="base": tone_model
+        stubs.set_call_cost(args.call_cost)
+        audio = stubs.tone_speech(transcription["text"])
+        reference = transcription["text"]
+    else:
+        import whisper
+        audio = whisper.load_audio(args.audio)
+        reference = Path(args.reference).read_text(encoding="utf-8") if args.reference else None
+
+    settings = {}
+    if args.step is not None:
+        settings["step_seconds"] = args.step
+    if args.overlap is not None:
+        settings["overlap_seconds"] = args.overlap
+    live = app.LiveTranscriber({"title": "Live replay"}, model_size=args.model, lang="en", **settings)
+
+    windows = []
+
+    def on_update(snapshot):
+        windows.append({
+            "at": time.perf_counter(),
+            "audio_seconds": snapshot["audio_seconds"],
+            "lag_seconds": snapshot["audio_seconds"] - snapshot["committed_seconds"],
+        })
+
+    recorder = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        source = start_recorder(app, audio, args.transport, args.chunk_seconds, args.speed, work_dir, recorder)
+        report_data = app.resolve_pdf(live.run(source, on_update=on_update))
+        ready_at = time.perf_counter()
+
+    if reference is None:
+        print("Transcribing the whole recording for reference...")
+        reference = app.AudioTranscriber.transcribe(audio, model_size=args.model, language="en")["text"]
+
+    lags = [window["lag_seconds"] for window in windows]
+    decode_seconds = report_data["timings"].get("transcribe", 0.0)
+    results = {
+        "audio_seconds": len(audio) / SAMPLE_RATE,
+        "windows": len(windows) + 1,
+        "lag_seconds": {"p50": statistics.median(lags) if lags else None, "max": max(lags) if lags else None},
+        "decode_seconds_per_window": decode_seconds / (len(windows) + 1),
+        "finalize_seconds": ready_at - recorder["ended_at"],
+        "finish_seconds": report_data["finalize_seconds"],
+        "accuracy": word_differences(reference, report_data["transcription"]["text"]),
+        "action_items": len(report_data["action_items"]),
+        "stage_seconds": report_data["timings"],
+    }
+
+    accuracy = results["accuracy"]
+    print(f"\n🎙️  {results['audio_seconds']:.0f}s of audio at {args.speed:g}x over {args.transport}, "
+          f"{results['windows']} windows ({results['decode_seconds_per_window'] * 1000:.0f}ms decode each)")
+    if lags:
+        print(f"   transcript lag p50 {results['lag_seconds']['p50']:.1f}s, max {results['lag_seconds']['max']:.1f}s")
+    print(f"   report ready {results['finalize_seconds']:.2f}s after the meeting ended")
+    print(f"   words: {accuracy['live_words']} live / {accuracy['reference_words']} reference, "
+          f"{accuracy['extra_words']} extra, {accuracy['missing_words']} missing")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "benchmark": "live-replay",
+            "generated_at": datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "stub": args.stub,
+            "model": args.model,
+            "transport": args.transport,
+            "speed": args.speed,
+            "results": results,
+        }, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
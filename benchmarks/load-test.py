@@ -0,0 +1,222 @@
+"""
+Concurrent-Session Load Test
+============================
+Drives many simulated browser sessions through the real Streamlit main()
+using Streamlit's AppTest, all inside one process the way a Streamlit
+server runs them (one script thread per session, shared model cache).
+Models are replaced by the deterministic stand-ins from stubs.py, with an
+optional per-call latency to emulate inference.
+
+For each concurrency level, that many sessions upload a recording and click
+"Generate Report" at the same moment. Reported per level:
+
+- end-to-end latency p50/p95/p99 (click -> report rendered)
+- queueing delay p50/p95/p99 (end-to-end latency minus the time the job
+  spent inside its own pipeline stages, i.e. waiting on script startup,
+  shared locks and the CPU)
+- throughput (completed sessions per second)
+- peak process RSS
+
+Requires a Streamlit version whose AppTest supports file_uploader.
+
+Usage:
+    python benchmarks/load-test.py --concurrency 1 5 10 25 50 --call-cost-ms 20
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import psutil
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import AppTest, app_test
+from streamlit.testing.v1.util import patch_config_options
+
+import stubs
+
+GENERATE_LABEL = "🚀 Generate Report"
+
+# Held for the whole process; see make_app_test_thread_safe()
+_app_test_config = None
+
+
+def make_app_test_thread_safe():
+    """Patch the process-global state AppTest swaps around every run
+
+    A Streamlit server runs sessions on threads over shared state; AppTest
+    instead installs and tears down globals per run, which races when
+    sessions overlap. Three pieces need pinning:
+
+    - the mock Runtime: fall back to the most recently installed one
+      instead of failing when another session has just cleared it
+    - the "global.appTest" config override: enable it once for the whole
+      load test instead of patching config.get_option per run
+    - script compilation: compile one session at a time (a real server
+      compiles once into a shared ScriptCache, and concurrent ast.parse
+      calls are not thread-safe on every Python version)
+    """
+    last_runtime = []
+
+    def instance(cls):
+        if cls._instance is not None:
+            last_runtime[:] = [cls._instance]
+        return last_runtime[0]
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or bool(last_runtime))
+
+    global _app_test_config
+    _app_test_config = patch_config_options({"global.appTest": True})
+    _app_test_config.__enter__()
+    app_test.patch_config_options = lambda overrides: contextlib.nullcontext()
+
+    compile_lock = threading.Lock()
+    get_bytecode = ScriptCache.get_bytecode
+
+    def locked_get_bytecode(self, script_path):
+        with compile_lock:
+            return get_bytecode(self, script_path)
+
+    ScriptCache.get_bytecode = locked_get_bytecode
+
+
+class RssSampler:
+    """Samples process RSS in the background and keeps the peak"""
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        process = psutil.Process()
+        while not self._stop.is_set():
+            self.peak = max(self.peak, process.memory_info().rss)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def unique_recording(audio_bytes):
+    """Overwrite the last two samples with random bytes
+    
+    Jobs are checkpointed by content hash, so identical uploads would resume
+    each other's finished stages instead of doing the work.
+    """
+    return audio_bytes[:-4] + os.urandom(4)
+
+
+def run_session(audio_bytes, start_barrier, timeout):
+    """One simulated user: open the app, upload, click generate, wait for the report"""
+    at = AppTest.from_file(str(stubs.APP_PATH), default_timeout=timeout)
+    at.run()
+    at.file_uploader[0].set_value(("meeting.wav", unique_recording(audio_bytes), "audio/wav"))
+    button = next(b for b in at.button if b.label == GENERATE_LABEL)
+
+    start_barrier.wait()
+    clicked = time.perf_counter()
+    button.click().run()
+    latency = time.perf_counter() - clicked
+
+    if at.exception or not at.session_state["report_generated"]:
+        errors = [e.value for e in at.exception] or [e.value for e in at.error]
+        return {"ok": False, "latency": latency, "error": "; ".join(map(str, errors))}
+
+    in_pipeline = sum(at.session_state["report_data"]["timings"].values())
+    return {"ok": True, "latency": latency, "queueing": max(0.0, latency - in_pipeline)}
+
+
+def percentiles(samples):
+    if not samples:
+        return {"p50": None, "p95": None, "p99": None}
+    if len(samples) == 1:
+        return {"p50": samples[0], "p95": samples[0], "p99": samples[0]}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+
+
+def run_level(concurrency, audio_bytes, timeout):
+    """Start `concurrency` sessions together and collect their results"""
+    barrier = threading.Barrier(concurrency)
+    with RssSampler() as rss, ThreadPoolExecutor(max_workers=concurrency) as pool:
+        started = time.perf_counter()
+        futures = [pool.submit(run_session, audio_bytes, barrier, timeout) for _ in range(concurrency)]
+        results = [f.result() for f in futures]
+        wall = time.perf_counter() - started
+
+    ok = [r for r in results if r["ok"]]
+    return {
+        "concurrency": concurrency,
+        "completed": len(ok),
+        "failed": len(results) - len(ok),
+        "errors": sorted({r["error"] for r in results if not r["ok"]}),
+        "latency_seconds": percentiles([r["latency"] for r in ok]),
+        "queueing_seconds": percentiles([r["queueing"] for r in ok]),
+        "throughput_sessions_per_second": len(ok) / wall if wall else None,
+        "peak_rss_bytes": rss.peak,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the Streamlit app with simulated sessions")
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 5, 10, 25, 50],
+                        help="Concurrent session counts to test (default: 1 5 10 25 50)")
+    parser.add_argument("--words", type=int, default=2000, help="Synthetic transcript size (default: 2000)")
+    parser.add_argument("--call-cost-ms", type=float, default=0.0,
+                        help="Simulated latency per model call in ms (default: 0)")
+    parser.add_argument("--timeout", type=float, default=600, help="Per-session timeout in seconds")
+    parser.add_argument("--output", default="load-test-results.json", help="Where to write JSON results")
+    args = parser.parse_args()
+
+    stubs.install_library_stubs(stubs.synthetic_transcript(args.words))
+    stubs.set_call_cost(args.call_cost_ms / 1000)
+    make_app_test_thread_safe()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        audio_bytes = stubs.write_silent_wav(Path(tmp_dir) / "meeting.wav").read_bytes()
+
+    # Warm the shared model cache so level 1 is not dominated by first load
+    run_session(audio_bytes, threading.Barrier(1), args.timeout)
+
+    levels = []
+    print(f"\n{'sessions':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'queue p95':>10} {'sess/s':>8} {'peak RSS':>10}")
+    for concurrency in args.concurrency:
+        level = run_level(concurrency, audio_bytes, args.timeout)
+        levels.append(level)
+        lat, queue = level["latency_seconds"], level["queueing_seconds"]
+        if level["completed"]:
+            print(f"{concurrency:>8} {lat['p50']:>7.2f}s {lat['p95']:>7.2f}s {lat['p99']:>7.2f}s "
+                  f"{queue['p95']:>9.2f}s {level['throughput_sessions_per_second']:>8.2f} "
+                  f"{level['peak_rss_bytes'] / 1e6:>8.0f}MB")
+        if level["failed"]:
+            print(f"{'':>8} ❌ {level['failed']} failed: {'; '.join(level['errors'])}")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "benchmark": "load-test",
+            "generated_at": datetime.now().isoformat(),
+            "words": args.words,
+            "call_cost_ms": args.call_cost_ms,
+            "levels": levels,
+        }, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+ONNX Runtime Backend Benchmark
+==============================
+Runs the same transcript through MeetingAnalyzer with the eager PyTorch
+pipelines and with the ONNX Runtime backend (ANALYSIS_BACKEND=onnx), then:
+
+- checks parity: every summarizer, QA and classifier call must give the
+  same text/labels on both backends and scores within --tolerance; any
+  mismatch is listed and the script exits with status 1
+- compares latency per pipeline (median and p95 per call) and analysis
+  throughput (model calls per second over all four analysis stages)
+
+Needs the real models and optimum with ONNX Runtime. The first ONNX run
+exports the models into ONNX_CACHE_DIR; that load time is reported
+separately and later runs reuse the export.
+
+Usage:
+    python benchmarks/onnx-backend-benchmark.py --words 3000 --repeat 3
+    python benchmarks/onnx-backend-benchmark.py --transcript meeting.txt --tolerance 1e-3
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import stubs
+
+PIPELINES = {"summarizer": "summarization", "qa_model": "question-answering", "classifier": "zero-shot-classification"}
+
+
+class RecordingPipeline:
+    """Wraps a pipeline and keeps every call's output and latency"""
+
+    def __init__(self, pipe):
+        self.pipe = pipe
+        self.outputs = []
+        self.seconds = []
+
+    def __call__(self, *args, **kwargs):
+        started = time.perf_counter()
+        output = self.pipe(*args, **kwargs)
+        self.seconds.append(time.perf_counter() - started)
+        self.outputs.append(output)
+        return output
+
+
+def run_backend(app, backend, text, repeat):
+    """Load one backend and run every analysis stage `repeat` times"""
+    started = time.perf_counter()
+    analyzer = app.MeetingAnalyzer(backend=backend)
+    load_seconds = time.perf_counter() - started
+    for attr in PIPELINES:
+        setattr(analyzer, attr, RecordingPipeline(getattr(analyzer, attr)))
+
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        analyzer.summarize_text(text)
+        analyzer.extract_insights(text)
+        analyzer.extract_action_items(text)
+        analyzer.identify_key_takeaways(text)
+        runs.append(time.perf_counter() - started)
+
+    calls_per_run = sum(analyzer.calls.values()) // repeat
+    pipelines = {}
+    for attr in PIPELINES:
+        seconds = sorted(getattr(analyzer, attr).seconds)
+        pipelines[attr] = {
+            "calls": len(seconds),
+            "median_seconds": statistics.median(seconds) if seconds else None,
+            "p95_seconds": seconds[int(0.95 * (len(seconds) - 1))] if seconds else None,
+        }
+    return {
+        "load_seconds": load_seconds,
+        "analysis_seconds": statistics.median(runs),
+        "calls_per_run": calls_per_run,
+        "calls_per_second": calls_per_run / statistics.median(runs),
+        "pipelines": pipelines,
+    }, {attr: getattr(analyzer, attr).outputs[:len(getattr(analyzer, attr).outputs) // repeat] for attr in PIPELINES}
+
+
+def compare(expected, actual, tolerance, path=""):
+    """Differences between two pipeline outputs: equal text/labels, scores within tolerance"""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        if expected.keys() != actual.keys():
+            return [f"{path}: keys {sorted(expected)} != {sorted(actual)}"]
+        return [d for key in expected for d in compare(expected[key], actual[key], tolerance, f"{path}.{key}")]
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            return [f"{path}: {len(expected)} items != {len(actual)}"]
+        return [d for i, (e, a) in enumerate(zip(expected, actual)) for d in compare(e, a, tolerance, f"{path}[{i}]")]
+    if isinstance(expected, float) and isinstance(actual, float):
+        return [] if abs(expected - actual) <= tolerance else [f"{path}: {expected:.6f} vs {actual:.6f}"]
+    return [] if expected == actual else [f"{path}: {expected!r} vs {actual!r}"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the PyTorch and ONNX Runtime analysis backends")
+    parser.add_argument("--transcript", default=None, help="Text file to analyze (default: synthetic transcript)")
+    parser.add_argument("--words", type=int, default=2000, help="Synthetic transcript size (default: 2000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed analysis runs per backend (default: 3)")
+    parser.add_argument("--tolerance", type=float, default=1e-3,
+                        help="Largest allowed score difference between backends (default: 1e-3)")
+    parser.add_argument("--summarizer", default=None, help="Override the summarization model (id or local path)")
+    parser.add_argument("--qa", default=None, help="Override the question-answering model (id or local path)")
+    parser.add_argument("--classifier", default=None, help="Override the zero-shot classification model")
+    parser.add_argument("--output", default="onnx-backend-results.json", help="Where to write JSON results")
+    args = parser.parse_args()
+
+    app = stubs.load_app_module()
+    for task, override in zip(PIPELINES.values(), (args.summarizer, args.qa, args.classifier)):
+        if override:
+            app.ANALYSIS_MODELS[task] = override
+    if args.transcript:
+        text = Path(args.transcript).read_text(encoding="utf-8")
+    else:
+        text = stubs.synthetic_transcript(args.words)["text"]
+
+    backends, outputs = {}, {}
+    for backend in ("torch", "onnx"):
+        backends[backend], outputs[backend] = run_backend(app, backend, text, args.repeat)
+
+    # The analyzer swallows pipeline errors, so a failing backend shows up as missing calls
+    mismatches = {
+        attr: compare(len(outputs["torch"][attr]), len(outputs["onnx"][attr]), 0, "calls")
+        + [d for i, (e, a) in enumerate(zip(outputs["torch"][attr], outputs["onnx"][attr]))
+           for d in compare(e, a, args.tolerance, f"call {i}")]
+        for attr in PIPELINES
+    }
+
+    print(f"\n{'pipeline':<12} {'calls':>6} {'torch p50':>10} {'onnx p50':>10} {'speedup':>8} {'parity':>8}")
+    for attr in PIPELINES:
+        torch_run, onnx_run = backends["torch"]["pipelines"][attr], backends["onnx"]["pipelines"][attr]
+        speedup = None
+        if torch_run["median_seconds"] and onnx_run["median_seconds"]:
+            speedup = torch_run["median_seconds"] / onnx_run["median_seconds"]
+        parity = "ok" if not mismatches[attr] else f"{len(mismatches[attr])} diff"
+        print(f"{attr:<12} {torch_run['calls']:>6} {(torch_run['median_seconds'] or 0) * 1000:>8.1f}ms "
+              f"{(onnx_run['median_seconds'] or 0) * 1000:>8.1f}ms {speedup or 0:>7.2f}x {parity:>8}")
+    for backend, run in backends.items():
+        print(f"   {backend:<6} load {run['load_seconds']:.1f}s, analysis {run['analysis_seconds']:.2f}s, "
+              f"{run['calls_per_second']:.1f} calls/s")
+    for attr, diffs in mismatches.items():
+        for diff in diffs[:5]:
+            print(f"   ❌ {attr} {diff}")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "benchmark": "onnx-backend",
+            "generated_at": datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "models": app.ANALYSIS_MODELS,
+            "words": len(text.split()),
+            "repeat": args.repeat,
+            "tolerance": args.tolerance,
+            "backends": backends,
+            "mismatches": mismatches,
+        }, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+
+    if any(mismatches.values()):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+PDF Render Benchmark
+====================
+Renders the PDF report of a long synthetic meeting (10,000 transcript
+segments by default) the way the PDF worker does, and reports:
+
+- render time and size of the full report (median over --repeat runs), with
+  the glyph widths already read, as for every job after the first
+- the first render in the process, which also reads the glyph widths
+- font setup per document: registering the report fonts with FPDF.add_font()
+- with --compare, the same report with the transcript laid out by one
+  multi_cell() per segment instead of ReportGenerator._write_lines()
+
+Usage:
+    python benchmarks/pdf-render-benchmark.py
+    python benchmarks/pdf-render-benchmark.py --segments 2000 10000 --repeat 3 --compare
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import stubs
+
+
+def report_args(transcription):
+    """Meeting info and analysis results sized like a real report's"""
+    meeting_info = {
+        "title": "PDF Benchmark",
+        "date": "2024-01-01",
+        "time": "09:00",
+        "location": "Benchmark",
+        "organizer": "Benchmark",
+        "attendees": "Alice, Bob"
+    }
+    sentences = [s.strip() + "." for s in transcription["text"].split(".")[:40] if s.strip()]
+    insights = {key: sentences[i] for i, key in enumerate(["objective", "decisions", "concerns", "next_steps"])}
+    action_items = [{"task": sentence, "priority": "MEDIUM"} for sentence in sentences[4:14]]
+    return (meeting_info, " ".join(sentences[14:24]), insights, action_items, sentences[24:29], transcription)
+
+
+def render(app, args):
+    started = time.perf_counter()
+    pdf = app.ReportGenerator("en").generate_pdf_report(*args)
+    return time.perf_counter() - started, pdf
+
+
+def multi_cell_lines(pdf, lines, line_height, widths=()):
+    """The layout _write_lines() replaces: fpdf2 wraps every segment itself"""
+    for line in lines:
+        pdf.multi_cell(0, line_height, line, new_x="LMARGIN", new_y="NEXT")
+
+
+def font_setup_seconds(app, repeat=20):
+    """Per-document cost of registering the report fonts (PdfFonts.apply)"""
+    fonts = app.get_pdf_fonts()
+    if not fonts.available:
+        return None
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fonts.apply(app.FPDF())
+    return {"fonts": [fonts.regular] + fonts.fallbacks, "add_font": (time.perf_counter() - started) / repeat}
+
+
+def benchmark_size(app, num_segments, repeat, compare):
+    transcription = stubs.synthetic_transcript(num_segments * stubs.SEGMENT_WORDS)
+    transcription["language"] = "en"
+    args = report_args(transcription)
+
+    seconds, pdf = [], None
+    for _ in range(repeat):
+        elapsed, pdf = render(app, args)
+        seconds.append(elapsed)
+    result = {
+        "segments": len(transcription["segments"]),
+        "render_seconds_median": statistics.median(seconds),
+        "render_seconds_min": min(seconds),
+        "pdf_bytes": len(pdf),
+    }
+
+    if compare:
+        write_lines = vars(app.ReportGenerator)["_write_lines"]
+        app.ReportGenerator._write_lines = staticmethod(multi_cell_lines)
+        try:
+            result["multi_cell_seconds"] = render(app, args)[0]
+        finally:
+            app.ReportGenerator._write_lines = write_lines
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF report rendering for long meetings")
+    parser.add_argument("--segments", nargs="+", type=int, default=[10_000],
+                        help="Transcript sizes in segments (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed renders per size (default: 3)")
+    parser.add_argument("--compare", action="store_true",
+                        help="Also render the transcript with one multi_cell() per segment")
+    parser.add_argument("--output", default="pdf-render-results.json", help="Where to write JSON results")
+    args = parser.parse_args()
+
+    app = stubs.load_app_module()
+    fonts = app.get_pdf_fonts()
+    print(f"Fonts: {fonts.regular or 'none (Latin-1 core font)'}"
+          + (f" + {', '.join(fonts.fallbacks)}" if fonts.fallbacks else ""))
+
+    cold_seconds, _ = render(app, report_args(stubs.synthetic_transcript(100 * stubs.SEGMENT_WORDS)))
+    font_setup = font_setup_seconds(app)
+    results = [benchmark_size(app, n, args.repeat, args.compare) for n in args.segments]
+
+    print(f"\nFirst render in the process (100 segments, glyph widths read): {cold_seconds:.2f}s")
+    if font_setup:
+        print(f"Font setup per document: {font_setup['add_font'] * 1000:.1f}ms")
+    print(f"\n{'segments':>9} {'render':>9} {'min':>9} {'size':>10}" + (f" {'multi_cell':>11}" if args.compare else ""))
+    for result in results:
+        line = (f"{result['segments']:>9} {result['render_seconds_median']:>8.2f}s {result['render_seconds_min']:>8.2f}s"
+                f" {result['pdf_bytes'] / 1e6:>8.2f}MB")
+        if args.compare:
+            line += f" {result['multi_cell_seconds']:>10.2f}s"
+        print(line)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "benchmark": "pdf-render",
+            "generated_at": datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "fonts": font_setup,
+            "first_render_seconds": cold_seconds,
+            "results": results,
+        }, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Per-Stage Pipeline Benchmark
+============================
+Runs AudioTranscriber.transcribe -> MeetingAnalyzer -> ReportGenerator with
+deterministic stand-in models (see stubs.py) on synthetic transcripts and
+reports, for every stage: wall time, number of model calls and peak Python
+memory. Results are written as JSON so runs can be compared across commits.
+
+Usage:
+    python benchmarks/pipeline-benchmark.py
+    python benchmarks/pipeline-benchmark.py --words 1000 10000 --repeat 5 --output before.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import stubs
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+def build_stages(app, audio_path):
+    """Return the pipeline as (name, function) pairs sharing one state dict"""
+    state = {}
+    meeting_info = {
+        "title": "Benchmark Meeting",
+        "date": "2024-01-01",
+        "time": "09:00",
+        "location": "Benchmark",
+        "organizer": "Benchmark",
+        "attendees": "Alice, Bob"
+    }
+
+    def transcribe():
+        state["transcription"] = app.AudioTranscriber.transcribe(audio_path)
+        state["text"] = state["transcription"]["text"]
+        state["analyzer"] = app.MeetingAnalyzer()
+
+    def summarize():
+        state["summary"] = state["analyzer"].summarize_text(state["text"])
+
+    def insights():
+        state["insights"] = state["analyzer"].extract_insights(state["text"])
+
+    def actions():
+        state["action_items"] = state["analyzer"].extract_action_items(state["text"])
+
+    def takeaways():
+        state["takeaways"] = state["analyzer"].identify_key_takeaways(state["text"])
+
+    def render():
+        generator = app.ReportGenerator("en")
+        args = (meeting_info, state["summary"], state["insights"], state["action_items"], state["takeaways"])
+        generator.generate_text_report(*args, state["transcription"])
+        generator.generate_json_report(*args, state["transcription"])
+        # Same policy as process_meeting: a PDF failure does not fail the run
+        app.render_pdf(*args, state["transcription"])
+
+    return [
+        ("transcribe", transcribe),
+        ("summarize", summarize),
+        ("insights", insights),
+        ("actions", actions),
+        ("takeaways", takeaways),
+        ("render", render),
+    ]
+
+
+def run_once(app, audio_path, trace_memory):
+    """Run every stage once; returns {stage: {seconds, model_calls, peak_bytes}}"""
+    results = {}
+    for name, stage in build_stages(app, audio_path):
+        stubs.calls.clear()
+        if trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        stage()
+        elapsed = time.perf_counter() - started
+        peak = None
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        results[name] = {"seconds": elapsed, "model_calls": dict(stubs.calls), "peak_bytes": peak}
+    return results
+
+
+def benchmark_size(app, audio_path, num_words, repeat):
+    """Median wall time over `repeat` runs plus one traced run for peak memory"""
+    stubs.install_stub_models(app, stubs.synthetic_transcript(num_words))
+
+    timed_runs = [run_once(app, audio_path, trace_memory=False) for _ in range(repeat)]
+    traced_run = run_once(app, audio_path, trace_memory=True)
+
+    stages = {}
+    for name in traced_run:
+        samples = [run[name]["seconds"] for run in timed_runs]
+        stages[name] = {
+            "wall_seconds_median": statistics.median(samples),
+            "wall_seconds_min": min(samples),
+            "model_calls": traced_run[name]["model_calls"],
+            "model_calls_total": sum(traced_run[name]["model_calls"].values()),
+            "peak_memory_bytes": traced_run[name]["peak_bytes"],
+        }
+    return {
+        "words": num_words,
+        "total_wall_seconds": sum(stage["wall_seconds_median"] for stage in stages.values()),
+        "stages": stages,
+    }
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=stubs.APP_PATH.parent,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark each pipeline stage with stand-in models")
+    parser.add_argument("--words", nargs="+", type=int, default=DEFAULT_SIZES,
+                        help="Synthetic transcript sizes in words (default: 1000 10000 100000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per size (default: 3)")
+    parser.add_argument("--output", default="benchmark-results.json",
+                        help="Where to write machine-readable results (default: benchmark-results.json)")
+    args = parser.parse_args()
+
+    app = stubs.load_app_module()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        audio_path = str(stubs.write_silent_wav(Path(tmp_dir) / "benchmark.wav"))
+        results = []
+        for num_words in args.words:
+            print(f"\n📊 {num_words:,} words")
+            result = benchmark_size(app, audio_path, num_words, args.repeat)
+            results.append(result)
+            for name, stage in result["stages"].items():
+                peak_mb = stage["peak_memory_bytes"] / 1e6
+                print(f"   {name:<11} {stage['wall_seconds_median'] * 1000:10.1f} ms"
+                      f"   {stage['model_calls_total']:6d} calls   {peak_mb:8.1f} MB peak")
+
+    report = {
+        "benchmark": "pipeline",
+        "commit": current_commit(),
+        "generated_at": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Job Queue Soak Test
+===================
+Runs the durable job queue end to end on one machine: enqueues N
+recordings into a throwaway QUEUE_DIR, starts W real queue worker processes
+(queue-worker-script.py with the stand-in models from stubs.py) and, unless
+--no-kill, SIGKILLs one worker part-way through so its lease has to expire
+and another worker has to retry the job.
+
+Reported:
+
+- jobs done / failed, and how many needed more than one attempt
+- wall time and throughput (jobs per second)
+- queue wait p50/max (enqueue -> first lease)
+
+Usage:
+    python benchmarks/queue-soak.py --jobs 40 --workers 4 --call-cost-ms 20
+"""
+
+import argparse
+import importlib.util
+import json
+import multiprocessing
+import os
+import signal
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import stubs
+
+WORKER_PATH = stubs.APP_PATH.parent / "queue-worker-script.py"
+
+
+def stub_worker(words, call_cost):
+    """One worker process: the real worker loop over stand-in models"""
+    spec = importlib.util.spec_from_file_location("queue_worker", WORKER_PATH)
+    worker = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(worker)
+    worker.init_worker()
+    stubs.install_stub_models(worker._app, stubs.synthetic_transcript(words))
+    stubs.set_call_cost(call_cost)
+    worker.serve(poll_seconds=0.1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak-test the job queue with several worker processes")
+    parser.add_argument("--jobs", type=int, default=20, help="Jobs to enqueue (default: 20)")
+    parser.add_argument("--workers", type=int, default=3, help="Worker processes (default: 3)")
+    parser.add_argument("--words", type=int, default=500, help="Synthetic transcript size (default: 500)")
+    parser.add_argument("--call-cost-ms", type=float, default=20.0,
+                        help="Simulated latency per model call in ms (default: 20)")
+    parser.add_argument("--lease-seconds", type=float, default=3.0, help="Lease length (default: 3)")
+    parser.add_argument("--no-kill", action="store_true", help="Do not kill a worker mid-run")
+    parser.add_argument("--timeout", type=float, default=600, help="Give up after this many seconds")
+    parser.add_argument("--output", default="queue-soak-results.json", help="Where to write JSON results")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Set before importing the app: its queue/checkpoint locations are read at import
+        os.environ["QUEUE_DIR"] = str(Path(tmp_dir) / "queue")
+        os.environ["JOBS_DIR"] = str(Path(tmp_dir) / "jobs")
+        os.environ["AUDIO_CACHE_DIR"] = str(Path(tmp_dir) / "audio-cache")
+        os.environ["THROUGHPUT_STATS_PATH"] = str(Path(tmp_dir) / "throughput.json")
+        os.environ["QUEUE_LEASE_SECONDS"] = str(args.lease_seconds)
+        app = stubs.load_app_module()
+        queue = app.JobQueue()
+
+        audio_path = stubs.write_silent_wav(Path(tmp_dir) / "meeting.wav")
+        audio_bytes = audio_path.read_bytes()
+        meeting_info = {"title": "Soak", "date": "2024-01-01", "time": "09:00", "location": "Not specified",
+                        "organizer": "Not specified", "attendees": "Not specified"}
+        job_ids = []
+        for i in range(args.jobs):
+            # Unique content per job, otherwise jobs would resume each other's checkpoints
+            audio_path.write_bytes(audio_bytes[:-4] + os.urandom(4))
+            job_ids.append(queue.enqueue(audio_path, meeting_info, model_size="base"))
+
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=stub_worker, args=(args.words, args.call_cost_ms / 1000))
+            for _ in range(args.workers)
+        ]
+        started = time.time()
+        for process in processes:
+            process.start()
+
+        killed = None
+        try:
+            while time.time() - started < args.timeout:
+                counts = queue.counts()
+                finished = sum(counts.get(status, 0) for status in ("done", "failed", "cancelled"))
+                if killed is None and not args.no_kill and finished >= args.jobs // 3:
+                    # Kill a worker that is holding a lease so the job must be taken over
+                    jobs = [queue.get(job_id) for job_id in job_ids]
+                    owners = {job["lease_owner"] for job in jobs if job["status"] == "leased"}
+                    for process in processes:
+                        if any(owner.endswith(f":{process.pid}") for owner in owners):
+                            os.kill(process.pid, signal.SIGKILL)
+                            killed = process.pid
+                            print(f"💀 Killed worker {killed} mid-job")
+                            break
+                if finished == args.jobs:
+                    break
+                time.sleep(0.1)
+            wall = time.time() - started
+        finally:
+            for process in processes:
+                process.kill()
+                process.join()
+
+        jobs = [queue.get(job_id) for job_id in job_ids]
+
+    statuses = {}
+    for job in jobs:
+        statuses[job["status"]] = statuses.get(job["status"], 0) + 1
+    retried = [job for job in jobs if job["attempts"] > 1]
+    waits = sorted(job["started_at"] - job["created_at"] for job in jobs if job["started_at"])
+    done = statuses.get("done", 0)
+
+    print(f"\n📦 {args.jobs} jobs, {args.workers} workers, {wall:.1f}s wall")
+    print(f"   statuses:    {statuses}")
+    print(f"   retried:     {len(retried)} (max attempts {max(job['attempts'] for job in jobs)})")
+    print(f"   throughput:  {done / wall:.2f} jobs/s")
+    if waits:
+        print(f"   queue wait:  p50 {statistics.median(waits):.2f}s, max {waits[-1]:.2f}s")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "benchmark": "queue-soak",
+            "generated_at": datetime.now().isoformat(),
+            "jobs": args.jobs,
+            "workers": args.workers,
+            "call_cost_ms": args.call_cost_ms,
+            "lease_seconds": args.lease_seconds,
+            "killed_worker": killed,
+            "wall_seconds": wall,
+            "statuses": statuses,
+            "retried_jobs": len(retried),
+            "throughput_jobs_per_second": done / wall if wall else None,
+            "queue_wait_seconds": {"p50": statistics.median(waits) if waits else None,
+                                   "max": waits[-1] if waits else None},
+        }, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+
+    if done != args.jobs:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
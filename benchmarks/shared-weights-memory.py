@@ -0,0 +1,140 @@
+"""
+Shared Model Weights Memory Benchmark
+=====================================
+Starts 1, 2, 4, ... worker processes that each load the app's models the
+way a Streamlit replica or queue worker does, touches every weight (as
+inference would), and then measures every worker from outside:
+
+- RSS: resident memory, counting shared pages in full in every process
+- USS: unique set size, memory that would be freed if the worker exited
+- PSS: proportional set size, shared pages split between their users; the
+  sum over workers is the real footprint on the host
+
+Two modes are compared:
+
+- copy: the default loaders, every worker holds a private copy
+- mmap: SHARED_WEIGHTS=1, workers map one fp32 file per model from
+  SHARED_WEIGHTS_DIR, so the weights show up as shared, not unique, memory
+
+Needs the real models (Whisper checkpoint, and the HuggingFace pipelines
+with --analysis); --whisper also accepts a path to a local checkpoint.
+
+Usage:
+    python benchmarks/shared-weights-memory.py --whisper base --workers 1 2 4
+    python benchmarks/shared-weights-memory.py --whisper small --analysis --modes mmap
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+from datetime import datetime
+
+import psutil
+
+import stubs
+
+
+def worker(mode, whisper_model, analysis, weights_dir, ready, done):
+    """Load the models, fault every weight in, then idle until measured"""
+    os.environ["SHARED_WEIGHTS"] = "1" if mode == "mmap" else ""
+    os.environ["SHARED_WEIGHTS_DIR"] = weights_dir
+    app = stubs.load_app_module()
+
+    models = [app.load_whisper_model(whisper_model)]
+    if analysis:
+        models += [model_pipeline.model for model_pipeline in app.load_ai_models()]
+    for model in models:
+        for tensor in model.state_dict().values():
+            tensor.float().sum()
+
+    ready.set()
+    done.wait()
+
+
+def run_level(context, mode, workers, whisper_model, analysis, weights_dir):
+    """Start `workers` processes in one mode and measure each once all are loaded"""
+    done = context.Event()
+    readies = [context.Event() for _ in range(workers)]
+    processes = [
+        context.Process(target=worker, args=(mode, whisper_model, analysis, weights_dir, ready, done))
+        for ready in readies
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for ready, process in zip(readies, processes):
+            while not ready.wait(1):
+                if not process.is_alive():
+                    raise RuntimeError(f"{mode} worker exited with code {process.exitcode} while loading")
+
+        per_worker = []
+        for process in processes:
+            memory = psutil.Process(process.pid).memory_full_info()
+            per_worker.append({"rss": memory.rss, "uss": memory.uss, "pss": getattr(memory, "pss", None)})
+    finally:
+        done.set()
+        for process in processes:
+            process.join()
+
+    return {
+        "mode": mode,
+        "workers": workers,
+        "per_worker_bytes": per_worker,
+        "total_rss_bytes": sum(w["rss"] for w in per_worker),
+        "total_uss_bytes": sum(w["uss"] for w in per_worker),
+        "total_pss_bytes": sum(w["pss"] for w in per_worker) if per_worker[0]["pss"] is not None else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure worker memory with private vs memory-mapped weights")
+    parser.add_argument("--whisper", default="base", help="Whisper model size or checkpoint path (default: base)")
+    parser.add_argument("--analysis", action="store_true",
+                        help="Also load the summarization, QA and classification pipelines")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4],
+                        help="Worker counts to measure (default: 1 2 4)")
+    parser.add_argument("--modes", nargs="+", default=["copy", "mmap"], choices=["copy", "mmap"],
+                        help="Loading modes to compare (default: both)")
+    parser.add_argument("--weights-dir", default=None,
+                        help="SHARED_WEIGHTS_DIR for mmap mode (default: a temporary directory)")
+    parser.add_argument("--output", default="shared-weights-results.json", help="Where to write JSON results")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        weights_dir = args.weights_dir or tmp_dir
+        if "mmap" in args.modes:
+            # Export once up front so no measured worker carries the export's garbage
+            run_level(context, "mmap", 1, args.whisper, args.analysis, weights_dir)
+
+        levels = []
+        print(f"\n{'mode':>5} {'workers':>8} {'RSS/worker':>11} {'USS/worker':>11} {'total PSS':>10} {'total RSS':>10}")
+        for mode in args.modes:
+            for workers in args.workers:
+                level = run_level(context, mode, workers, args.whisper, args.analysis, weights_dir)
+                levels.append(level)
+                pss = level["total_pss_bytes"]
+                print(f"{mode:>5} {workers:>8} {level['total_rss_bytes'] / workers / 1e6:>9.0f}MB "
+                      f"{level['total_uss_bytes'] / workers / 1e6:>9.0f}MB "
+                      f"{pss / 1e6 if pss is not None else float('nan'):>8.0f}MB "
+                      f"{level['total_rss_bytes'] / 1e6:>8.0f}MB")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "benchmark": "shared-weights-memory",
+            "generated_at": datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "whisper": args.whisper,
+            "analysis": args.analysis,
+            "levels": levels,
+        }, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Deterministic stand-in models for benchmarks
+=============================================
+Replaces Whisper and the three HuggingFace pipelines with cheap local
+stand-ins so the rest of the pipeline (chunking, prompting loops, report
+rendering) can be measured without downloads or GPU time. Every stand-in
+counts its calls so benchmarks can report model calls per stage.
+"""
+
+import importlib.util
+import random
+import time
+import wave
+import zlib
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+APP_PATH = Path(__file__).resolve().parent.parent / "meeting-transcription-app.py"
+
+VOCABULARY = [
+    "project", "budget", "timeline", "customer", "release", "review", "design",
+    "team", "quarter", "report", "feature", "testing", "deployment", "roadmap",
+    "meeting", "update", "metrics", "launch", "feedback", "priority", "risk",
+    "hiring", "contract", "vendor", "migration", "database", "security", "audit",
+]
+
+ACTION_PHRASES = [
+    "we need to", "someone should", "the team will", "we must", "you have to",
+    "please follow up on", "the deadline for", "who is responsible for",
+]
+
+SEGMENT_WORDS = 20
+SEGMENT_SECONDS = 6.0
+
+calls = Counter()
+
+# Simulated latency added to every model call (seconds); see set_call_cost()
+call_cost = 0.0
+
+
+def set_call_cost(seconds):
+    """Make every stand-in model call take `seconds` to emulate inference time"""
+    global call_cost
+    call_cost = seconds
+
+
+def _simulate_inference():
+    if call_cost:
+        time.sleep(call_cost)
+
+
+def load_app_module():
+    """Import the Streamlit app file as a module (its filename is not importable)"""
+    spec = importlib.util.spec_from_file_location("meeting_transcription_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_transcript(num_words, seed=0):
+    """Build a Whisper-shaped result with num_words words of meeting-like text"""
+    rng = random.Random(seed)
+    words = []
+    while len(words) < num_words:
+        sentence = []
+        if rng.random() < 0.3:
+            sentence.extend(rng.choice(ACTION_PHRASES).split())
+        sentence.extend(rng.choice(VOCABULARY) for _ in range(rng.randint(6, 14)))
+        sentence[0] = sentence[0].capitalize()
+        sentence[-1] += rng.choice([".", ".", ".", "?", "!"])
+        words.extend(sentence)
+    words = words[:num_words]
+
+    segments = []
+    for i in range(0, len(words), SEGMENT_WORDS):
+        index = i // SEGMENT_WORDS
+        segments.append({
+            "id": index,
+            "seek": 0,
+            "start": index * SEGMENT_SECONDS,
+            "end": (index + 1) * SEGMENT_SECONDS,
+            "text": " " + " ".join(words[i:i + SEGMENT_WORDS]),
+            "tokens": list(range(50364, 50364 + SEGMENT_WORDS)),
+            "temperature": 0.0,
+            "avg_logprob": -0.25,
+            "compression_ratio": 1.6,
+            "no_speech_prob": 0.01,
+        })
+
+    return {
+        "text": "".join(segment["text"] for segment in segments),
+        "segments": segments,
+        "language": "en",
+    }
+
+
+def write_silent_wav(path, seconds=1.0, sample_rate=16000):
+    """Write a short silent 16 kHz mono WAV to use as pipeline input"""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\x00\x00" * int(seconds * sample_rate))
+    return path
+
+
+class StubLanguageDetection:
+    """What AudioTranscriber.detect_language() needs of a Whisper model; always detects English"""
+
+    is_multilingual = True
+    dims = SimpleNamespace(n_mels=80)
+    device = "cpu"
+
+    def detect_language(self, mel):
+        calls["whisper_detect_language"] += 1
+        return None, {"en": 1.0}
+
+
+class StubWhisperModel(StubLanguageDetection):
+    """Returns a fixed synthetic transcript regardless of the audio"""
+
+    def __init__(self, transcription):
+        self.transcription = transcription
+
+    def transcribe(self, audio, **decode_options):
+        calls["whisper"] += 1
+        _simulate_inference()
+        return self.transcription
+
+
+# Every word of the synthetic transcripts "spoken" as a tone of its own pitch
+TONE_WORDS = sorted(set(VOCABULARY) | {word for phrase in ACTION_PHRASES for word in phrase.split()})
+TONE_BASE_HZ = 300.0
+TONE_STEP_HZ = 40.0
+TONE_WORD_SECONDS = 0.5
+TONE_GAP_SECONDS = 0.1
+TONE_SENTENCE_GAP_SECONDS = 0.6
+
+
+def tone_speech(text, sample_rate=16000):
+    """Render text as 16 kHz float32 audio: one tone per word, a longer pause after each sentence"""
+    word_samples = int(TONE_WORD_SECONDS * sample_rate)
+    t = np.arange(word_samples) / sample_rate
+    parts = []
+    for word in text.split():
+        index = TONE_WORDS.index(word.strip(".?!").lower())
+        parts.append(0.3 * np.sin(2 * np.pi * (TONE_BASE_HZ + TONE_STEP_HZ * index) * t).astype(np.float32))
+        gap = TONE_SENTENCE_GAP_SECONDS if word[-1] in ".?!" else TONE_GAP_SECONDS
+        parts.append(np.zeros(int(gap * sample_rate), dtype=np.float32))
+    return np.concatenate(parts)
+
+
+class ToneWhisperModel(StubLanguageDetection):
+    """Transcribes tone_speech() audio, with Whisper-like segments and timestamps
+
+    A segment is one sentence. Like Whisper's, its end timestamp is a little
+    early, so the tail of its last word is heard again in the next window of
+    a live transcription unless overlapping words are removed.
+    """
+
+    early_end_seconds = 0.3
+
+    def transcribe(self, audio, sample_rate=16000, **decode_options):
+        calls["whisper"] += 1
+        _simulate_inference()
+        frame = sample_rate // 100
+        energy = np.sqrt(np.mean(np.asarray(audio[:len(audio) // frame * frame]).reshape(-1, frame) ** 2, axis=1))
+        active = np.concatenate([[False], energy > 0.01, [False]])
+        edges = np.flatnonzero(active[1:] != active[:-1])
+
+        words = []  # (start, end, index)
+        for start, stop in zip(edges[::2], edges[1::2]):
+            if stop - start < 20:  # Less than 0.2 s of a tone: a word cut off at the window edge
+                continue
+            samples = np.asarray(audio[start * frame:stop * frame])
+            spectrum = np.abs(np.fft.rfft(samples))
+            peak_hz = np.argmax(spectrum) * sample_rate / len(samples)
+            index = min(max(round((peak_hz - TONE_BASE_HZ) / TONE_STEP_HZ), 0), len(TONE_WORDS) - 1)
+            words.append((start / 100, stop / 100, index))
+
+        segments, sentence = [], []
+        duration = len(audio) / sample_rate
+        for i, word in enumerate(words):
+            sentence.append(word)
+            next_start = words[i + 1][0] if i + 1 < len(words) else duration
+            ended = next_start - word[1] >= (TONE_GAP_SECONDS + TONE_SENTENCE_GAP_SECONDS) / 2
+            if ended or i + 1 == len(words):
+                text = " ".join(TONE_WORDS[index] for _, _, index in sentence)
+                segments.append({
+                    "id": len(segments),
+                    "seek": 0,
+                    "start": round(sentence[0][0], 2),
+                    "end": round(max(sentence[-1][1] - self.early_end_seconds, sentence[-1][0]), 2),
+                    "text": " " + text[0].upper() + text[1:] + ("." if ended else ""),
+                    "tokens": [],
+                    "temperature": 0.0,
+                    "avg_logprob": -0.25,
+                    "compression_ratio": 1.6,
+                    "no_speech_prob": 0.01,
+                })
+                sentence = []
+
+        return {"text": "".join(segment["text"] for segment in segments), "segments": segments, "language": "en"}
+
+
+def _stable_score(text):
+    """Deterministic pseudo-score in [0, 1) derived from the text"""
+    return (zlib.crc32(text.encode("utf-8")) % 1000) / 1000
+
+
+def stub_summarizer(text, max_length=150, min_length=30, do_sample=False):
+    calls["summarizer"] += 1
+    _simulate_inference()
+    return [{"summary_text": " ".join(text.split()[:max_length // 3])}]
+
+
+def stub_qa_model(question, context):
+    calls["qa"] += 1
+    _simulate_inference()
+    answer = context.split(".")[0].strip()
+    return {"answer": answer, "score": 0.05 + _stable_score(question + answer) * 0.9}
+
+
+def stub_classifier(sequence, candidate_labels):
+    calls["classifier"] += 1
+    _simulate_inference()
+    first = int(_stable_score(sequence) * len(candidate_labels))
+    labels = candidate_labels[first:] + candidate_labels[:first]
+    scores = [0.6] + [0.4 / (len(labels) - 1)] * (len(labels) - 1)
+    return {"sequence": sequence, "labels": labels, "scores": scores}
+
+
+def install_stub_models(app, transcription):
+    """Point the app's model loaders at the stand-ins"""
+    stub_whisper = StubWhisperModel(transcription)
+    app.load_whisper_model = lambda model_size="base": stub_whisper
+    app.load_ai_models = lambda backend=None: (stub_summarizer, stub_qa_model, stub_classifier)
+    return stub_whisper
+
+
+STUB_PIPELINES = {
+    "summarization": stub_summarizer,
+    "question-answering": stub_qa_model,
+    "zero-shot-classification": stub_classifier,
+}
+
+
+def install_library_stubs(transcription):
+    """Patch whisper.load_model and transformers.pipeline themselves
+
+    Needed when the app file is executed as a script (e.g. by Streamlit's
+    AppTest), where its own loader functions are redefined on every run.
+    """
+    import transformers
+    import whisper
+
+    stub_whisper = StubWhisperModel(transcription)
+    whisper.load_model = lambda name, *args, **kwargs: stub_whisper
+    transformers.pipeline = lambda task, *args, **kwargs: STUB_PIPELINES[task]
+    return stub_whisper
@@ -0,0 +1,167 @@
+"""
+Windowed Decode Parity Check
+============================
+Transcribes the same audio in whole-file mode and in windowed mode
+(AudioTranscriber.transcribe(windowed=False/True)) and checks that:
+
+- every log-Mel frame WindowedLogMel computes matches Whisper's own
+  whole-file spectrogram within --tolerance
+- both modes produce identical segments (seek, timestamps, tokens, text)
+
+Any mismatch is listed and the script exits with status 1. Run it after
+upgrading openai-whisper: windowed mode feeds Whisper a lazy stand-in for
+the spectrogram tensor, so a release that reads the spectrogram differently
+shows up here first.
+
+With --random-weights it uses a small randomly initialised Whisper model
+instead of a downloaded checkpoint, so it runs offline. The transcripts
+are gibberish, but parity only depends on what the decoder is fed.
+
+Usage:
+    python benchmarks/windowed-decode-parity.py meeting.m4a --model base
+    python benchmarks/windowed-decode-parity.py --random-weights --words 300
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import torch
+
+import stubs
+
+SEGMENT_FIELDS = ("seek", "start", "end", "text", "tokens")
+
+
+def random_whisper_model(app):
+    """Tiny English-only Whisper with random weights (same architecture, no download)"""
+    torch.manual_seed(0)
+    dims = app.whisper.model.ModelDimensions(
+        n_mels=80, n_audio_ctx=1500, n_audio_state=64, n_audio_head=2, n_audio_layer=2,
+        n_vocab=51864, n_text_ctx=448, n_text_state=64, n_text_head=2, n_text_layer=2,
+    )
+    return app.whisper.model.Whisper(dims).eval()
+
+
+def mel_differences(app, audio, n_mels, tolerance):
+    """Frames where WindowedLogMel differs from whisper.log_mel_spectrogram by more than tolerance"""
+    padding = app.whisper.audio.N_SAMPLES
+    expected = app.whisper.log_mel_spectrogram(torch.from_numpy(np.asarray(audio)), n_mels, padding=padding)
+    windowed = app.WindowedAudio(audio).windowed_log_mel(n_mels, padding)
+    if tuple(expected.shape) != tuple(windowed.shape):
+        return [f"shape {tuple(expected.shape)} vs {tuple(windowed.shape)}"], None
+
+    largest = 0.0
+    differences = []
+    for start in range(0, expected.shape[-1], app.whisper.audio.N_FRAMES):
+        stop = min(start + app.whisper.audio.N_FRAMES, expected.shape[-1])
+        difference = (expected[:, start:stop] - windowed[:, start:stop]).abs().max().item()
+        largest = max(largest, difference)
+        if difference > tolerance:
+            differences.append(f"frames {start}-{stop}: max difference {difference:.2e}")
+    return differences, largest
+
+
+def segment_differences(expected, actual):
+    """Differences between the whole-file and windowed segment lists"""
+    if len(expected) != len(actual):
+        return [f"{len(expected)} segments vs {len(actual)}"]
+    return [
+        f"segment {i} {field}: {e[field]!r} vs {a[field]!r}"
+        for i, (e, a) in enumerate(zip(expected, actual))
+        for field in SEGMENT_FIELDS if e[field] != a[field]
+    ]
+
+
+def transcribe(app, audio, model_size, language, profile, windowed):
+    """One timed transcription; sampling fallbacks are seeded so both modes draw the same numbers"""
+    torch.manual_seed(0)
+    started = time.perf_counter()
+    result = app.AudioTranscriber.transcribe(audio, model_size=model_size, language=language,
+                                             decoding_profile=profile, windowed=windowed)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that windowed and whole-file transcription agree")
+    parser.add_argument("audio", nargs="*", help="Recordings to check (default: synthetic tone speech)")
+    parser.add_argument("--words", type=int, default=200, help="Synthetic recording size in words (default: 200)")
+    parser.add_argument("--model", default="base", choices=["tiny", "base", "small", "medium", "large"],
+                        help="Whisper model size (default: base)")
+    parser.add_argument("--random-weights", action="store_true",
+                        help="Use a small randomly initialised model instead of a checkpoint (offline)")
+    parser.add_argument("--language", default="en", help="Spoken language hint (default: en)")
+    parser.add_argument("--profile", default="balanced", choices=["fast", "balanced", "accurate"],
+                        help="Decoding profile (default: balanced)")
+    parser.add_argument("--tolerance", type=float, default=1e-4,
+                        help="Largest allowed log-Mel difference (default: 1e-4)")
+    parser.add_argument("--output", default="windowed-decode-parity.json", help="Where to write JSON results")
+    args = parser.parse_args()
+
+    app = stubs.load_app_module()
+    if args.random_weights:
+        model = random_whisper_model(app)
+        app.load_whisper_model = lambda model_size: model
+        args.language = "en"
+    n_mels = app.load_whisper_model(app.AudioTranscriber.route(args.model, args.language)[0]).dims.n_mels
+
+    recordings = {}
+    for audio_path in args.audio:
+        recordings[Path(audio_path).name] = app.AudioTranscriber.load_audio(
+            audio_path, app.AudioTranscriber.content_hash(audio_path)
+        )
+    if not recordings:
+        recordings[f"tone speech ({args.words} words)"] = stubs.tone_speech(
+            stubs.synthetic_transcript(args.words)["text"]
+        )
+
+    files = []
+    for name, audio in recordings.items():
+        audio_seconds = len(audio) / app.whisper.audio.SAMPLE_RATE
+        mismatches, largest_mel_difference = mel_differences(app, audio, n_mels, args.tolerance)
+        whole, whole_seconds = transcribe(app, audio, args.model, args.language, args.profile, windowed=False)
+        windowed, windowed_seconds = transcribe(app, audio, args.model, args.language, args.profile, windowed=True)
+        mismatches += segment_differences(whole["segments"], windowed["segments"])
+
+        print(f"\n🎧 {name} ({audio_seconds:.0f}s, {len(whole['segments'])} segments)")
+        print(f"   whole-file {whole_seconds:.1f}s, windowed {windowed_seconds:.1f}s, "
+              f"largest log-Mel difference {largest_mel_difference or 0:.2e}")
+        print(f"   {'✅ identical segments' if not mismatches else f'❌ {len(mismatches)} differences'}")
+        for mismatch in mismatches[:5]:
+            print(f"   ❌ {mismatch}")
+
+        files.append({
+            "audio": name,
+            "audio_seconds": audio_seconds,
+            "segments": len(whole["segments"]),
+            "whole_file_seconds": whole_seconds,
+            "windowed_seconds": windowed_seconds,
+            "largest_mel_difference": largest_mel_difference,
+            "mismatches": mismatches,
+        })
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "benchmark": "windowed-decode-parity",
+            "generated_at": datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "whisper": getattr(app.whisper, "__version__", None),
+            "model": "random-weights" if args.random_weights else args.model,
+            "profile": args.profile,
+            "tolerance": args.tolerance,
+            "files": files,
+        }, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+
+    if any(f["mismatches"] for f in files):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
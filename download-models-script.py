@@ -1,94 +1,262 @@
 """
-Whisper Model Pre-download Script
-==================================
-Run this script ONCE before deploying to download all Whisper models.
-This saves time during first-time usage and prevents crashes.
+Model Bundle Builder
+====================
+Run this script ONCE before deploying (and again to upgrade models). It
+downloads every model the app uses - the Whisper checkpoints and the
+HuggingFace analysis models - in parallel into a versioned local bundle:
 
-Usage:
-    python download_models.py
+    models/
+      20261019-093000/
+        manifest.json
+        whisper/base.pt, base.en.pt, ...
+        huggingface/facebook--bart-large-cnn/...
+      current -> 20261019-093000
+
+Every file is checked against the hash its source publishes (the SHA-256 in
+the Whisper download URL; the LFS SHA-256 or git blob id from the
+HuggingFace Hub) before the bundle is written. manifest.json records each
+file's SHA-256, so --verify can re-check a bundle on the serving host.
+"current" only moves once a bundle is complete, so a failed or partial run
+never replaces a good one; rerunning with the same --version resumes it.
+
+Point the app at the bundle and it loads only from there, with the
+HuggingFace libraries forced offline:
+
+    MODEL_BUNDLE=models/current streamlit run meeting-transcription-app.py
 
-Or download specific models:
-    python download_models.py --models tiny base
+Usage:
+    python download-models-script.py
+    python download-models-script.py --output /srv/models --whisper tiny base --jobs 8
+    python download-models-script.py --verify models/current
 """
 
-import whisper
 import argparse
+import hashlib
+import importlib.util
+import json
+import os
 import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+import whisper
+from huggingface_hub import HfApi, snapshot_download
+
+APP_PATH = Path(__file__).resolve().parent / "meeting-transcription-app.py"
+
+# Files a pipeline needs besides the weights (configs, tokenizer vocabularies)
+HF_SUPPORT_SUFFIXES = (".json", ".txt", ".model")
+
+
+def load_app_module():
+    """Import the Streamlit app file as a module (its filename is not importable)"""
+    # The app forces the HuggingFace libraries offline when a bundle is configured
+    os.environ.pop("MODEL_BUNDLE", None)
+    spec = importlib.util.spec_from_file_location("meeting_transcription_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def file_sha256(path):
+    """SHA-256 of a file, read in chunks so multi-GB checkpoints fit in memory"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def git_blob_id(path):
+    """Git's object id for a file, which the Hub reports for non-LFS files"""
+    digest = hashlib.sha1(f"blob {os.path.getsize(path)}\0".encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fetch_whisper(name, bundle_dir):
+    """Download one Whisper checkpoint into the bundle and verify it"""
+    url = whisper._MODELS[name]
+    # The URL's second to last component is the checkpoint's SHA-256;
+    # whisper._download checks it and raises on a mismatch
+    expected = url.split("/")[-2]
+    path = Path(whisper._download(url, str(bundle_dir / "whisper"), in_memory=False))
+    return {
+        "path": str(path.relative_to(bundle_dir)),
+        "url": url,
+        "sha256": expected,
+        "bytes": path.stat().st_size,
+    }
+
+
+def fetch_huggingface(model_id, task, bundle_dir):
+    """Download one HuggingFace model (weights in one format only) into the bundle and verify it"""
+    info = HfApi().model_info(model_id, files_metadata=True)
+    siblings = {s.rfilename: s for s in info.siblings if "/" not in s.rfilename}
+
+    # Prefer safetensors; the TF/Flax/ONNX/Rust copies of the weights are never used
+    weights = [name for name in siblings if name.endswith(".safetensors")]
+    if not weights:
+        weights = [name for name in siblings if name.startswith("pytorch_model") and name.endswith(".bin")]
+    files = sorted(weights + [name for name in siblings if name.endswith(HF_SUPPORT_SUFFIXES)])
+
+    target = bundle_dir / "huggingface" / model_id.replace("/", "--")
+    # Pinned to the commit model_info resolved, so the hashes below match the files
+    snapshot_download(model_id, revision=info.sha, local_dir=target, allow_patterns=files)
+
+    manifest_files = {}
+    for name in files:
+        sibling, path = siblings[name], target / name
+        sha256 = file_sha256(path)
+        if sibling.lfs is not None:
+            ok = sha256 == sibling.lfs.sha256
+        else:
+            ok = sibling.blob_id is None or git_blob_id(path) == sibling.blob_id
+        if not ok:
+            path.unlink()
+            raise RuntimeError(f"{model_id}/{name}: checksum mismatch, removed the file")
+        manifest_files[name] = {"sha256": sha256, "bytes": path.stat().st_size}
+
+    return {
+        "path": str(target.relative_to(bundle_dir)),
+        "task": task,
+        "revision": info.sha,
+        "files": manifest_files,
+    }
+
+
+def write_json_atomic(path, data):
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def point_current_at(output_dir, version):
+    """Atomically switch <output>/current to the new bundle"""
+    tmp_link = output_dir / f"current.{uuid.uuid4().hex}.tmp"
+    os.symlink(version, tmp_link)
+    os.replace(tmp_link, output_dir / "current")
+
+
+def build_bundle(output_dir, version, whisper_models, hf_models, jobs):
+    """Fetch everything in parallel; returns (manifest, failures)"""
+    bundle_dir = output_dir / version
+    (bundle_dir / "whisper").mkdir(parents=True, exist_ok=True)
+
+    manifest = {"version": version, "whisper": {}, "huggingface": {}}
+    failures = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(fetch_whisper, name, bundle_dir): ("whisper", name) for name in whisper_models}
+        futures.update({
+            pool.submit(fetch_huggingface, model_id, task, bundle_dir): ("huggingface", model_id)
+            for task, model_id in hf_models.items()
+        })
+        for future in as_completed(futures):
+            kind, name = futures[future]
+            try:
+                entry = future.result()
+            except Exception as e:
+                print(f"❌ {kind} '{name}': {e}")
+                failures.append(name)
+                continue
+            manifest[kind][name] = entry
+            size = entry["bytes"] if kind == "whisper" else sum(f["bytes"] for f in entry["files"].values())
+            print(f"✅ {kind} '{name}' verified ({size / 1e6:,.0f} MB)")
+
+    manifest["created_at"] = datetime.now().isoformat()
+    return manifest, failures
+
+
+def verify_bundle(bundle_path):
+    """Re-hash every file in a bundle against its manifest; returns the list of problems"""
+    bundle_dir = Path(bundle_path).resolve()
+    with open(bundle_dir / "manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    expected = {entry["path"]: entry["sha256"] for entry in manifest["whisper"].values()}
+    for entry in manifest["huggingface"].values():
+        expected.update({f"{entry['path']}/{name}": meta["sha256"] for name, meta in entry["files"].items()})
+
+    problems = []
+    for relative_path, sha256 in sorted(expected.items()):
+        path = bundle_dir / relative_path
+        if not path.exists():
+            problems.append(f"{relative_path}: missing")
+        elif file_sha256(path) != sha256:
+            problems.append(f"{relative_path}: checksum mismatch")
+    print(f"Checked {len(expected)} files in bundle {manifest['version']}")
+    return problems
 
-def download_model(model_name):
-    """Download a specific Whisper model"""
-    try:
-        print(f"\n{'='*60}")
-        print(f"Downloading Whisper '{model_name}' model...")
-        print(f"{'='*60}")
-        
-        model = whisper.load_model(model_name)
-        
-        print(f"✅ Successfully downloaded '{model_name}' model")
-        print(f"   Model parameters: {sum(p.numel() for p in model.parameters()):,}")
-        
-        return True
-    except Exception as e:
-        print(f"❌ Error downloading '{model_name}' model: {str(e)}")
-        return False
 
 def main():
-    parser = argparse.ArgumentParser(description="Download Whisper models")
+    parser = argparse.ArgumentParser(description="Build an offline, versioned bundle of every model the app uses")
+    parser.add_argument("--output", default="models", help="Directory holding the bundles (default: models)")
+    parser.add_argument("--version", default=None,
+                        help="Bundle version / directory name (default: current date and time)")
     parser.add_argument(
-        "--models",
+        "--whisper",
         nargs="+",
         default=["tiny", "base", "small", "medium"],
-        choices=["tiny", "base", "small", "medium", "large"],
-        help="Models to download (default: tiny base small medium)"
+        choices=list(whisper._MODELS),
+        help="Whisper models to include (default: tiny base small medium)"
     )
-    
+    parser.add_argument("--no-english-only", action="store_true",
+                        help="Skip the .en checkpoints the app uses for English meetings")
+    parser.add_argument("--skip-analysis", action="store_true", help="Leave out the HuggingFace analysis models")
+    parser.add_argument("--jobs", type=int, default=4, help="Models downloaded at the same time (default: 4)")
+    parser.add_argument("--verify", metavar="BUNDLE", default=None,
+                        help="Only re-check an existing bundle against its manifest")
     args = parser.parse_args()
-    
+
+    if args.verify:
+        problems = verify_bundle(args.verify)
+        for problem in problems:
+            print(f"❌ {problem}")
+        print("✅ Bundle OK" if not problems else f"❌ {len(problems)} problem(s)")
+        sys.exit(1 if problems else 0)
+
+    app = load_app_module()
+    whisper_models = list(dict.fromkeys(args.whisper))
+    if not args.no_english_only:
+        whisper_models += [f"{name}.en" for name in whisper_models if name in app.ENGLISH_ONLY_SIZES]
+    hf_models = {} if args.skip_analysis else dict(app.ANALYSIS_MODELS)
+    version = args.version or datetime.now().strftime("%Y%m%d-%H%M%S")
+    output_dir = Path(args.output).resolve()
+
     print("\n" + "="*60)
-    print("   WHISPER MODEL DOWNLOADER")
+    print("   MODEL BUNDLE BUILDER")
     print("="*60)
-    print(f"\nModels to download: {', '.join(args.models)}")
-    print("\nThis may take several minutes depending on your connection...")
-    
-    # Model sizes
-    sizes = {
-        "tiny": "~39 MB",
-        "base": "~74 MB",
-        "small": "~244 MB",
-        "medium": "~769 MB",
-        "large": "~1550 MB"
-    }
-    
-    total_size = sum([39 if m == "tiny" else 74 if m == "base" else 244 if m == "small" 
-                      else 769 if m == "medium" else 1550 for m in args.models])
-    
-    print(f"\nEstimated total download: ~{total_size} MB\n")
-    
-    success_count = 0
-    failed_models = []
-    
-    for model_name in args.models:
-        print(f"\n📥 [{args.models.index(model_name) + 1}/{len(args.models)}] {model_name.upper()} ({sizes.get(model_name, 'Unknown size')})")
-        
-        if download_model(model_name):
-            success_count += 1
-        else:
-            failed_models.append(model_name)
-    
+    print(f"\nBundle:  {output_dir / version}")
+    print(f"Whisper: {', '.join(whisper_models)}")
+    print(f"Models:  {', '.join(hf_models.values()) or '-'}")
+    print(f"\nDownloading with {args.jobs} parallel jobs, this may take several minutes...\n")
+
+    manifest, failures = build_bundle(output_dir, version, whisper_models, hf_models, args.jobs)
+
     # Summary
     print("\n" + "="*60)
-    print("   DOWNLOAD SUMMARY")
+    print("   BUNDLE SUMMARY")
     print("="*60)
-    print(f"\n✅ Successfully downloaded: {success_count}/{len(args.models)} models")
-    
-    if failed_models:
-        print(f"❌ Failed to download: {', '.join(failed_models)}")
+    total = len(whisper_models) + len(hf_models)
+    print(f"\n✅ Downloaded and verified: {total - len(failures)}/{total} models")
+
+    if failures:
+        print(f"❌ Failed: {', '.join(failures)}")
+        print(f"\nNo manifest written; rerun with --version {version} to resume.")
         sys.exit(1)
-    else:
-        print("\n🎉 All models downloaded successfully!")
-        print("\nYou can now run the Streamlit app:")
-        print("   streamlit run app.py --server.maxUploadSize=500")
-        sys.exit(0)
+
+    write_json_atomic(output_dir / version / "manifest.json", manifest)
+    point_current_at(output_dir, version)
+    print(f"\n🎉 Bundle {version} is ready; {output_dir / 'current'} points at it.")
+    print("\nRun the app from the bundle (no network access needed):")
+    print(f"   MODEL_BUNDLE={output_dir / 'current'} streamlit run meeting-transcription-app.py")
+    sys.exit(0)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,128 @@
+"""
+Live Meeting Transcription
+==========================
+Transcribes a meeting while it is being recorded and writes the full report
+seconds after it ends. Audio (16 kHz mono 16-bit PCM, raw or WAV) comes from:
+
+- a growing file a recorder keeps appending to; the meeting ends when
+  "<file>.done" appears or the file stops growing for LIVE_IDLE_SECONDS
+- a local TCP port; the meeting ends when the sender closes the connection
+
+New transcript lines and action items are printed as they settle. Tune the
+rolling window with LIVE_STEP_SECONDS, LIVE_OVERLAP_SECONDS and
+LIVE_WINDOW_SECONDS (see LiveTranscriber in the app).
+
+Usage:
+    python live-transcribe-script.py --file recording.wav --output reports/
+    python live-transcribe-script.py --listen 9000 --model small --title "Weekly Sync"
+
+For example, stream a microphone into the socket with ffmpeg:
+    ffmpeg -f pulse -i default -ac 1 -ar 16000 -f s16le tcp://127.0.0.1:9000
+"""
+
+import argparse
+import importlib.util
+from datetime import datetime
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parent / "meeting-transcription-app.py"
+REPORT_FORMATS = ["txt", "md", "pdf", "json", "ndjson"]
+
+
+def load_app_module():
+    """Import the Streamlit app file as a module (its filename is not importable)"""
+    spec = importlib.util.spec_from_file_location("meeting_transcription_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class ConsolePrinter:
+    """Prints transcript segments and action items once, as they are committed"""
+
+    def __init__(self, app):
+        self.app = app
+        self.segments = 0
+        self.tasks = set()
+
+    def __call__(self, snapshot):
+        for segment in snapshot["segments"][self.segments:]:
+            print(f"[{self.app.AudioTranscriber.format_timestamp(segment['start'])}]{segment['text']}")
+        self.segments = len(snapshot["segments"])
+        for item in snapshot["action_items"]:
+            if item["task"] not in self.tasks:
+                self.tasks.add(item["task"])
+                print(f"   ✅ Action ({item['priority']}): {item['task']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcribe a meeting while it is being recorded")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", help="Recording that is still being written (raw PCM or WAV)")
+    source.add_argument("--listen", type=int, help="Local TCP port to receive audio on")
+    parser.add_argument("--output", default=".", help="Directory for the final reports (default: .)")
+    parser.add_argument("--formats", nargs="+", default=["txt", "json"], choices=REPORT_FORMATS,
+                        help="Report formats to write (default: txt json)")
+    parser.add_argument("--model", default="base", choices=["tiny", "base", "small", "medium", "large"],
+                        help="Whisper model size (default: base)")
+    parser.add_argument("--decoding-profile", default=None, choices=["fast", "balanced", "accurate"],
+                        help="Decoding profile (default: $LIVE_DECODING_PROFILE or fast)")
+    parser.add_argument("--lang", default="en", choices=["en", "es", "fr", "zh", "de", "bn"],
+                        help="Report language (default: en)")
+    parser.add_argument("--spoken-language", default=None,
+                        help="Language spoken in the meeting, or 'auto' (default: --lang)")
+    parser.add_argument("--title", default=None, help="Meeting title (default: the file name or 'Live Meeting')")
+    parser.add_argument("--location", default="Not specified", help="Meeting location")
+    parser.add_argument("--organizer", default="Not specified", help="Meeting organizer")
+    parser.add_argument("--full-json", action="store_true",
+                        help="Keep Whisper's complete segments (token ids included) in json/ndjson")
+    parser.add_argument("--gzip", action="store_true", help="Write json/ndjson reports gzipped (.gz)")
+    args = parser.parse_args()
+
+    app = load_app_module()
+    started_at = datetime.now()
+    meeting_info = {
+        "title": args.title or (Path(args.file).stem if args.file else "Live Meeting"),
+        "date": started_at.strftime("%Y-%m-%d"),
+        "time": started_at.strftime("%H:%M"),
+        "location": args.location,
+        "organizer": args.organizer,
+        "attendees": "Not specified"
+    }
+
+    live = app.LiveTranscriber(meeting_info, model_size=args.model, lang=args.lang,
+                               spoken_language=args.spoken_language,
+                               decoding_profile=args.decoding_profile or app.LIVE_DECODING_PROFILE)
+    source = app.open_live_source(args.file or args.listen)
+    if args.listen is not None:
+        print(f"🎧 Listening on 127.0.0.1:{source.port}")
+    else:
+        print(f"🎧 Following {args.file} (create {args.file}.done to end the meeting)")
+
+    report_data = live.run(source, on_update=ConsolePrinter(app))
+
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"{meeting_info['title']}-{started_at.strftime('%Y%m%d-%H%M')}"
+    for fmt in args.formats:
+        out_path = output_dir / f"{stem}.{fmt}"
+        if fmt in ("txt", "md"):
+            out_path.write_text(report_data["text"], encoding="utf-8")
+        elif fmt in ("json", "ndjson"):
+            if args.gzip:
+                out_path = out_path.with_name(f"{out_path.name}.gz")
+            app.write_export(out_path, report_data, fmt, full=args.full_json, compress=args.gzip)
+        elif fmt == "pdf":
+            if not app.resolve_pdf(report_data)["pdf_available"]:
+                print(f"⚠️  PDF skipped: {report_data['pdf_error']}")
+                continue
+            out_path.write_bytes(report_data["pdf"])
+        print(f"📄 {out_path}")
+
+    stats = report_data["stats"]
+    print(f"\n✅ {stats['duration']} meeting, {stats['words']} words, {stats['action_items']} action items; "
+          f"report ready {report_data['finalize_seconds']:.1f}s after the meeting ended")
+
+
+if __name__ == "__main__":
+    main()
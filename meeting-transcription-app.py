@@ -16,11 +16,58 @@ import os
 import io
 import json
 from datetime import datetime
-from transformers import pipeline
+
+# With a model bundle (see download-models-script.py) nothing may reach the
+# network; huggingface_hub reads these once, so they are set before it loads
+if os.environ.get("MODEL_BUNDLE"):
+    os.environ["HF_HUB_OFFLINE"] = "1"
+    os.environ["TRANSFORMERS_OFFLINE"] = "1"
+
+from transformers import (
+    pipeline, AutoConfig, AutoTokenizer, GenerationConfig,
+    AutoModelForSeq2SeqLM, AutoModelForQuestionAnswering, AutoModelForSequenceClassification,
+)
 from fpdf import FPDF
+from fontTools import ttLib
 import tempfile
 import traceback
+import time
+import hashlib
+import importlib
+import re
+import shutil
+import socket
+import sqlite3
+import subprocess
+import threading
+import numpy as np
+import torch
+import uuid
+import zlib
+import logging
+import math
+import cProfile
+import pstats
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
+import psutil
+
+try:
+    import prometheus_client
+except ImportError:  # Metrics endpoint is optional
+    prometheus_client = None
+
+try:
+    import uharfbuzz
+except ImportError:  # Without it Bengali is drawn unshaped
+    uharfbuzz = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent duplicate submissions are not told apart
+    fcntl = None
 
 # ============================================================
 # MULTI-LANGUAGE SUPPORT
@@ -42,6 +89,25 @@ TRANSLATIONS = {
         "attendees": "Attendees (comma-separated)",
         "whisper_model": "Whisper Model Size",
         "model_help": "Larger models are more accurate but slower. Base recommended for 500 users.",
+        "spoken_language": "Spoken Language",
+        "decoding_profile": "Decoding Profile",
+        "profile_help": "Balanced uses Whisper's standard settings. Fast skips re-decoding and the previous-text prompt; Accurate adds beam search.",
+        "queued": "⏳ Waiting for a worker (position {position} in queue)...",
+        "cancel_job": "⏹️ Cancel Job",
+        "job_cancelled": "Job cancelled. Click Generate Report again to resume it.",
+        "job_interrupted": "The previous run was interrupted. Click Generate Report again to resume from its last checkpoint.",
+        "live_title": "🔴 Live Meeting",
+        "live_source": "Live audio source",
+        "live_source_help": "Path of a recording that is still being written, or a local TCP port receiving audio (16 kHz mono 16-bit PCM)",
+        "live_start": "▶️ Start Live Transcription",
+        "live_waiting": "Waiting for audio...",
+        "live_status": "🔴 Live: {audio} received, transcript settled up to {committed}",
+        "deadline": "Target Completion Time (minutes, 0 = none)",
+        "deadline_help": "The planner lowers model size, decoding profile and analysis depth until the predicted time fits.",
+        "plan": "🧭 Processing Plan",
+        "predicted": "Predicted",
+        "actual": "Actual",
+        "auto_detect": "Auto-detect",
         "generate_report": "🚀 Generate Report",
         "processing": "Processing your meeting...",
         "step_transcribing": "Step 1/6: Transcribing audio",
@@ -81,6 +147,25 @@ TRANSLATIONS = {
         "attendees": "Asistentes (separados por comas)",
         "whisper_model": "Tamaño del Modelo Whisper",
         "model_help": "Modelos más grandes son más precisos pero más lentos. Base recomendado para 500 usuarios.",
+        "spoken_language": "Idioma Hablado",
+        "decoding_profile": "Perfil de Decodificación",
+        "profile_help": "Equilibrado usa la configuración estándar de Whisper. Rápido omite la re-decodificación y el texto previo como contexto; Preciso añade búsqueda por haz.",
+        "queued": "⏳ Esperando un trabajador (posición {position} en la cola)...",
+        "cancel_job": "⏹️ Cancelar Trabajo",
+        "job_cancelled": "Trabajo cancelado. Pulse Generar Informe de nuevo para reanudarlo.",
+        "job_interrupted": "La ejecución anterior se interrumpió. Pulse Generar Informe de nuevo para reanudar desde el último punto de control.",
+        "live_title": "🔴 Reunión en Vivo",
+        "live_source": "Fuente de audio en vivo",
+        "live_source_help": "Ruta de una grabación que aún se está escribiendo, o un puerto TCP local que recibe audio (PCM de 16 bits, mono, 16 kHz)",
+        "live_start": "▶️ Iniciar Transcripción en Vivo",
+        "live_waiting": "Esperando audio...",
+        "live_status": "🔴 En vivo: {audio} recibidos, transcripción confirmada hasta {committed}",
+        "deadline": "Tiempo Objetivo (minutos, 0 = sin límite)",
+        "deadline_help": "El planificador reduce el modelo, el perfil de decodificación y la profundidad del análisis hasta que el tiempo previsto encaje.",
+        "plan": "🧭 Plan de Procesamiento",
+        "predicted": "Previsto",
+        "actual": "Real",
+        "auto_detect": "Detectar automáticamente",
         "generate_report": "🚀 Generar Informe",
         "processing": "Procesando su reunión...",
         "step_transcribing": "Paso 1/6: Transcribiendo audio",
@@ -120,6 +205,25 @@ TRANSLATIONS = {
         "attendees": "Participants (séparés par des virgules)",
         "whisper_model": "Taille du Modèle Whisper",
         "model_help": "Les grands modèles sont plus précis mais plus lents. Base recommandé pour 500 utilisateurs.",
+        "spoken_language": "Langue Parlée",
+        "decoding_profile": "Profil de Décodage",
+        "profile_help": "Équilibré utilise les réglages standard de Whisper. Rapide évite le re-décodage et le contexte du texte précédent ; Précis ajoute la recherche en faisceau.",
+        "queued": "⏳ En attente d'un worker (position {position} dans la file)...",
+        "cancel_job": "⏹️ Annuler la Tâche",
+        "job_cancelled": "Tâche annulée. Cliquez à nouveau sur Générer le Rapport pour la reprendre.",
+        "job_interrupted": "L'exécution précédente a été interrompue. Cliquez à nouveau sur Générer le Rapport pour reprendre au dernier point de contrôle.",
+        "live_title": "🔴 Réunion en Direct",
+        "live_source": "Source audio en direct",
+        "live_source_help": "Chemin d'un enregistrement en cours d'écriture, ou port TCP local recevant l'audio (PCM 16 bits, mono, 16 kHz)",
+        "live_start": "▶️ Démarrer la Transcription en Direct",
+        "live_waiting": "En attente de l'audio...",
+        "live_status": "🔴 En direct : {audio} reçus, transcription validée jusqu'à {committed}",
+        "deadline": "Délai Cible (minutes, 0 = aucun)",
+        "deadline_help": "Le planificateur réduit le modèle, le profil de décodage et la profondeur d'analyse jusqu'à ce que le temps prévu convienne.",
+        "plan": "🧭 Plan de Traitement",
+        "predicted": "Prévu",
+        "actual": "Réel",
+        "auto_detect": "Détection automatique",
         "generate_report": "🚀 Générer le Rapport",
         "processing": "Traitement de votre réunion...",
         "step_transcribing": "Étape 1/6: Transcription audio",
@@ -159,6 +263,25 @@ TRANSLATIONS = {
         "attendees": "参与者（逗号分隔）",
         "whisper_model": "Whisper模型大小",
         "model_help": "较大的模型更准确但更慢。推荐使用Base模型支持500用户。",
+        "spoken_language": "会议语言",
+        "decoding_profile": "解码配置",
+        "profile_help": "均衡模式使用 Whisper 的标准设置。快速模式不重新解码，也不使用前文提示；精确模式增加束搜索。",
+        "queued": "⏳ 正在等待工作进程（队列第 {position} 位）...",
+        "cancel_job": "⏹️ 取消任务",
+        "job_cancelled": "任务已取消。再次点击生成报告即可继续。",
+        "job_interrupted": "上次运行被中断。再次点击生成报告即可从最后一个检查点继续。",
+        "live_title": "🔴 实时会议",
+        "live_source": "实时音频来源",
+        "live_source_help": "仍在写入的录音文件路径，或接收音频的本地 TCP 端口（16 kHz 单声道 16 位 PCM）",
+        "live_start": "▶️ 开始实时转录",
+        "live_waiting": "正在等待音频...",
+        "live_status": "🔴 实时：已接收 {audio}，转录已确定至 {committed}",
+        "deadline": "目标完成时间（分钟，0 = 不限）",
+        "deadline_help": "规划器会降低模型大小、解码配置和分析深度，直到预计时间满足要求。",
+        "plan": "🧭 处理计划",
+        "predicted": "预计",
+        "actual": "实际",
+        "auto_detect": "自动检测",
         "generate_report": "🚀 生成报告",
         "processing": "正在处理您的会议...",
         "step_transcribing": "步骤1/6：转录音频",
@@ -198,6 +321,25 @@ TRANSLATIONS = {
         "attendees": "Teilnehmer (durch Kommas getrennt)",
         "whisper_model": "Whisper-Modellgröße",
         "model_help": "Größere Modelle sind genauer, aber langsamer. Base empfohlen für 500 Benutzer.",
+        "spoken_language": "Gesprochene Sprache",
+        "decoding_profile": "Dekodierprofil",
+        "profile_help": "Ausgewogen nutzt Whispers Standardeinstellungen. Schnell verzichtet auf Neu-Dekodierung und den vorherigen Text als Kontext; Genau ergänzt Beam Search.",
+        "queued": "⏳ Warte auf einen Worker (Position {position} in der Warteschlange)...",
+        "cancel_job": "⏹️ Auftrag Abbrechen",
+        "job_cancelled": "Auftrag abgebrochen. Klicken Sie erneut auf Bericht Erstellen, um ihn fortzusetzen.",
+        "job_interrupted": "Der letzte Lauf wurde unterbrochen. Klicken Sie erneut auf Bericht Erstellen, um ab dem letzten Checkpoint fortzufahren.",
+        "live_title": "🔴 Live-Meeting",
+        "live_source": "Live-Audioquelle",
+        "live_source_help": "Pfad einer Aufnahme, die noch geschrieben wird, oder ein lokaler TCP-Port, der Audio empfängt (16 kHz Mono, 16-Bit-PCM)",
+        "live_start": "▶️ Live-Transkription Starten",
+        "live_waiting": "Warte auf Audio...",
+        "live_status": "🔴 Live: {audio} empfangen, Transkript bestätigt bis {committed}",
+        "deadline": "Zielzeit (Minuten, 0 = keine)",
+        "deadline_help": "Der Planer senkt Modellgröße, Dekodierprofil und Analysetiefe, bis die geschätzte Zeit passt.",
+        "plan": "🧭 Verarbeitungsplan",
+        "predicted": "Geschätzt",
+        "actual": "Tatsächlich",
+        "auto_detect": "Automatisch erkennen",
         "generate_report": "🚀 Bericht Erstellen",
         "processing": "Ihr Meeting wird verarbeitet...",
         "step_transcribing": "Schritt 1/6: Audio transkribieren",
@@ -237,6 +379,25 @@ TRANSLATIONS = {
         "attendees": "উপস্থিতি (কমা দ্বারা পৃথক)",
         "whisper_model": "Whisper মডেল আকার",
         "model_help": "বড় মডেল আরো নির্ভুল কিন্তু ধীর। ৫০০ ব্যবহারকারীর জন্য Base সুপারিশকৃত।",
+        "spoken_language": "কথ্য ভাষা",
+        "decoding_profile": "ডিকোডিং প্রোফাইল",
+        "profile_help": "ভারসাম্যপূর্ণ Whisper-এর স্ট্যান্ডার্ড সেটিংস ব্যবহার করে। দ্রুত পুনরায় ডিকোড করে না এবং আগের লেখা প্রম্পট হিসেবে ব্যবহার করে না; নির্ভুল বিম সার্চ যোগ করে।",
+        "queued": "⏳ একটি ওয়ার্কারের জন্য অপেক্ষা (সারিতে অবস্থান {position})...",
+        "cancel_job": "⏹️ কাজ বাতিল করুন",
+        "job_cancelled": "কাজ বাতিল হয়েছে। আবার শুরু করতে রিপোর্ট তৈরি করুন আবার ক্লিক করুন।",
+        "job_interrupted": "আগের রান বাধাগ্রস্ত হয়েছে। শেষ চেকপয়েন্ট থেকে চালিয়ে যেতে রিপোর্ট তৈরি করুন আবার ক্লিক করুন।",
+        "live_title": "🔴 লাইভ মিটিং",
+        "live_source": "লাইভ অডিও উৎস",
+        "live_source_help": "এখনও লেখা হচ্ছে এমন রেকর্ডিংয়ের পাথ, অথবা অডিও গ্রহণকারী লোকাল TCP পোর্ট (16 kHz মনো 16-বিট PCM)",
+        "live_start": "▶️ লাইভ ট্রান্সক্রিপশন শুরু করুন",
+        "live_waiting": "অডিওর জন্য অপেক্ষা করা হচ্ছে...",
+        "live_status": "🔴 লাইভ: {audio} প্রাপ্ত, {committed} পর্যন্ত ট্রান্সক্রিপ্ট নিশ্চিত",
+        "deadline": "লক্ষ্য সম্পন্ন সময় (মিনিট, ০ = নেই)",
+        "deadline_help": "পূর্বাভাসিত সময় না মেলা পর্যন্ত পরিকল্পক মডেল, ডিকোডিং প্রোফাইল ও বিশ্লেষণের গভীরতা কমায়।",
+        "plan": "🧭 প্রক্রিয়াকরণ পরিকল্পনা",
+        "predicted": "পূর্বাভাস",
+        "actual": "প্রকৃত",
+        "auto_detect": "স্বয়ংক্রিয় শনাক্তকরণ",
         "generate_report": "🚀 রিপোর্ট তৈরি করুন",
         "processing": "আপনার মিটিং প্রক্রিয়াকরণ হচ্ছে...",
         "step_transcribing": "ধাপ ১/৬: অডিও ট্রান্সক্রিপশন",
@@ -268,6 +429,375 @@ def t(key, lang="en"):
     return TRANSLATIONS.get(lang, TRANSLATIONS["en"]).get(key, key)
 
 
+# ============================================================
+# INSTRUMENTATION (Per-stage timing, JSON logs, Prometheus metrics)
+# ============================================================
+
+STAGE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+
+class JsonLogFormatter(logging.Formatter):
+    """Render log records as one JSON object per line"""
+    
+    def format(self, record):
+        payload = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "event": record.getMessage(),
+        }
+        payload.update(getattr(record, "fields", {}))
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+logger = logging.getLogger("meeting_transcriber")
+if not logger.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(JsonLogFormatter())
+    logger.addHandler(_log_handler)
+    logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+    logger.propagate = False
+
+def log_event(event, **fields):
+    """Emit a structured JSON log line"""
+    logger.info(event, extra={"fields": fields})
+
+@st.cache_resource
+def get_metrics():
+    """Create Prometheus metrics once per process; serve them if METRICS_PORT is set"""
+    if prometheus_client is None:
+        return None
+    
+    metrics = {
+        "stage_seconds": prometheus_client.Histogram(
+            "meeting_stage_seconds", "Wall time per pipeline stage", ["stage"], buckets=STAGE_BUCKETS),
+        "queue_wait_seconds": prometheus_client.Histogram(
+            "meeting_queue_wait_seconds", "Time a job waited before starting", buckets=STAGE_BUCKETS),
+        "model_load_seconds": prometheus_client.Histogram(
+            "meeting_model_load_seconds", "Time to load a model into memory", ["model"], buckets=STAGE_BUCKETS),
+        "realtime_factor": prometheus_client.Histogram(
+            "meeting_realtime_factor", "Processing time divided by audio duration",
+            buckets=(0.05, 0.1, 0.25, 0.5, 0.75, 1, 1.5, 2, 5, 10)),
+        "jobs_total": prometheus_client.Counter(
+            "meeting_jobs_total", "Finished jobs by outcome", ["status"]),
+        "audio_seconds_total": prometheus_client.Counter(
+            "meeting_audio_seconds_total", "Seconds of audio processed"),
+        "rss_bytes": prometheus_client.Gauge(
+            "meeting_process_rss_bytes", "Resident set size of this process"),
+    }
+    
+    port = os.environ.get("METRICS_PORT")
+    if port:
+        prometheus_client.start_http_server(int(port))
+        log_event("metrics_endpoint_started", port=int(port))
+    return metrics
+
+def process_rss_bytes():
+    """Current resident set size of this process"""
+    return psutil.Process().memory_info().rss
+
+def record_model_load(model_name, seconds):
+    """Log and record the time taken to load a model"""
+    metrics = get_metrics()
+    if metrics:
+        metrics["model_load_seconds"].labels(model=model_name).observe(seconds)
+    log_event("model_loaded", model=model_name, seconds=round(seconds, 3), rss_bytes=process_rss_bytes())
+
+PROFILE_DIR = os.environ.get("MEETING_PROFILE_DIR", "profiles")
+PROFILE_TOP_N = int(os.environ.get("MEETING_PROFILE_TOP_N", "25"))
+
+def profiling_enabled_by_env():
+    """Profiling is opt-in via MEETING_PROFILE=1"""
+    return os.environ.get("MEETING_PROFILE", "").lower() in ("1", "true", "yes")
+
+class JobProfiler:
+    """Wraps each stage of one job in cProfile and the torch profiler
+    
+    Writes <stage>.prof (cProfile), <stage>.torch.json (Chrome trace),
+    summary.txt (top-N hot functions per stage) and inputs.json to
+    PROFILE_DIR/<job_id>/.
+    """
+    
+    def __init__(self, job_id, output_dir=PROFILE_DIR, top_n=PROFILE_TOP_N):
+        self.output_dir = Path(output_dir) / job_id
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.top_n = top_n
+        self.summary_path = self.output_dir / "summary.txt"
+    
+    @contextmanager
+    def stage(self, name):
+        """Profile one stage and dump its results"""
+        import torch.profiler
+        
+        activities = [torch.profiler.ProfilerActivity.CPU]
+        if torch.cuda.is_available():
+            activities.append(torch.profiler.ProfilerActivity.CUDA)
+        
+        py_profiler = cProfile.Profile()
+        with torch.profiler.profile(activities=activities) as torch_profiler:
+            py_profiler.enable()
+            try:
+                yield
+            finally:
+                py_profiler.disable()
+        
+        py_profiler.dump_stats(self.output_dir / f"{name}.prof")
+        torch_profiler.export_chrome_trace(str(self.output_dir / f"{name}.torch.json"))
+        
+        with open(self.summary_path, "a", encoding="utf-8") as f:
+            f.write(f"{'='*70}\nSTAGE: {name}\n{'='*70}\n\n")
+            f.write(f"Python hot functions (top {self.top_n} by cumulative time)\n")
+            pstats.Stats(py_profiler, stream=f).sort_stats("cumulative").print_stats(self.top_n)
+            if torch_profiler.key_averages():
+                f.write(f"Torch operators (top {self.top_n} by self CPU time)\n")
+                f.write(torch_profiler.key_averages().table(sort_by="self_cpu_time_total", row_limit=self.top_n))
+                f.write("\n\n")
+    
+    def record_inputs(self, **sizes):
+        """Save the job's input sizes next to the profile dumps"""
+        with open(self.output_dir / "inputs.json", "w", encoding="utf-8") as f:
+            json.dump(sizes, f, indent=2, default=str)
+
+class JobInstrumentation:
+    """Times the stages of one job and reports them as JSON logs and metrics"""
+    
+    def __init__(self, job_id=None, queued_at=None, profile=None):
+        self.job_id = job_id or uuid.uuid4().hex
+        self.queued_at = queued_at
+        self.timings = {}
+        self.queue_wait = None
+        self.started_at = None
+        self.metrics = get_metrics()
+        
+        if profile is None:
+            profile = profiling_enabled_by_env()
+        self.profiler = JobProfiler(self.job_id) if profile else None
+    
+    def start(self):
+        """Mark the end of queueing and the start of processing"""
+        self.started_at = time.time()
+        if self.queued_at is not None:
+            self.queue_wait = max(0.0, self.started_at - self.queued_at)
+            if self.metrics:
+                self.metrics["queue_wait_seconds"].observe(self.queue_wait)
+        log_event("job_started", job_id=self.job_id, queue_wait_seconds=self.queue_wait)
+    
+    @contextmanager
+    def stage(self, name):
+        """Time a pipeline stage (and profile it when profiling is on)"""
+        started = time.perf_counter()
+        try:
+            if self.profiler:
+                with self.profiler.stage(name):
+                    yield
+            else:
+                yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed
+            rss = process_rss_bytes()
+            if self.metrics:
+                self.metrics["stage_seconds"].labels(stage=name).observe(elapsed)
+                self.metrics["rss_bytes"].set(rss)
+            log_event("stage_finished", job_id=self.job_id, stage=name,
+                      seconds=round(elapsed, 3), rss_bytes=rss)
+    
+    def finish(self, status, audio_seconds=None):
+        """Record the outcome, total time and real-time factor of the job"""
+        processing_seconds = time.time() - (self.started_at or time.time())
+        rtf = processing_seconds / audio_seconds if audio_seconds else None
+        if self.metrics:
+            self.metrics["jobs_total"].labels(status=status).inc()
+            if audio_seconds:
+                self.metrics["audio_seconds_total"].inc(audio_seconds)
+                self.metrics["realtime_factor"].observe(rtf)
+        log_event("job_finished", job_id=self.job_id, status=status,
+                  processing_seconds=round(processing_seconds, 3), audio_seconds=audio_seconds,
+                  realtime_factor=round(rtf, 3) if rtf is not None else None,
+                  queue_wait_seconds=self.queue_wait,
+                  stages={k: round(v, 3) for k, v in self.timings.items()},
+                  rss_bytes=process_rss_bytes(),
+                  profile_dir=str(self.profiler.output_dir) if self.profiler else None)
+        return rtf
+
+
+# ============================================================
+# MODEL BUNDLE (Offline, versioned model directory)
+# ============================================================
+
+# Directory written by download-models-script.py (usually <output>/current).
+# When set, every model is read from it and nothing is downloaded.
+MODEL_BUNDLE = os.environ.get("MODEL_BUNDLE")
+
+class ModelBundle:
+    """A versioned bundle of Whisper checkpoints and HuggingFace models with a manifest"""
+    
+    def __init__(self, path):
+        # Resolve once so a "current" symlink flipped by a rebuild cannot mix versions
+        self.path = Path(path).resolve()
+        manifest_path = self.path / "manifest.json"
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"{manifest_path} not found; build the bundle with download-models-script.py")
+        with open(manifest_path, encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.version = self.manifest["version"]
+    
+    def whisper_root(self, model_size):
+        """Directory holding the checkpoint, for whisper.load_model(download_root=...)"""
+        entry = self.manifest["whisper"].get(model_size)
+        if entry is None:
+            raise FileNotFoundError(f"Whisper model '{model_size}' is not in model bundle {self.version}")
+        return str((self.path / entry["path"]).parent)
+    
+    def huggingface_path(self, model_id):
+        """Local directory of a HuggingFace model, usable wherever the model id is"""
+        entry = self.manifest["huggingface"].get(model_id)
+        if entry is None:
+            raise FileNotFoundError(f"Model '{model_id}' is not in model bundle {self.version}")
+        return str(self.path / entry["path"])
+
+@st.cache_resource
+def get_model_bundle():
+    """The configured model bundle (one per process), or None to use the download caches"""
+    if not MODEL_BUNDLE:
+        return None
+    bundle = ModelBundle(MODEL_BUNDLE)
+    log_event("model_bundle_loaded", path=str(bundle.path), version=bundle.version)
+    return bundle
+
+def load_whisper_checkpoint(model_size, device=None):
+    """whisper.load_model(), reading from the model bundle when one is configured
+    
+    Whisper re-checks the checkpoint's SHA-256 and would download it again
+    on a mismatch, so a missing or corrupt bundle file fails here instead.
+    """
+    bundle = get_model_bundle()
+    if bundle is None or os.path.isfile(model_size):
+        return whisper.load_model(model_size, device=device)
+    root = bundle.whisper_root(model_size)
+    if not (Path(root) / os.path.basename(whisper._MODELS[model_size])).exists():
+        raise FileNotFoundError(f"Whisper checkpoint for '{model_size}' is missing from {root}")
+    return whisper.load_model(model_size, device=device, download_root=root)
+
+def model_source(model_id):
+    """What to pass to from_pretrained()/pipeline() for a model id: its bundle directory or the id"""
+    bundle = get_model_bundle()
+    return bundle.huggingface_path(model_id) if bundle else model_id
+
+def derived_model_name(name):
+    """Cache directory name for files derived from a model (mmap and ONNX exports)
+    
+    Includes the bundle version, so a rebuilt bundle gets fresh exports
+    instead of reusing ones made from the previous weights.
+    """
+    bundle = get_model_bundle()
+    name = name.replace("/", "--")
+    return f"{name}--bundle-{bundle.version}" if bundle else name
+
+
+# ============================================================
+# SHARED MODEL WEIGHTS (Memory-mapped across worker processes)
+# ============================================================
+
+# Each model is exported once as an fp32 torch file here; every process then
+# memory-maps it read-only, so N workers on one host share one copy of the
+# weights in the page cache instead of holding N private copies.
+SHARED_WEIGHTS_DIR = os.environ.get(
+    "SHARED_WEIGHTS_DIR", os.path.join(tempfile.gettempdir(), "meeting-transcriber", "weights")
+)
+
+SHARED_PIPELINE_MODELS = {
+    "summarization": AutoModelForSeq2SeqLM,
+    "question-answering": AutoModelForQuestionAnswering,
+    "zero-shot-classification": AutoModelForSequenceClassification,
+}
+
+def shared_weights_enabled():
+    """True when models should be loaded from memory-mapped files in SHARED_WEIGHTS_DIR"""
+    return os.environ.get("SHARED_WEIGHTS", "").lower() in ("1", "true", "yes")
+
+@contextmanager
+def empty_parameters():
+    """Build modules with parameters on the meta device (no memory, no init)
+    
+    Buffers stay real, so values computed at construction (sinusoids,
+    position ids, Whisper's alignment heads) survive; the parameters are
+    then swapped for memory-mapped tensors by load_shared_weights().
+    """
+    register_parameter = torch.nn.Module.register_parameter
+    
+    def register_on_meta(module, name, param):
+        register_parameter(module, name, param)
+        if param is not None:
+            module._parameters[name] = torch.nn.Parameter(param.to("meta"), requires_grad=False)
+    
+    torch.nn.Module.register_parameter = register_on_meta
+    try:
+        yield
+    finally:
+        torch.nn.Module.register_parameter = register_parameter
+
+def save_shared_weights(path, model, **metadata):
+    """Write the model's state dict as fp32 (written once, then only mapped)"""
+    state_dict = {
+        name: tensor.detach().cpu().float() if tensor.is_floating_point() else tensor.detach().cpu()
+        for name, tensor in model.state_dict().items()
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    torch.save({"metadata": metadata, "state_dict": state_dict}, tmp_path)
+    os.replace(tmp_path, path)
+
+def load_shared_weights(model, path):
+    """Point the model's parameters at a memory-mapped copy of the file
+    
+    Pages are mapped copy-on-write and never written by inference, so they
+    stay shared between every process that maps the same file.
+    """
+    checkpoint = torch.load(path, mmap=True, weights_only=True, map_location="cpu")
+    model.load_state_dict(checkpoint["state_dict"], assign=True)
+    return model.eval()
+
+def load_whisper_shared(model_size):
+    """Whisper model whose weights are mapped from SHARED_WEIGHTS_DIR (exported on first use)"""
+    path = Path(SHARED_WEIGHTS_DIR) / f"{derived_model_name('whisper-' + Path(model_size).stem)}.pt"
+    if not path.exists():
+        model = load_whisper_checkpoint(model_size, device="cpu")
+        save_shared_weights(path, model, dims=vars(model.dims))
+        del model
+    
+    dims = torch.load(path, mmap=True, weights_only=True)["metadata"]["dims"]
+    with empty_parameters():
+        model = whisper.model.Whisper(whisper.model.ModelDimensions(**dims))
+    load_shared_weights(model, path)
+    if model_size in whisper._ALIGNMENT_HEADS:
+        model.set_alignment_heads(whisper._ALIGNMENT_HEADS[model_size])
+    # On a GPU the weights are copied to device memory anyway
+    return model.to("cuda") if torch.cuda.is_available() else model
+
+def load_pipeline_shared(task, model_id):
+    """HuggingFace pipeline whose weights are mapped from SHARED_WEIGHTS_DIR (exported on first use)"""
+    model_dir = Path(SHARED_WEIGHTS_DIR) / derived_model_name(model_id)
+    if not model_dir.exists():
+        original = pipeline(task, model=model_source(model_id))
+        tmp_dir = model_dir.with_name(f"{model_dir.name}.{uuid.uuid4().hex}.tmp")
+        original.model.config.save_pretrained(tmp_dir)
+        original.tokenizer.save_pretrained(tmp_dir)
+        if original.model.can_generate():
+            original.model.generation_config.save_pretrained(tmp_dir)
+        save_shared_weights(tmp_dir / "weights.pt", original.model)
+        del original
+        try:
+            os.replace(tmp_dir, model_dir)
+        except OSError:  # Another process finished exporting first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    with empty_parameters():
+        model = SHARED_PIPELINE_MODELS[task].from_config(AutoConfig.from_pretrained(model_dir))
+    load_shared_weights(model, model_dir / "weights.pt")
+    if (model_dir / "generation_config.json").exists():
+        model.generation_config = GenerationConfig.from_pretrained(model_dir)
+    return pipeline(task, model=model, tokenizer=AutoTokenizer.from_pretrained(model_dir))
+
+
 # ============================================================
 # OPTIMIZED TRANSCRIPTION MODULE (For Concurrent Users)
 # ============================================================
@@ -275,26 +805,412 @@ def t(key, lang="en"):
 @st.cache_resource
 def load_whisper_model(model_size="base"):
     """Load and cache Whisper model - shared across users"""
-    return whisper.load_model(model_size)
+    started = time.perf_counter()
+    if shared_weights_enabled():
+        model = load_whisper_shared(model_size)
+    else:
+        model = load_whisper_checkpoint(model_size)
+    record_model_load(f"whisper-{model_size}", time.perf_counter() - started)
+    return model
+
+# Decoded 16 kHz PCM is cached here as .npy files named by content hash
+AUDIO_CACHE_DIR = os.environ.get(
+    "AUDIO_CACHE_DIR", os.path.join(tempfile.gettempdir(), "meeting-transcriber", "pcm")
+)
+
+# Recordings longer than this are transcribed window by window ("auto" mode)
+WINDOWED_DECODE_MIN_SECONDS = float(os.environ.get("WINDOWED_DECODE_MIN_SECONDS", "600"))
+
+DECODE_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Sizes that ship an English-only ".en" checkpoint (faster and more accurate on English)
+ENGLISH_ONLY_SIZES = ("tiny", "base", "small", "medium")
+
+# Named sets of model.transcribe() options. Each temperature after the first
+# re-decodes a 30 s window that failed the compression/logprob thresholds;
+# condition_on_previous_text feeds earlier text back as a prompt, which is
+# more coherent but can get stuck repeating itself on noisy audio.
+# "balanced" (the default) is exactly what model.transcribe() does without
+# options; "fast" trades accuracy for speed and has to be chosen explicitly.
+DECODING_PROFILES = {
+    "fast": {
+        "beam_size": None,
+        "best_of": None,
+        "temperature": (0.0,),
+        "compression_ratio_threshold": 2.4,
+        "logprob_threshold": -1.0,
+        "no_speech_threshold": 0.6,
+        "condition_on_previous_text": False,
+        "fp16": True,
+    },
+    "balanced": {
+        "beam_size": None,
+        "best_of": None,
+        "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+        "compression_ratio_threshold": 2.4,
+        "logprob_threshold": -1.0,
+        "no_speech_threshold": 0.6,
+        "condition_on_previous_text": True,
+        "fp16": True,
+    },
+    "accurate": {
+        "beam_size": 5,
+        "best_of": 5,
+        "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+        "compression_ratio_threshold": 2.4,
+        "logprob_threshold": -1.0,
+        "no_speech_threshold": 0.6,
+        "condition_on_previous_text": True,
+        "fp16": False,
+    },
+}
+
+DEFAULT_DECODING_PROFILE = "balanced"
+
+def count_fallbacks(segments, temperatures):
+    """Re-decodes Whisper needed, from the temperature each 30 s window settled on
+    
+    Returns (windows that fell back, total extra decoding passes).
+    """
+    window_temperatures = {segment["seek"]: segment["temperature"] for segment in segments}
+    ladder = list(temperatures)
+    passes = [ladder.index(temp) if temp in ladder else 0 for temp in window_temperatures.values()]
+    return sum(1 for p in passes if p), sum(passes)
+
+def decode_to_npy(audio_path, npy_path):
+    """Stream ffmpeg's 16 kHz s16 output into a float32 .npy without holding it in RAM
+    
+    Same ffmpeg invocation and int16 -> float32 scaling as whisper.load_audio.
+    """
+    cmd = [
+        "ffmpeg", "-nostdin", "-threads", "0", "-i", str(audio_path),
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le",
+        "-ar", str(whisper.audio.SAMPLE_RATE), "-"
+    ]
+    with tempfile.TemporaryFile() as raw, tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        while chunk := process.stdout.read(DECODE_CHUNK_BYTES):
+            raw.write(chunk)
+        process.stdout.close()
+        if process.wait() != 0:
+            stderr.seek(0)
+            raise RuntimeError(f"Failed to load audio: {stderr.read().decode(errors='replace')}")
+        
+        num_samples = raw.tell() // 2
+        out = np.lib.format.open_memmap(npy_path, mode="w+", dtype=np.float32, shape=(num_samples,))
+        raw.seek(0)
+        offset = 0
+        while chunk := raw.read(DECODE_CHUNK_BYTES):
+            samples = np.frombuffer(chunk, np.int16).astype(np.float32) / 32768.0
+            out[offset:offset + len(samples)] = samples
+            offset += len(samples)
+        out.flush()
+        del out
+
+class WindowedAudio:
+    """Marks a waveform for window-by-window transcription
+    
+    whisper.transcribe normally builds the log-Mel spectrogram of the whole
+    recording up front (plus a padded copy of the waveform). Passing a
+    WindowedAudio instead makes it read 30 s windows lazily through
+    WindowedLogMel, so peak memory no longer grows with meeting length.
+    """
+    
+    def __init__(self, samples):
+        self.samples = samples
+        self._log_mels = {}
+    
+    def __len__(self):
+        return len(self.samples)
+    
+    def windowed_log_mel(self, n_mels, padding):
+        # Reused across calls (e.g. checkpointed spans) to skip the global-max pass
+        if (n_mels, padding) not in self._log_mels:
+            self._log_mels[n_mels, padding] = WindowedLogMel(self.samples, n_mels, padding)
+        return self._log_mels[n_mels, padding]
+
+class WindowedLogMel:
+    """Lazy stand-in for the (n_mels, n_frames) tensor whisper.transcribe slices
+    
+    Frames are computed on demand from the (memory-mapped) waveform with the
+    same STFT framing, reflect padding and global-max clamp as
+    whisper.log_mel_spectrogram, so decoding sees the same input windows and
+    produces the same segments as whole-file mode. The global maximum needs
+    one streaming pass over the audio when the object is created.
+    """
+    
+    ndim = 2
+    
+    def __init__(self, samples, n_mels, padding):
+        if padding <= whisper.audio.N_FFT // 2:
+            raise ValueError("WindowedLogMel needs at least N_FFT/2 samples of padding")
+        self.samples = samples
+        self.signal_length = len(samples) + padding
+        self.shape = (n_mels, self.signal_length // whisper.audio.HOP_LENGTH)
+        self.window = torch.hann_window(whisper.audio.N_FFT)
+        self.filters = whisper.audio.mel_filters("cpu", n_mels)
+        
+        self.log_max = max(
+            self._log_spec(start, min(start + whisper.audio.N_FRAMES, self.shape[1])).max().item()
+            for start in range(0, self.shape[1], whisper.audio.N_FRAMES)
+        )
+    
+    def _signal(self, lo, hi):
+        """Samples [lo, hi) of the zero-padded waveform, reflected at the start like torch.stft"""
+        n = len(self.samples)
+        out = np.zeros(hi - lo, dtype=np.float32)
+        a, b = max(lo, 0), min(hi, n)
+        if a < b:
+            out[a - lo:b - lo] = self.samples[a:b]
+        if lo < 0:
+            # Reflect padding excludes the edge sample: x[-j] = x[j]
+            reflected = np.zeros(-lo, dtype=np.float32)
+            available = self.samples[1:min(-lo, n - 1) + 1]
+            reflected[:len(available)] = available
+            out[:-lo] = reflected[::-1]
+        # The tail is always zero padding, so its reflection is zero as well
+        return torch.from_numpy(out)
+    
+    def _log_spec(self, start, stop):
+        """Un-normalized log10 Mel energies for frames [start, stop)"""
+        hop, half = whisper.audio.HOP_LENGTH, whisper.audio.N_FFT // 2
+        signal = self._signal(start * hop - half, (stop - 1) * hop + half)
+        stft = torch.stft(signal, whisper.audio.N_FFT, hop, window=self.window,
+                          center=False, return_complex=True)
+        mel_spec = self.filters @ (stft.abs() ** 2)
+        return torch.clamp(mel_spec, min=1e-10).log10()
+    
+    def __getitem__(self, key):
+        frames = key[-1] if isinstance(key, tuple) else slice(None)
+        start, stop, _ = frames.indices(self.shape[1])
+        if stop <= start:
+            return torch.zeros((self.shape[0], 0))
+        log_spec = self._log_spec(start, stop)
+        log_spec = torch.maximum(log_spec, torch.tensor(self.log_max - 8.0))
+        return (log_spec + 4.0) / 4.0
+    
+    def take(self, indices, axis=-1):
+        """numpy-style take along the frame axis (used by whisper.pad_or_trim)"""
+        return self[:, indices.start:indices.stop]
+    
+    def to(self, *args, **kwargs):
+        return self[:, :].to(*args, **kwargs)
+
+# whisper.transcribe builds the spectrogram through this module-level name
+_whisper_transcribe_module = importlib.import_module("whisper.transcribe")
+_whole_file_log_mel = _whisper_transcribe_module.log_mel_spectrogram
+_windowed_decodes = 0
+_windowed_decodes_lock = threading.Lock()
+
+def _log_mel_dispatch(audio, n_mels=80, padding=0, *args, **kwargs):
+    if isinstance(audio, WindowedAudio):
+        return audio.windowed_log_mel(n_mels, padding)
+    return _whole_file_log_mel(audio, n_mels, padding, *args, **kwargs)
+
+@contextmanager
+def windowed_log_mel():
+    """Let whisper.transcribe read WindowedAudio through WindowedLogMel
+    
+    The hook is installed only while at least one windowed decode runs and
+    removed after the last one, so whole-file transcriptions use Whisper's
+    own spectrogram code whenever none is running (and pass straight
+    through to it while one is).
+    """
+    global _windowed_decodes
+    with _windowed_decodes_lock:
+        if _windowed_decodes == 0:
+            _whisper_transcribe_module.log_mel_spectrogram = _log_mel_dispatch
+        _windowed_decodes += 1
+    try:
+        yield
+    finally:
+        with _windowed_decodes_lock:
+            _windowed_decodes -= 1
+            if _windowed_decodes == 0:
+                _whisper_transcribe_module.log_mel_spectrogram = _whole_file_log_mel
 
 class AudioTranscriber:
     """Handles audio transcription with progress tracking"""
     
     @staticmethod
-    def transcribe(audio_path, model_size="base", progress_callback=None):
-        """Transcribe with progress updates"""
-        model = load_whisper_model(model_size)
+    def content_hash(audio_path, chunk_size=1024 * 1024):
+        """SHA-256 of the file contents, read in chunks"""
+        digest = hashlib.sha256()
+        with open(audio_path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def load_audio(audio_path, digest=None):
+        """Decode to 16 kHz mono float32 once, then memory-map the cached PCM
+        
+        Retries, other model sizes and concurrent jobs on the same recording
+        skip ffmpeg and share the decoded pages through the OS page cache.
+        """
+        digest = digest or AudioTranscriber.content_hash(audio_path)
+        cache_path = Path(AUDIO_CACHE_DIR) / f"{digest}.npy"
+        
+        if not cache_path.exists():
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write under a unique name and rename so readers never see a partial file
+            tmp_path = cache_path.with_name(f"{digest}.{uuid.uuid4().hex}.tmp.npy")
+            try:
+                decode_to_npy(audio_path, tmp_path)
+                os.replace(tmp_path, cache_path)
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+        
+        return np.load(cache_path, mmap_mode="r")
+    
+    @staticmethod
+    def cached_language(digest):
+        """Language detected earlier for this content hash, or None"""
+        if not digest:
+            return None
+        try:
+            return (Path(AUDIO_CACHE_DIR) / f"{digest}.lang").read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+    
+    @staticmethod
+    def cache_language(digest, language):
+        cache_path = Path(AUDIO_CACHE_DIR) / f"{digest}.lang"
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{digest}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(language, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    
+    @staticmethod
+    def route(model_size, language=None, digest=None):
+        """Pick (model_name, language, source) for a job before any decoding
+        
+        A language hint wins; without one ("auto"/None) a language detected
+        earlier for the same content hash is reused. Known-English jobs run on
+        the ".en" checkpoint. language is None when it still has to be detected.
+        """
+        source = "hint"
+        if language in (None, "auto"):
+            language, source = AudioTranscriber.cached_language(digest), "cache"
+        if language is None:
+            return model_size, None, "detected"
+        if language == "en" and model_size in ENGLISH_ONLY_SIZES:
+            return f"{model_size}.en", language, source
+        return model_size, language, source
+    
+    @staticmethod
+    def detect_language(model, audio):
+        """Most likely language of the first 30 s, with a multilingual model"""
+        segment = whisper.pad_or_trim(np.asarray(audio[:whisper.audio.N_SAMPLES], dtype=np.float32))
+        mel = whisper.log_mel_spectrogram(segment, model.dims.n_mels).to(model.device)
+        _, probs = model.detect_language(mel)
+        return max(probs, key=probs.get)
+    
+    @staticmethod
+    def transcribe(audio, model_size="base", progress_callback=None, windowed="auto",
+                   language=None, digest=None, decoding_profile=DEFAULT_DECODING_PROFILE,
+                   checkpoint=None):
+        """Transcribe a file path or decoded waveform with progress updates
+        
+        A file path is decoded through load_audio (once, into the PCM cache).
+        windowed=True feeds a decoded waveform to Whisper in 30 s windows
+        (bounded memory, same segments); "auto" does so for recordings longer
+        than WINDOWED_DECODE_MIN_SECONDS.
+        
+        language is a per-job hint (an ISO code, or "auto"/None); see route().
+        When it has to be detected, that happens once on the multilingual model
+        and is cached under digest, so later runs on the same recording skip
+        detection and can use the ".en" checkpoint.
+        
+        decoding_profile names an entry of DECODING_PROFILES.
+        
+        With a JobCheckpoint, the recording is transcribed in
+        TRANSCRIBE_SPAN_SECONDS spans saved as they finish, so an interrupted
+        run resumes after the last saved span (see _transcribe_spans).
+        """
+        options = DECODING_PROFILES[decoding_profile]
+        if isinstance(audio, str):
+            digest = digest or AudioTranscriber.content_hash(audio)
+        model_name, language, source = AudioTranscriber.route(model_size, language, digest)
+        model = load_whisper_model(model_name)
         
         if progress_callback:
             progress_callback(0.3, "Loading audio file...")
         
-        result = model.transcribe(audio_path, verbose=False)
+        if isinstance(audio, str):
+            # The cached memory-mapped PCM, not a fresh in-RAM decode by whisper.load_audio
+            audio = AudioTranscriber.load_audio(audio, digest)
+        
+        if language is None:
+            language = AudioTranscriber.detect_language(model, audio)
+            if digest:
+                AudioTranscriber.cache_language(digest, language)
+        
+        if windowed == "auto":
+            windowed = len(audio) > WINDOWED_DECODE_MIN_SECONDS * whisper.audio.SAMPLE_RATE
+        if windowed:
+            audio = WindowedAudio(audio)
+        
+        with windowed_log_mel() if windowed else nullcontext():
+            if checkpoint:
+                result = AudioTranscriber._transcribe_spans(model, audio, language, options, checkpoint,
+                                                            progress_callback)
+            else:
+                result = model.transcribe(audio, verbose=False, language=language, **options)
+        result["language"] = language
+        result["language_source"] = source
+        result["model"] = model_name
+        result["decoding_profile"] = decoding_profile
+        result["fallback_windows"], result["fallback_decodes"] = count_fallbacks(
+            result["segments"], options["temperature"]
+        )
         
         if progress_callback:
             progress_callback(1.0, "Transcription complete")
         
         return result
     
+    @staticmethod
+    def _transcribe_spans(model, audio, language, options, checkpoint, progress_callback=None):
+        """Transcribe span by span, checkpointing the segments after each span
+        
+        A span's last segment may be cut off at the clip boundary, so it is
+        dropped and the next span starts at that segment's start instead.
+        With condition_on_previous_text, the text kept so far is passed on as
+        the next span's prompt.
+        """
+        duration = len(audio) / whisper.audio.SAMPLE_RATE
+        partial = checkpoint.load("transcribe_partial") or {"segments": [], "resume_at": 0.0}
+        segments, start = partial["segments"], partial["resume_at"]
+        
+        while start < duration:
+            checkpoint.raise_if_cancelled()
+            end = min(start + TRANSCRIBE_SPAN_SECONDS, duration)
+            prompt = None
+            if options["condition_on_previous_text"] and segments:
+                prompt = "".join(segment["text"] for segment in segments[-8:])
+            
+            span = model.transcribe(audio, verbose=False, language=language, clip_timestamps=[start, end],
+                                    initial_prompt=prompt, **options)["segments"]
+            next_start = end
+            if end < duration and len(span) > 1 and span[-1]["start"] > start:
+                next_start = span[-1]["start"]
+                span = span[:-1]
+            
+            segments.extend(span)
+            start = next_start
+            checkpoint.save("transcribe_partial", {"segments": segments, "resume_at": start},
+                            resume_at=round(start, 2))
+            if progress_callback:
+                progress_callback(0.3 + 0.7 * min(start / duration, 1.0),
+                                  f"Transcribed {AudioTranscriber.format_timestamp(start)}")
+        
+        for i, segment in enumerate(segments):
+            segment["id"] = i
+        return {"text": "".join(segment["text"] for segment in segments), "segments": segments,
+                "language": language}
+    
     @staticmethod
     def format_timestamp(seconds):
         """Convert seconds to HH:MM:SS format"""
@@ -310,34 +1226,129 @@ class AudioTranscriber:
 # OPTIMIZED AI ANALYSIS MODULE
 # ============================================================
 
+ANALYSIS_MODELS = {
+    "summarization": "facebook/bart-large-cnn",
+    "question-answering": "distilbert-base-cased-distilled-squad",
+    "zero-shot-classification": "facebook/bart-large-mnli",
+}
+
+# "torch" runs the pipelines in eager PyTorch, "onnx" on ONNX Runtime's CPU provider
+ANALYSIS_BACKEND = os.environ.get("ANALYSIS_BACKEND", "torch")
+
+# ONNX exports of the analysis models, written once per model
+ONNX_CACHE_DIR = os.environ.get("ONNX_CACHE_DIR", os.path.join(tempfile.gettempdir(), "meeting-transcriber", "onnx"))
+
+ONNX_MODEL_CLASSES = {
+    "summarization": "ORTModelForSeq2SeqLM",
+    "question-answering": "ORTModelForQuestionAnswering",
+    "zero-shot-classification": "ORTModelForSequenceClassification",
+}
+
+def load_pipeline_onnx(task, model_id):
+    """HuggingFace pipeline running on ONNX Runtime (exported to ONNX_CACHE_DIR on first use)"""
+    try:
+        # Imported on first use: optimum pulls in the whole ONNX exporter stack
+        ort_models = importlib.import_module("optimum.onnxruntime")
+        onnxruntime = importlib.import_module("onnxruntime")
+    except ImportError:
+        raise RuntimeError("ANALYSIS_BACKEND=onnx needs optimum with ONNX Runtime: pip install optimum[onnxruntime]")
+    model_class = getattr(ort_models, ONNX_MODEL_CLASSES[task])
+    
+    export_dir = Path(ONNX_CACHE_DIR) / derived_model_name(model_id)
+    if not export_dir.exists():
+        tmp_dir = export_dir.with_name(f"{export_dir.name}.{uuid.uuid4().hex}.tmp")
+        model_class.from_pretrained(model_source(model_id), export=True).save_pretrained(tmp_dir)
+        AutoTokenizer.from_pretrained(model_source(model_id)).save_pretrained(tmp_dir)
+        try:
+            os.replace(tmp_dir, export_dir)
+        except OSError:  # Another process finished exporting first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    # ONNX Runtime keeps its own thread pool; size it to this process's share of the host
+    session_options = onnxruntime.SessionOptions()
+    session_options.intra_op_num_threads = get_cpu_governor().cores
+    model = model_class.from_pretrained(export_dir, provider="CPUExecutionProvider", session_options=session_options)
+    return pipeline(task, model=model, tokenizer=AutoTokenizer.from_pretrained(export_dir))
+
 @st.cache_resource
-def load_ai_models():
+def load_ai_models(backend=None):
     """Load and cache all AI models - shared across users"""
-    summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
-    qa_model = pipeline("question-answering", model="distilbert-base-cased-distilled-squad")
-    classifier = pipeline("zero-shot-classification", model="facebook/bart-large-mnli")
+    backend = backend or ANALYSIS_BACKEND
+    started = time.perf_counter()
+    if backend == "onnx":
+        load = load_pipeline_onnx
+    elif shared_weights_enabled():
+        load = load_pipeline_shared
+    else:
+        load = lambda task, model_id: pipeline(task, model=model_source(model_id))
+    summarizer, qa_model, classifier = (load(task, model_id) for task, model_id in ANALYSIS_MODELS.items())
+    record_model_load(f"analysis-pipelines-{backend}", time.perf_counter() - started)
     return summarizer, qa_model, classifier
 
+# Whisper sizes loaded in the background at startup, e.g. "base,base.en"
+# (the analysis pipelines are warmed too); empty disables warm-up
+WARMUP_MODELS = tuple(size.strip() for size in os.environ.get("WARMUP_MODELS", "").split(",") if size.strip())
+
+@st.cache_resource
+def start_model_warmup(model_sizes=WARMUP_MODELS):
+    """Load models on a background thread, once per process
+    
+    The loaders are cached resources, so the first job just picks up the
+    warm models; a job that arrives mid-load waits for that load instead
+    of starting a second one.
+    """
+    def warm():
+        started = time.perf_counter()
+        try:
+            for model_size in model_sizes:
+                load_whisper_model(model_size)
+            load_ai_models()
+        except Exception as e:
+            log_event("model_warmup_failed", error=str(e))
+            return
+        log_event("model_warmup_finished", models=list(model_sizes),
+                  seconds=round(time.perf_counter() - started, 3))
+    
+    thread = threading.Thread(target=warm, name="model-warmup", daemon=True)
+    thread.start()
+    return thread
+
+ACTION_PRIORITY_ORDER = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
+
 class MeetingAnalyzer:
-    """Analyzes meeting transcripts with caching"""
+    """Analyzes meeting transcripts with caching
+    
+    backend picks the runtime for the three pipelines ("torch" or "onnx";
+    default: ANALYSIS_BACKEND). Both give the same interface and outputs.
+    """
     
-    def __init__(self):
-        self.summarizer, self.qa_model, self.classifier = load_ai_models()
+    def __init__(self, backend=None):
+        self.summarizer, self.qa_model, self.classifier = load_ai_models(backend)
+        # Model calls made so far, for throughput estimates (see ThroughputModel)
+        self.calls = {"summarizer": 0, "qa": 0, "classifier": 0}
     
-    def summarize_text(self, text, max_length=150, progress_callback=None):
-        """Generate summary with chunking for long texts"""
+    def summarize_text(self, text, max_length=150, progress_callback=None, max_chunks=None):
+        """Generate summary with chunking for long texts
+        
+        max_chunks caps the summarizer calls by summarizing evenly spaced
+        chunks only (see SUMMARY_MODES).
+        """
         chunk_size = 1024
         chunks = [text[i:i+chunk_size] for i in range(0, len(text), chunk_size)]
+        chunks = [chunk for chunk in chunks if len(chunk.split()) > 50]
+        if max_chunks and len(chunks) > max_chunks:
+            step = len(chunks) / max_chunks
+            chunks = [chunks[int(i * step)] for i in range(max_chunks)]
         
         summaries = []
         for i, chunk in enumerate(chunks):
-            if len(chunk.split()) > 50:
-                if progress_callback:
-                    progress = (i + 1) / len(chunks)
-                    progress_callback(progress, f"Summarizing chunk {i+1}/{len(chunks)}")
-                
-                summary = self.summarizer(chunk, max_length=max_length, min_length=30, do_sample=False)
-                summaries.append(summary[0]["summary_text"])
+            if progress_callback:
+                progress = (i + 1) / len(chunks)
+                progress_callback(progress, f"Summarizing chunk {i+1}/{len(chunks)}")
+            
+            self.calls["summarizer"] += 1
+            summary = self.summarizer(chunk, max_length=max_length, min_length=30, do_sample=False)
+            summaries.append(summary[0]["summary_text"])
         
         return " ".join(summaries)
     
@@ -361,6 +1372,7 @@ class MeetingAnalyzer:
                 progress_callback(progress, f"Extracting: {key}")
             
             try:
+                self.calls["qa"] += 1
                 answer = self.qa_model(question=question, context=context)
                 insights[key] = answer["answer"] if answer["score"] > 0.1 else "Not clearly identified"
             except:
@@ -368,8 +1380,8 @@ class MeetingAnalyzer:
         
         return insights
     
-    def extract_action_items(self, text, progress_callback=None):
-        """Extract and prioritize action items"""
+    def extract_action_items(self, text, progress_callback=None, max_candidates=10):
+        """Extract and prioritize action items (classifying at most max_candidates)"""
         action_keywords = [
             "need to", "should", "will", "must", "have to",
             "action item", "follow up", "deadline", "by next",
@@ -389,12 +1401,13 @@ class MeetingAnalyzer:
         priority_labels = ["urgent high priority", "medium priority", "low priority"]
         prioritized = []
         
-        for i, action in enumerate(potential_actions[:10]):
+        for i, action in enumerate(potential_actions[:max_candidates]):
             if progress_callback:
-                progress = (i + 1) / min(len(potential_actions), 10)
+                progress = (i + 1) / min(len(potential_actions), max_candidates)
                 progress_callback(progress, f"Analyzing action {i+1}")
             
             try:
+                self.calls["classifier"] += 1
                 result = self.classifier(action, priority_labels)
                 priority = "HIGH" if "urgent" in result["labels"][0] or "high" in result["labels"][0] else \
                           "MEDIUM" if "medium" in result["labels"][0] else "LOW"
@@ -407,39 +1420,341 @@ class MeetingAnalyzer:
             except:
                 prioritized.append({"task": action, "priority": "MEDIUM", "confidence": 0.5})
         
-        priority_order = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
-        prioritized.sort(key=lambda x: priority_order.get(x["priority"], 1))
+        prioritized.sort(key=lambda x: ACTION_PRIORITY_ORDER.get(x["priority"], 1))
         
         return prioritized
     
-    def identify_key_takeaways(self, text, num_takeaways=5, progress_callback=None):
-        """Identify most important points"""
+    def identify_key_takeaways(self, text, num_takeaways=5, progress_callback=None, max_candidates=30):
+        """Identify most important points among the first max_candidates sentences"""
+        scored = self.score_key_points(self.takeaway_candidates(text)[:max_candidates], progress_callback)
+        scored.sort(key=lambda x: x["score"], reverse=True)
+        return [item["text"] for item in scored[:num_takeaways]]
+    
+    @staticmethod
+    def takeaway_candidates(text):
+        """Sentences long enough to be a key takeaway, in order"""
         sentences = text.replace("?", ".").replace("!", ".").split(".")
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 30]
-        
+        return [s.strip() for s in sentences if len(s.strip()) > 30]
+    
+    def score_key_points(self, sentences, progress_callback=None):
+        """Classify sentences; returns the ones judged very important, with their scores"""
         importance_labels = ["very important key point", "moderately important", "not important"]
         scored = []
         
-        for i, sentence in enumerate(sentences[:30]):
+        for i, sentence in enumerate(sentences):
             if progress_callback:
-                progress = (i + 1) / min(len(sentences), 30)
+                progress = (i + 1) / len(sentences)
                 progress_callback(progress, f"Analyzing sentence {i+1}")
             
             try:
+                self.calls["classifier"] += 1
                 result = self.classifier(sentence, importance_labels)
                 if result["labels"][0] == "very important key point":
                     scored.append({"text": sentence, "score": result["scores"][0]})
             except:
                 continue
         
-        scored.sort(key=lambda x: x["score"], reverse=True)
-        return [item["text"] for item in scored[:num_takeaways]]
+        return scored
+
+
+# ============================================================
+# TRANSCRIPT CLEANUP (Repetition loops and near-duplicates)
+# ============================================================
+
+# A segment of DEDUP_MIN_WORDS or more words whose word shingles overlap one of
+# the last DEDUP_WINDOW_SEGMENTS such segments kept at least this much (Jaccard
+# similarity, estimated by MinHash) is left out of the analysis
+DEDUP_THRESHOLD = float(os.environ.get("DEDUP_THRESHOLD", "0.8"))
+DEDUP_WINDOW_SEGMENTS = int(os.environ.get("DEDUP_WINDOW_SEGMENTS", "8"))
+DEDUP_MIN_WORDS = 5
+DEDUP_SHINGLE_WORDS = 3
+DEDUP_HASHES = 32
+
+# A phrase of up to DEDUP_LOOP_WORDS words said DEDUP_LOOP_REPEATS or more
+# times in a row within one segment is a decoding loop, cut to one copy; a
+# shorter segment ("Thank you.") is one from its DEDUP_LOOP_REPEATS-th copy in a row
+DEDUP_LOOP_WORDS = 8
+DEDUP_LOOP_REPEATS = 3
+
+# Whole segments Whisper is known to invent over silence or music (from its
+# subtitle training data). Only phrases nobody says in a meeting on their own
+HALLUCINATION_PHRASES = {
+    "thanks for watching", "thank you for watching", "thanks for watching and see you next time",
+    "please subscribe", "please like and subscribe", "like and subscribe", "subscribe to my channel",
+    "don't forget to like and subscribe", "subtitles by the amara org community",
+    "transcription by castingwords",
+}
+
+
+def normalize_words(text):
+    """Lowercase words without punctuation, for comparing what was said"""
+    return [word for word in (re.sub(r"[^\w']", "", word.lower()) for word in text.split()) if word]
+
+
+class TranscriptDeduplicator:
+    """Leaves repetition loops, near-duplicates and boilerplate out of the analysis
+    
+    Whisper loops over silence ("Thank you." again and again), repeats a
+    phrase within a segment, and sometimes emits subtitle boilerplate. Each
+    of those costs summarizer and classifier calls and skews the results.
+    add() takes the segments in order and, for each:
+    
+    - cuts a phrase repeated DEDUP_LOOP_REPEATS or more times in a row to
+      one copy
+    - drops it if it is boilerplate (HALLUCINATION_PHRASES) or has no words
+    - drops a short segment once the same words have come DEDUP_LOOP_REPEATS
+      times in a row, so replies like "Yes." said again later are kept
+    - drops a longer one if it near-duplicates one of the last
+      DEDUP_WINDOW_SEGMENTS longer segments kept (MinHash signatures of
+      word shingles). Only nearby segments are compared: a sentence
+      repeated later in the meeting is said again, not a decoding loop
+    
+    The work per segment depends only on its own length and the window, so
+    a transcript is cleaned in linear time. removed and collapsed record
+    what was left out.
+    """
+    
+    def __init__(self, threshold=DEDUP_THRESHOLD, window=DEDUP_WINDOW_SEGMENTS):
+        self.threshold = threshold
+        # Fixed seed: the same transcript is always cleaned the same way
+        rng = np.random.default_rng(0)
+        self.multipliers = rng.integers(0, 2**64, DEDUP_HASHES, dtype=np.uint64) | np.uint64(1)
+        self.offsets = rng.integers(0, 2**64, DEDUP_HASHES, dtype=np.uint64)
+        self.recent = deque(maxlen=window)  # (key, signature) of the last kept segments
+        self.run_text, self.run_key, self.run_length = None, None, 0
+        self.last_kept = None
+        self.kept = 0
+        self.removed = []
+        self.collapsed = []
+    
+    @staticmethod
+    def collapse_loops(words, normalized):
+        """words with every run of DEDUP_LOOP_REPEATS+ repeated phrases cut to its first copy"""
+        kept, i = [], 0
+        while i < len(words):
+            for size in range(1, DEDUP_LOOP_WORDS + 1):
+                phrase = normalized[i:i + size]
+                repeats = 1
+                while normalized[i + repeats * size:i + (repeats + 1) * size] == phrase:
+                    repeats += 1
+                if len(phrase) == size and repeats >= DEDUP_LOOP_REPEATS:
+                    kept.extend(words[i:i + size])
+                    i += repeats * size
+                    break
+            else:
+                kept.append(words[i])
+                i += 1
+        return kept
+    
+    def signature(self, normalized):
+        """MinHash signature of the word shingles"""
+        size = min(DEDUP_SHINGLE_WORDS, len(normalized))
+        shingles = np.array([
+            zlib.crc32(" ".join(normalized[i:i + size]).encode("utf-8"))
+            for i in range(len(normalized) - size + 1)
+        ], dtype=np.uint64)
+        # Multiply-shift hashing; uint64 arithmetic wraps, which is the "mod 2**64"
+        hashed = (self.multipliers[:, None] * shingles[None, :] + self.offsets[:, None]) >> np.uint64(32)
+        return hashed.min(axis=1)
+    
+    def _remove(self, segment, reason, duplicate_of=None):
+        self.removed.append({
+            "id": segment.get("id"),
+            "start": segment["start"],
+            "end": segment["end"],
+            "text": segment["text"].strip(),
+            "reason": reason,
+            "duplicate_of": duplicate_of,
+        })
+    
+    def add(self, segment):
+        """The segment as the analysis should see it, or None if it is left out"""
+        words = segment["text"].split()
+        normalized = normalize_words(segment["text"])
+        if not normalized:
+            self._remove(segment, "no_words")
+            return None
+        if " ".join(normalized) in HALLUCINATION_PHRASES:
+            self._remove(segment, "boilerplate")
+            return None
+        
+        if len(normalized) >= DEDUP_LOOP_REPEATS:
+            kept_words = self.collapse_loops(words, [re.sub(r"[^\w']", "", word.lower()) for word in words])
+            if len(kept_words) < len(words):
+                self.collapsed.append({
+                    "id": segment.get("id"),
+                    "start": segment["start"],
+                    "end": segment["end"],
+                    "words_removed": len(words) - len(kept_words),
+                })
+                segment = dict(segment, text=" " + " ".join(kept_words))
+                normalized = normalize_words(segment["text"])
+        
+        key = segment.get("id", self.kept)
+        text = " ".join(normalized)
+        if text == self.run_text:
+            self.run_length += 1
+        else:
+            self.run_text, self.run_key, self.run_length = text, key, 1
+        
+        if len(normalized) < DEDUP_MIN_WORDS:
+            if self.run_length >= DEDUP_LOOP_REPEATS:
+                self._remove(segment, "repeat", duplicate_of=self.run_key)
+                return None
+            signature = None
+        else:
+            signature = self.signature(normalized)
+            if self.recent:
+                similarity = np.mean(np.stack([recent for _, recent in self.recent]) == signature, axis=1)
+                best = int(np.argmax(similarity))
+                if similarity[best] >= self.threshold:
+                    duplicate_of = self.recent[best][0]
+                    self._remove(segment, "repeat" if duplicate_of == self.last_kept else "near_duplicate",
+                                 duplicate_of=duplicate_of)
+                    return None
+        
+        if signature is not None:
+            self.recent.append((key, signature))
+        self.last_kept = key
+        self.kept += 1
+        return segment
+    
+    def record(self):
+        """What was left out, for reports and logs"""
+        return {
+            "segments_kept": self.kept,
+            "segments_removed": len(self.removed),
+            "words_removed": sum(len(item["text"].split()) for item in self.removed)
+                             + sum(item["words_removed"] for item in self.collapsed),
+            "removed": self.removed,
+            "collapsed": self.collapsed,
+        }
+    
+    def clean(self, transcription):
+        """The text the analysis should read, plus record()"""
+        kept = (self.add(segment) for segment in transcription["segments"])
+        return {"text": "".join(segment["text"] for segment in kept if segment), **self.record()}
 
 
 # ============================================================
 # REPORT GENERATOR WITH MULTIPLE FORMAT SUPPORT
 # ============================================================
 
+# JSON exports list transcript segments as start, end, text and confidence;
+# "full" keeps every field Whisper returns (token ids, temperatures, ...)
+JSON_EXPORT_FULL = os.environ.get("JSON_EXPORT", "slim") == "full"
+
+# PDF reports are drawn in a Unicode TrueType font: PDF_FONT (a "-Bold" file
+# next to it is used for headings), plus PDF_FALLBACK_FONTS (separated by
+# os.pathsep) for the scripts it lacks. Unset, the first candidates found on
+# this host are used; with no Unicode font at all, PDFs fall back to Latin-1.
+PDF_FONT = os.environ.get("PDF_FONT")
+PDF_FALLBACK_FONTS = [path for path in os.environ.get("PDF_FALLBACK_FONTS", "").split(os.pathsep) if path]
+
+PDF_FONT_CANDIDATES = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSans-Regular.ttf",
+    "/Library/Fonts/Arial Unicode.ttf",
+    "C:/Windows/Fonts/arial.ttf",
+]
+
+PDF_FALLBACK_FONT_CANDIDATES = {
+    "zh": [
+        "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/truetype/wqy/wqy-microhei.ttc",
+        "/usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf",
+        "/System/Library/Fonts/PingFang.ttc",
+        "C:/Windows/Fonts/msyh.ttc",
+    ],
+    "bn": [
+        "/usr/share/fonts/truetype/noto/NotoSansBengali-Regular.ttf",
+        "/usr/share/fonts/truetype/lohit-bengali/Lohit-Bengali.ttf",
+        "/usr/share/fonts/truetype/freefont/FreeSerif.ttf",
+        "C:/Windows/Fonts/Nirmala.ttf",
+    ],
+}
+
+# Threads rendering PDFs in the background, shared by every session
+PDF_WORKERS = int(os.environ.get("PDF_WORKERS", "1"))
+
+class PdfFonts:
+    """Report font files, looked up once per process and used by every PDF report
+    
+    Each document registers them with FPDF.add_font(), fpdf2's public API, so
+    PDF export does not depend on fpdf2 internals. The glyph widths that
+    ReportGenerator._write_lines() wraps the transcript with are read from
+    the font files once (with fontTools) and shared.
+    """
+    
+    def __init__(self, regular=PDF_FONT, fallbacks=PDF_FALLBACK_FONTS):
+        self.regular = regular or next((path for path in PDF_FONT_CANDIDATES if os.path.exists(path)), None)
+        bold = self.regular and re.sub(r"(-Regular)?(\.\w+)$", r"-Bold\2", self.regular)
+        self.bold = bold if bold and os.path.exists(bold) else self.regular
+        self.fallbacks = fallbacks or [
+            next(path for path in candidates if os.path.exists(path))
+            for candidates in PDF_FALLBACK_FONT_CANDIDATES.values()
+            if any(os.path.exists(path) for path in candidates)
+        ]
+        self.advances = {}
+        self.lock = threading.Lock()
+    
+    @property
+    def available(self):
+        return self.regular is not None
+    
+    def _advances(self, path):
+        """Advance width (1/1000 em) of every character the font file maps"""
+        with self.lock:
+            if path not in self.advances:
+                font = ttLib.TTFont(path, fontNumber=0, lazy=True)
+                scale = 1000 / font["head"].unitsPerEm
+                metrics = font["hmtx"].metrics
+                self.advances[path] = {code: metrics[glyph][0] * scale for code, glyph in font.getBestCmap().items()}
+                font.close()
+        return self.advances[path]
+    
+    def widths(self):
+        """Per-character widths of the regular face, then of each fallback, in the order fpdf2 picks them"""
+        return [self._advances(path) for path in [self.regular] + self.fallbacks] if self.available else []
+    
+    def apply(self, pdf):
+        """Register the report fonts on pdf; returns their family, or None without a Unicode font"""
+        if not self.available:
+            return None
+        pdf.add_font("report", "", self.regular)
+        pdf.add_font("report", "B", self.bold)
+        fallback_families = []
+        for i, path in enumerate(self.fallbacks):
+            family = f"fallback{i}"
+            pdf.add_font(family, "", path)
+            # Headings use the same face; fpdf2 only falls back to a matching style
+            pdf.add_font(family, "B", path)
+            fallback_families.append(family)
+        if fallback_families:
+            pdf.set_fallback_fonts(fallback_families)
+        return "report"
+
+@st.cache_resource
+def get_pdf_fonts():
+    """Report fonts, looked up on first use and kept for the life of the process"""
+    return PdfFonts()
+
+@st.cache_resource
+def get_pdf_executor():
+    """Threads that render PDF reports off the request path"""
+    return ThreadPoolExecutor(max_workers=PDF_WORKERS, thread_name_prefix="pdf")
+
+class ReportPdf(FPDF):
+    """FPDF with page numbers in the footer"""
+    
+    def footer(self):
+        self.set_y(-12)
+        self.set_font(self.font_family, "", 8)
+        self.cell(0, 8, f"{self.page_no()}/{{nb}}", align="C")
+
 class ReportGenerator:
     """Generates reports in multiple formats"""
     
@@ -468,6 +1783,7 @@ class ReportGenerator:
     📍 Location:    {meeting_info.get('location', 'N/A')}
     👤 Organizer:   {meeting_info.get('organizer', 'N/A')}
     👥 Attendees:   {meeting_info.get('attendees', 'N/A')}
+    🗣️ Language:    {transcription.get('language', 'N/A')} ({transcription.get('language_source', 'N/A')})
 
 {separator}
 🎯 MEETING OBJECTIVE
@@ -550,125 +1866,215 @@ class ReportGenerator:
 """
         return report
     
-    def generate_json_report(self, meeting_info, summary, insights, action_items, takeaways, transcription):
-        """Generate JSON format report"""
-        return json.dumps({
+    @staticmethod
+    def export_segment(segment, full=False):
+        """A transcript segment as exported: start, end, text and (when Whisper scored it) confidence"""
+        if full:
+            return segment
+        exported = {"start": segment["start"], "end": segment["end"], "text": segment["text"].strip()}
+        if segment.get("avg_logprob") is not None:
+            # Mean token probability, discounted by how likely the window is silence
+            exported["confidence"] = round(
+                math.exp(segment["avg_logprob"]) * (1.0 - segment.get("no_speech_prob", 0.0)), 3
+            )
+        return exported
+    
+    def iter_json_report(self, meeting_info, summary, insights, action_items, takeaways, transcription,
+                         full=None):
+        """The JSON report as text chunks, one transcript segment per chunk
+        
+        Writing the chunks out as they come keeps only one segment in memory
+        at a time, however long the meeting. full (default: JSON_EXPORT=full)
+        exports the segments exactly as Whisper returned them.
+        """
+        full = JSON_EXPORT_FULL if full is None else full
+        
+        def members(fields, indent):
+            return ",\n".join(
+                f"{indent}{json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}" for key, value in fields.items()
+            )
+        
+        yield "{\n" + members({
             "meeting_info": meeting_info,
             "summary": summary,
             "insights": insights,
             "action_items": action_items,
             "takeaways": takeaways,
-            "transcript": {
-                "text": transcription["text"],
-                "segments": transcription["segments"]
-            },
+        }, "  ") + ',\n  "transcript": {\n' + members({
+            "language": transcription.get("language"),
+            "language_source": transcription.get("language_source"),
+            "whisper_model": transcription.get("model"),
+            "decoding_profile": transcription.get("decoding_profile"),
+            "segment_schema": "full" if full else "slim",
+            "text": transcription["text"],
+            "cleanup": transcription.get("cleanup"),
+        }, "    ") + ',\n    "segments": ['
+        
+        for i, segment in enumerate(transcription["segments"]):
+            yield ("," if i else "") + "\n      " + json.dumps(self.export_segment(segment, full), ensure_ascii=False)
+        
+        yield ("\n    " if transcription["segments"] else "") + "]\n  },\n" + members({
             "generated_at": datetime.now().isoformat()
-        }, indent=2, ensure_ascii=False)
+        }, "  ") + "\n}\n"
     
-    def generate_pdf_report(self, meeting_info, summary, insights, action_items, takeaways):
-        """Generate PDF format report with proper error handling"""
-        try:
-            pdf = FPDF()
-            pdf.add_page()
-            pdf.set_auto_page_break(auto=True, margin=15)
-            pdf.set_left_margin(10)
-            pdf.set_right_margin(10)
-            
-            # Title
-            pdf.set_font("Arial", "B", 16)
-            pdf.cell(0, 10, "MEETING REPORT", ln=True, align="C")
-            pdf.ln(5)
-            
-            # Meeting Info
-            pdf.set_font("Arial", "B", 12)
-            pdf.cell(0, 10, "Meeting Details", ln=True)
-            pdf.set_font("Arial", "", 10)
-            
-            # Safely encode text for PDF (Latin-1 compatible only)
-            def safe_encode(text):
-                """Convert text to Latin-1 safe format"""
-                if not text:
-                    return "N/A"
-                try:
-                    # Try to encode as latin-1, replace unsupported chars
-                    return text.encode('latin-1', errors='replace').decode('latin-1')
-                except:
-                    return str(text).encode('ascii', errors='ignore').decode('ascii')
-            
-            meeting_details = (
-                f"Title: {safe_encode(meeting_info.get('title', 'N/A'))}\n"
-                f"Date: {safe_encode(meeting_info.get('date', 'N/A'))}\n"
-                f"Time: {safe_encode(meeting_info.get('time', 'N/A'))}\n"
-                f"Location: {safe_encode(meeting_info.get('location', 'N/A'))}\n"
-                f"Organizer: {safe_encode(meeting_info.get('organizer', 'N/A'))}\n"
-                f"Attendees: {safe_encode(meeting_info.get('attendees', 'N/A'))}"
-            )
-            pdf.multi_cell(0, 5, meeting_details)
-            pdf.ln(5)
-            
-            # Summary
-            pdf.set_font("Arial", "B", 12)
-            pdf.cell(0, 10, "Executive Summary", ln=True)
-            pdf.set_font("Arial", "", 10)
-            safe_summary = safe_encode(summary)
-            if len(safe_summary) > 500:
-                safe_summary = safe_summary[:497] + "..."
-            pdf.multi_cell(0, 5, safe_summary)
-            pdf.ln(5)
-            
-            # Key Takeaways
-            if takeaways:
-                pdf.set_font("Arial", "B", 12)
-                pdf.cell(0, 10, "Key Takeaways", ln=True)
-                pdf.set_font("Arial", "", 10)
-                for i, takeaway in enumerate(takeaways, 1):
-                    safe_takeaway = safe_encode(takeaway)
-                    # Limit length to prevent overflow
-                    if len(safe_takeaway) > 200:
-                        safe_takeaway = safe_takeaway[:197] + "..."
-                    pdf.multi_cell(0, 5, f"{i}. {safe_takeaway}")
-                    pdf.ln(2)
-                pdf.ln(3)
-            
-            # Action Items
-            if action_items:
-                pdf.set_font("Arial", "B", 12)
-                pdf.cell(0, 10, "Action Items", ln=True)
-                pdf.set_font("Arial", "", 10)
-                for i, item in enumerate(action_items, 1):
-                    priority = item["priority"]
-                    task = safe_encode(item["task"])
-                    # Limit length to prevent overflow
-                    if len(task) > 200:
-                        task = task[:197] + "..."
-                    pdf.multi_cell(0, 5, f"[{priority}] {i}. {task}")
-                    pdf.ln(2)
-                pdf.ln(3)
-            
-            # Insights
-            pdf.set_font("Arial", "B", 12)
-            pdf.cell(0, 10, "Key Insights", ln=True)
-            pdf.set_font("Arial", "", 10)
-            
-            for key in ["objective", "decisions", "concerns", "next_steps"]:
-                value = safe_encode(insights.get(key, "Not identified"))
-                if len(value) > 300:
-                    value = value[:297] + "..."
-                pdf.multi_cell(0, 5, f"{key.replace('_', ' ').title()}: {value}")
-                pdf.ln(2)
-            
-            return pdf.output(dest='S').encode('latin-1', errors='replace')
-            
-        except Exception as e:
-            # If PDF generation fails, create a simple error PDF
-            pdf = FPDF()
-            pdf.add_page()
-            pdf.set_font("Arial", "B", 16)
-            pdf.cell(0, 10, "PDF Generation Error", ln=True, align="C")
-            pdf.ln(10)
-            pdf.set_font("Arial", "", 12)
-            pdf.multi_cell(0, 10, f"Unable to generate PDF report.\nError: {str(e)}\n\nPlease use TXT or Markdown format instead.")
-            return pdf.output(dest='S').encode('latin-1', errors='replace')
+    def iter_ndjson_segments(self, transcription, full=None):
+        """The transcript as newline-delimited JSON, one segment per line"""
+        full = JSON_EXPORT_FULL if full is None else full
+        for segment in transcription["segments"]:
+            yield json.dumps(self.export_segment(segment, full), ensure_ascii=False) + "\n"
+    
+    def generate_json_report(self, meeting_info, summary, insights, action_items, takeaways, transcription,
+                             full=None):
+        """Generate JSON format report"""
+        return "".join(self.iter_json_report(
+            meeting_info, summary, insights, action_items, takeaways, transcription, full
+        ))
+    
+    def generate_pdf_report(self, meeting_info, summary, insights, action_items, takeaways, transcription=None):
+        """Generate PDF format report, with the full transcript when given one"""
+        pdf = ReportPdf()
+        fonts = get_pdf_fonts()
+        family = fonts.apply(pdf)
+        if family is None:
+            # No Unicode font on this host: core Helvetica, which only covers Latin-1
+            family = "helvetica"
+            log_event("pdf_unicode_font_missing", candidates=PDF_FONT_CANDIDATES)
+        spoken = transcription.get("language") if transcription else None
+        if uharfbuzz is not None and "bn" in (self.lang, spoken):
+            pdf.set_text_shaping(True)
+        
+        def safe_encode(text):
+            """Text as the font can draw it"""
+            if not text:
+                return "N/A"
+            text = str(text)
+            if family == "helvetica":
+                return text.encode("latin-1", errors="replace").decode("latin-1")
+            return text
+        
+        pdf.set_font(family, "", 10)
+        pdf.add_page()
+        pdf.set_auto_page_break(auto=True, margin=15)
+        pdf.set_left_margin(10)
+        pdf.set_right_margin(10)
+        
+        def heading(text):
+            pdf.set_font(family, "B", 12)
+            pdf.cell(0, 10, text, new_x="LMARGIN", new_y="NEXT")
+            pdf.set_font(family, "", 10)
+        
+        def paragraph(text):
+            pdf.multi_cell(0, 5, text, new_x="LMARGIN", new_y="NEXT")
+            pdf.ln(2)
+        
+        # Title
+        pdf.set_font(family, "B", 16)
+        pdf.cell(0, 10, "MEETING REPORT", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(5)
+        
+        # Meeting Info
+        heading("Meeting Details")
+        paragraph("\n".join(
+            f"{label}: {safe_encode(meeting_info.get(key, 'N/A'))}"
+            for key, label in [("title", "Title"), ("date", "Date"), ("time", "Time"),
+                               ("location", "Location"), ("organizer", "Organizer"), ("attendees", "Attendees")]
+        ))
+        pdf.ln(3)
+        
+        # Summary
+        heading("Executive Summary")
+        paragraph(safe_encode(summary))
+        pdf.ln(3)
+        
+        # Key Takeaways
+        if takeaways:
+            heading("Key Takeaways")
+            for i, takeaway in enumerate(takeaways, 1):
+                paragraph(f"{i}. {safe_encode(takeaway)}")
+            pdf.ln(3)
+        
+        # Action Items
+        if action_items:
+            heading("Action Items")
+            for i, item in enumerate(action_items, 1):
+                paragraph(f"[{item['priority']}] {i}. {safe_encode(item['task'])}")
+            pdf.ln(3)
+        
+        # Insights
+        heading("Key Insights")
+        for key in ["objective", "decisions", "concerns", "next_steps"]:
+            paragraph(f"{key.replace('_', ' ').title()}: {safe_encode(insights.get(key, 'Not identified'))}")
+        
+        # Full transcript
+        if transcription and transcription["segments"]:
+            pdf.ln(3)
+            heading("Transcript")
+            pdf.set_font(family, "", 9)
+            lines = (
+                f"[{AudioTranscriber.format_timestamp(segment['start'])}] {safe_encode(segment['text'].strip())}"
+                for segment in transcription["segments"]
+            )
+            if pdf.text_shaping:
+                # Shaped glyphs are narrower than their characters; let fpdf2 measure them
+                for line in lines:
+                    pdf.multi_cell(0, 4.5, line, new_x="LMARGIN", new_y="NEXT")
+            else:
+                self._write_lines(pdf, lines, 4.5, fonts.widths() if family == "report" else [])
+        
+        return bytes(pdf.output())
+    
+    @staticmethod
+    def _write_lines(pdf, lines, line_height, widths=()):
+        """Wrap and write many short paragraphs, one cell per line
+        
+        multi_cell() re-measures a line after every character it adds, which
+        dominates rendering a long transcript. Here each distinct word (or,
+        for scripts written without spaces, character) is measured once,
+        in whichever font fpdf2 will draw it with (widths: PdfFonts.widths()
+        of the current font and its fallbacks), and lines are filled greedily;
+        page breaks come from the cells themselves.
+        """
+        scale = pdf.font_size_pt / 1000 / pdf.k
+        char_widths = {}
+        word_widths = {}
+        
+        def char_width(char):
+            if char not in char_widths:
+                table = next((table for table in widths if ord(char) in table), None)
+                char_widths[char] = table[ord(char)] * scale if table else pdf.get_string_width(char)
+            return char_widths[char]
+        
+        def word_width(word):
+            if word not in word_widths:
+                word_widths[word] = sum(char_width(char) for char in word)
+            return word_widths[word]
+        
+        max_width = pdf.epw
+        
+        def pieces(word):
+            """The word, or runs of its characters that fit on a line (e.g. a sentence without spaces)"""
+            if word_width(word) <= max_width:
+                return [word]
+            runs, run, width = [], "", 0.0
+            for char in word:
+                if run and width + char_width(char) > max_width:
+                    runs.append(run)
+                    run, width = "", 0.0
+                run += char
+                width += char_width(char)
+            return runs + [run]
+        
+        space = char_width(" ")
+        for text in lines:
+            line, width = [], 0.0
+            for word in (piece for token in text.split() for piece in pieces(token)):
+                w = word_width(word)
+                if line and width + space + w > max_width:
+                    pdf.cell(max_width, line_height, " ".join(line), new_x="LMARGIN", new_y="NEXT")
+                    line, width = [], 0.0
+                width += (space if line else 0.0) + w
+                line.append(word)
+            pdf.cell(max_width, line_height, " ".join(line), new_x="LMARGIN", new_y="NEXT")
     
     def _wrap_text(self, text, width):
         """Wrap text to specified width"""
@@ -695,11 +2101,1454 @@ class ReportGenerator:
         
         return "\n    ".join(lines)
 
+def export_chunks(report_data, fmt="json", full=None):
+    """Stream the JSON report ("json") or the transcript segments ("ndjson") of a finished job"""
+    generator = ReportGenerator()
+    if fmt == "ndjson":
+        return generator.iter_ndjson_segments(report_data["transcription"], full)
+    return generator.iter_json_report(
+        report_data["meeting_info"], report_data["summary"], report_data["insights"],
+        report_data["action_items"], report_data["takeaways"], report_data["transcription"], full
+    )
+
+def gzip_chunks(chunks, level=6):
+    """Gzip a stream of text or bytes chunks as it goes"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def write_export(path, report_data, fmt="json", full=None, compress=False):
+    """Write an export chunk by chunk (gzipped with compress), replacing path atomically"""
+    chunks = export_chunks(report_data, fmt, full)
+    chunks = gzip_chunks(chunks) if compress else (chunk.encode("utf-8") for chunk in chunks)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+
+
+# ============================================================
+# DEADLINE PLANNER
+# ============================================================
+
+# Measured throughput, shared by every process on this host
+THROUGHPUT_STATS_PATH = os.environ.get(
+    "THROUGHPUT_STATS_PATH", os.path.join(tempfile.gettempdir(), "meeting-transcriber", "throughput.json")
+)
+
+# Quality ladders, best first
+MODEL_SIZES = ["large", "medium", "small", "base", "tiny"]
+PROFILE_LADDER = ["accurate", "balanced", "fast"]
+
+# Summary mode -> most transcript chunks sent to the summarizer (None = all)
+SUMMARY_MODES = {"full": None, "condensed": 12, "brief": 4}
+
+ANALYSIS_DEPTHS = [
+    {"summary_mode": "full", "action_candidates": 10, "takeaway_candidates": 30},
+    {"summary_mode": "condensed", "action_candidates": 6, "takeaway_candidates": 15},
+    {"summary_mode": "brief", "action_candidates": 3, "takeaway_candidates": 8},
+]
+
+# Starting estimates for a CPU host; replaced by measurements as jobs finish
+DEFAULT_THROUGHPUT = {
+    "transcribe_rtf": {"tiny": 0.08, "base": 0.15, "small": 0.45, "medium": 1.2, "large": 2.5},
+    "profile_cost": {"fast": 0.7, "balanced": 1.0, "accurate": 2.5},
+    "seconds_per_call": {"summarizer": 2.0, "qa": 0.3, "classifier": 0.5},
+    "words_per_audio_second": 2.5,
+    "render_seconds_per_word": 2e-5,
+}
+
+THROUGHPUT_SMOOTHING = 0.3
+INSIGHT_QUESTIONS = 6
+CHARS_PER_WORD = 6
+WORDS_PER_SENTENCE = 15
+ACTION_SENTENCE_SHARE = 0.2
+
+class ThroughputModel:
+    """Per-stage cost estimates, kept as moving averages of finished jobs"""
+    
+    def __init__(self, stats=None, path=THROUGHPUT_STATS_PATH):
+        self.stats = stats or {}
+        self.path = Path(path)
+    
+    @classmethod
+    def load(cls, path=THROUGHPUT_STATS_PATH):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(json.load(f), path)
+        except (OSError, ValueError):
+            return cls(path=path)
+    
+    def transcribe_rtf(self, model_size, decoding_profile):
+        """Seconds of transcription per second of audio"""
+        measured = self.stats.get(f"transcribe_rtf/{model_size}/{decoding_profile}")
+        if measured is not None:
+            return measured
+        cost = DEFAULT_THROUGHPUT["profile_cost"]
+        # Another profile measured on the same model beats the static table
+        for profile in PROFILE_LADDER:
+            other = self.stats.get(f"transcribe_rtf/{model_size}/{profile}")
+            if other is not None:
+                return other * cost[decoding_profile] / cost[profile]
+        rtf = DEFAULT_THROUGHPUT["transcribe_rtf"].get(model_size, DEFAULT_THROUGHPUT["transcribe_rtf"]["large"])
+        if torch.cuda.is_available():
+            rtf /= 10
+        return rtf * cost[decoding_profile]
+    
+    def seconds_per_call(self, model):
+        return self.stats.get(f"seconds_per_call/{model}", DEFAULT_THROUGHPUT["seconds_per_call"][model])
+    
+    def value(self, name):
+        return self.stats.get(name, DEFAULT_THROUGHPUT[name])
+    
+    def predict(self, audio_seconds, plan):
+        """Predicted seconds per stage for one recording under `plan`"""
+        words = audio_seconds * self.value("words_per_audio_second")
+        sentences = words / WORDS_PER_SENTENCE
+        chunks = words * CHARS_PER_WORD / 1024
+        max_chunks = SUMMARY_MODES[plan["summary_mode"]]
+        classifier = self.seconds_per_call("classifier")
+        return {
+            "transcribe": audio_seconds * self.transcribe_rtf(plan["model_size"], plan["decoding_profile"]),
+            "summarize": min(chunks, max_chunks or chunks) * self.seconds_per_call("summarizer"),
+            "insights": INSIGHT_QUESTIONS * self.seconds_per_call("qa"),
+            "actions": min(sentences * ACTION_SENTENCE_SHARE, plan["action_candidates"]) * classifier,
+            "takeaways": min(sentences, plan["takeaway_candidates"]) * classifier,
+            "render": words * self.value("render_seconds_per_word"),
+        }
+    
+    def _update(self, name, sample):
+        previous = self.stats.get(name)
+        self.stats[name] = sample if previous is None else (
+            previous + THROUGHPUT_SMOOTHING * (sample - previous)
+        )
+    
+    def observe(self, audio_seconds, plan, timings, calls, words):
+        """Fold one finished job into the estimates and save them
+        
+        Re-reads the file first so concurrent workers lose as few samples as
+        possible; the write itself is atomic.
+        """
+        self.stats = ThroughputModel.load(self.path).stats
+        if audio_seconds:
+            self._update(f"transcribe_rtf/{plan['model_size']}/{plan['decoding_profile']}",
+                         timings["transcribe"] / audio_seconds)
+            self._update("words_per_audio_second", words / audio_seconds)
+        for model, stages in (("summarizer", ["summarize"]), ("qa", ["insights"]),
+                              ("classifier", ["actions", "takeaways"])):
+            if calls[model]:
+                self._update(f"seconds_per_call/{model}", sum(timings[s] for s in stages) / calls[model])
+        if words:
+            self._update("render_seconds_per_word", timings["render"] / words)
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.stats, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+def plan_job(audio_seconds, throughput, model_size="base", decoding_profile=DEFAULT_DECODING_PROFILE,
+             deadline_seconds=None):
+    """Choose model size, decoding profile and analysis depth for a deadline
+    
+    The requested model and profile are the ceiling. Candidates are tried
+    best first, giving up analysis depth before the decoding profile and the
+    profile before the model size; the first whose predicted time fits the
+    deadline wins. If none fits, the cheapest is used and meets_deadline is
+    False. Without a deadline the request runs as-is at full depth.
+    """
+    models = MODEL_SIZES[MODEL_SIZES.index(model_size):] if model_size in MODEL_SIZES else [model_size]
+    profiles = PROFILE_LADDER[PROFILE_LADDER.index(decoding_profile):]
+    candidates = [
+        {"model_size": model, "decoding_profile": profile, **depth}
+        for model in models for profile in profiles for depth in ANALYSIS_DEPTHS
+    ]
+    if deadline_seconds is None:
+        candidates = candidates[:1]
+    
+    for plan in candidates:
+        predicted = throughput.predict(audio_seconds, plan)
+        if deadline_seconds is None or sum(predicted.values()) <= deadline_seconds:
+            break
+    
+    total = sum(predicted.values())
+    return {
+        **plan,
+        "audio_seconds": audio_seconds,
+        "deadline_seconds": deadline_seconds,
+        "predicted": predicted,
+        "predicted_total": total,
+        "meets_deadline": deadline_seconds is None or total <= deadline_seconds,
+        "adapted": plan is not candidates[0],
+    }
+
+
+# ============================================================
+# CPU RESOURCE GOVERNOR (Thread budget for concurrent jobs)
+# ============================================================
+
+JOB_PRIORITIES = ("interactive", "batch")
+
+class CpuGovernor:
+    """Partitions this process's CPU cores between the jobs running in it
+    
+    Torch sizes every op's thread pool to all cores, so N concurrent jobs
+    would run N x cores threads. The governor gives each running job
+    cores // running jobs intra-op threads instead (which also sizes torch's
+    MKL/BLAS calls). With torch's OpenMP backend the count belongs to the
+    calling thread, so each job applies its share from its own thread at
+    every progress update, i.e. between model calls.
+    
+    Interactive jobs preempt batch jobs: while any interactive job runs,
+    batch jobs pause at their next progress update and resume once the
+    interactive jobs are done.
+    """
+    
+    def __init__(self, cores=None, enabled=True):
+        self.cores = cores or (len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count())
+        self.enabled = enabled
+        self._jobs = {}
+        self._changed = threading.Condition()
+    
+    def set_cores(self, cores):
+        """Shrink the budget, e.g. to cores // N when N worker processes share one host"""
+        with self._changed:
+            self.cores = max(1, cores)
+            self._changed.notify_all()
+    
+    def register(self, job_id, priority="interactive"):
+        if priority not in JOB_PRIORITIES:
+            raise ValueError(f"Unknown job priority: {priority}")
+        with self._changed:
+            self._jobs[job_id] = {"priority": priority, "registered_at": time.time(), "preempted": False,
+                                  "applied_threads": None}
+            self._changed.notify_all()
+        log_event("cpu_allocation", job_id=job_id, **self.allocation())
+    
+    def release(self, job_id):
+        with self._changed:
+            self._jobs.pop(job_id, None)
+            self._changed.notify_all()
+    
+    def _running(self):
+        interactive = [job_id for job_id, job in self._jobs.items() if job["priority"] == "interactive"]
+        return interactive or list(self._jobs)
+    
+    def threads_per_job(self):
+        return max(1, self.cores // max(1, len(self._running())))
+    
+    def checkpoint(self, job_id, while_paused=None):
+        """Pause while preempted, then size torch's thread pool to this job's share
+        
+        while_paused() is called about once a second during a pause, so a
+        paused job can still be cancelled.
+        """
+        if not self.enabled:
+            return
+        with self._changed:
+            while job_id in self._jobs and job_id not in self._running():
+                if not self._jobs[job_id]["preempted"]:
+                    self._jobs[job_id]["preempted"] = True
+                    log_event("job_preempted", job_id=job_id)
+                self._changed.wait(1.0)
+                if while_paused:
+                    while_paused()
+            if self._jobs.get(job_id, {}).get("preempted"):
+                self._jobs[job_id]["preempted"] = False
+                log_event("job_resumed", job_id=job_id)
+            threads = self.threads_per_job()
+            if job_id in self._jobs:
+                self._jobs[job_id]["applied_threads"] = threads
+        if torch.get_num_threads() != threads:
+            torch.set_num_threads(threads)
+    
+    def allocation(self):
+        """Current budget and per-job threads (0 = preempted), for admin views and the API
+        
+        applied_threads is what the job last set; it catches up with threads
+        at the job's next progress update.
+        """
+        with self._changed:
+            running = self._running()
+            threads = self.threads_per_job()
+            return {
+                "enabled": self.enabled,
+                "cores": self.cores,
+                "jobs": [
+                    {"job_id": job_id, "priority": job["priority"],
+                     "threads": threads if job_id in running else 0,
+                     "applied_threads": job["applied_threads"],
+                     "running_seconds": round(time.time() - job["registered_at"], 1)}
+                    for job_id, job in self._jobs.items()
+                ],
+            }
+
+@st.cache_resource
+def get_cpu_governor():
+    """One governor per process, shared by every session; CPU_GOVERNOR=0 turns it off"""
+    return CpuGovernor(enabled=os.environ.get("CPU_GOVERNOR", "1").lower() not in ("0", "false", "no"))
+
+
+# ============================================================
+# END-TO-END PIPELINE (Shared by UI and headless entry points)
+# ============================================================
+
+SUPPORTED_AUDIO_FORMATS = ["mp3", "wav", "m4a", "webm", "mp4", "flac", "ogg"]
+
+PIPELINE_STAGES = {
+    "step_transcribing": "transcribe",
+    "step_summarizing": "summarize",
+    "step_insights": "insights",
+    "step_actions": "actions",
+    "step_takeaways": "takeaways",
+    "step_formatting": "render",
+}
+
+# Checkpointed jobs: JOBS_DIR/<job_key>/manifest.json plus one JSON file per finished stage
+JOBS_DIR = os.environ.get("JOBS_DIR", os.path.join(tempfile.gettempdir(), "meeting-transcriber", "jobs"))
+
+# Transcription is checkpointed after every span of this many seconds of audio
+TRANSCRIBE_SPAN_SECONDS = float(os.environ.get("TRANSCRIBE_SPAN_SECONDS", "300"))
+
+class JobCancelled(Exception):
+    """Raised inside a pipeline run whose job has been cancelled"""
+
+class JobCheckpoint:
+    """Manifest and stage outputs of one resumable job
+    
+    The job key hashes the recording's content together with the meeting
+    details and every setting that changes stage outputs, so resubmitting
+    the same job finds the same directory and skips the stages the manifest
+    records as done. Cancelling drops a marker file that the running
+    pipeline checks between model calls, which works across threads and
+    processes.
+    
+    submit() locks the job directory until release() (or the process ends).
+    A duplicate submitted while the first one still holds the lock is moved
+    to a key of its own (separate()), so the two never share checkpoints or
+    cancel markers.
+    """
+    
+    def __init__(self, job_key, jobs_dir=JOBS_DIR, digest=None):
+        self.jobs_dir = Path(jobs_dir)
+        self.digest = digest
+        self.lock_file = None
+        self._set_key(job_key)
+    
+    def _set_key(self, job_key):
+        self.job_key = job_key
+        self.job_dir = self.jobs_dir / job_key
+        self.manifest_path = self.job_dir / "manifest.json"
+        self.cancel_path = self.job_dir / "CANCELLED"
+    
+    @classmethod
+    def for_recording(cls, audio_path, meeting_info=None, jobs_dir=JOBS_DIR, **settings):
+        """Checkpoint of the job for this recording, meeting details and settings"""
+        digest = AudioTranscriber.content_hash(audio_path)
+        key_source = json.dumps({"audio_sha256": digest, "meeting_info": meeting_info, **settings}, sort_keys=True)
+        return cls(hashlib.sha256(key_source.encode("utf-8")).hexdigest()[:32], jobs_dir, digest)
+    
+    def separate(self):
+        """Move to a key no other submission uses (same recording, nothing to resume)"""
+        self.release()
+        self._set_key(f"{self.job_key[:32]}-{uuid.uuid4().hex[:8]}")
+    
+    def acquire(self):
+        """Lock the job directory for this submission; False if another live one holds it"""
+        if fcntl is None or self.lock_file is not None:
+            return True
+        self.job_dir.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.job_dir / "LOCK", "a")
+        try:
+            # Per open file, so it also excludes other threads of this process
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self.lock_file = lock_file
+        return True
+    
+    def release(self):
+        if self.lock_file is not None:
+            self.lock_file.close()
+            self.lock_file = None
+    
+    def _write_json(self, path, data):
+        self.job_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    
+    def manifest(self):
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"job_key": self.job_key, "status": "new", "stages": {}}
+    
+    def update_manifest(self, **fields):
+        manifest = self.manifest()
+        manifest.update(fields)
+        manifest["updated_at"] = datetime.now().isoformat()
+        self._write_json(self.manifest_path, manifest)
+        return manifest
+    
+    def submit(self, **settings):
+        """Record a (re)submission and lock it; clears an earlier cancellation so the job resumes"""
+        if not self.acquire():
+            self.separate()
+            self.acquire()
+        self.cancel_path.unlink(missing_ok=True)
+        manifest = self.manifest()
+        return self.update_manifest(status="submitted", settings=settings,
+                                    created_at=manifest.get("created_at", datetime.now().isoformat()))
+    
+    def cancel(self):
+        self.job_dir.mkdir(parents=True, exist_ok=True)
+        self.cancel_path.touch()
+        self.update_manifest(status="cancelled")
+    
+    @property
+    def cancelled(self):
+        return self.cancel_path.exists()
+    
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise JobCancelled(f"Job {self.job_key} was cancelled")
+    
+    def is_done(self, stage):
+        return self.manifest()["stages"].get(stage, {}).get("status") == "done"
+    
+    def load(self, stage):
+        """Output of a stage the manifest records as done, or None"""
+        if not self.is_done(stage):
+            return None
+        try:
+            with open(self.job_dir / f"{stage}.json", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def save(self, stage, output, **info):
+        """Write a stage's output, then record it as done in the manifest"""
+        self._write_json(self.job_dir / f"{stage}.json", output)
+        manifest = self.manifest()
+        manifest["stages"][stage] = {"status": "done", "finished_at": datetime.now().isoformat(), **info}
+        self.update_manifest(stages=manifest["stages"])
+
+def render_pdf(meeting_info, summary, insights, action_items, takeaways, transcription, lang="en", job_id=None):
+    """The PDF report and None, or None and the error if it cannot be rendered"""
+    started = time.perf_counter()
+    try:
+        pdf_report = ReportGenerator(lang).generate_pdf_report(
+            meeting_info, summary, insights, action_items, takeaways, transcription
+        )
+    except Exception as e:
+        log_event("pdf_failed", job_id=job_id, error=str(e))
+        return None, str(e)
+    log_event("pdf_rendered", job_id=job_id, seconds=round(time.perf_counter() - started, 3),
+              bytes=len(pdf_report), segments=len(transcription["segments"]))
+    return pdf_report, None
+
+def render_reports(meeting_info, summary, insights, action_items, takeaways, transcription, lang="en",
+                   job_id=None):
+    """Text and JSON reports, and a future of render_pdf() on the PDF worker threads
+    
+    Rendering the full transcript into a PDF takes seconds for a long
+    meeting, so it no longer holds up the job: see resolve_pdf().
+    """
+    generator = ReportGenerator(lang)
+    
+    text_report = generator.generate_text_report(
+        meeting_info, summary, insights, action_items, takeaways, transcription
+    )
+    json_report = generator.generate_json_report(
+        meeting_info, summary, insights, action_items, takeaways, transcription
+    )
+    pdf_future = get_pdf_executor().submit(
+        render_pdf, meeting_info, summary, insights, action_items, takeaways, transcription, lang, job_id
+    )
+    return text_report, json_report, pdf_future
+
+def resolve_pdf(report_data, timeout=None):
+    """Wait for report_data's PDF if it is still rendering, and store it (or its error) in report_data"""
+    pdf_future = report_data.get("pdf_future")
+    if pdf_future is not None:
+        report_data["pdf"], report_data["pdf_error"] = pdf_future.result(timeout)
+        report_data["pdf_available"] = report_data["pdf"] is not None
+        report_data.pop("pdf_future", None)
+    return report_data
+
+def process_meeting(audio_path, meeting_info, model_size="base", lang="en",
+                    progress_callback=None, stage_callback=None, instrumentation=None,
+                    spoken_language=None, decoding_profile=DEFAULT_DECODING_PROFILE,
+                    deadline_seconds=None, checkpoint=None, priority="interactive"):
+    """Transcribe, analyze and render all report formats for one recording
+    
+    progress_callback(progress, message) receives overall progress for UIs;
+    stage_callback(stage, progress) receives per-stage progress for job APIs.
+    Pass a JobInstrumentation to attach upload/queue timings recorded earlier.
+    spoken_language is the Whisper language hint; it defaults to the report
+    language, and "auto" detects it (cached per recording). decoding_profile
+    names an entry of DECODING_PROFILES.
+    
+    model_size and decoding_profile are upper bounds: once the audio is
+    decoded, plan_job() may lower them (and the analysis depth) so the
+    predicted time fits deadline_seconds, counted from the job's first stage.
+    
+    With a JobCheckpoint, the plan and every stage up to the takeaways are
+    saved as they finish and reused on the next run of the same job; only
+    rendering (which depends on meeting_info) always reruns. A cancelled
+    checkpoint stops the run with JobCancelled.
+    
+    priority ("interactive" or "batch") decides the job's share of the
+    process's CPU cores; see CpuGovernor.
+    """
+    spoken_language = spoken_language or lang
+    job = instrumentation or JobInstrumentation()
+    job.start()
+    resumed_stages = []
+    if checkpoint:
+        checkpoint.update_manifest(status="running", job_id=job.job_id)
+    governor = get_cpu_governor()
+    governor.register(job.job_id, priority)
+    
+    def report(progress, step_key, stage_progress=0.0):
+        if checkpoint:
+            checkpoint.raise_if_cancelled()
+        governor.checkpoint(job.job_id, while_paused=checkpoint.raise_if_cancelled if checkpoint else None)
+        if progress_callback:
+            progress_callback(progress, t(step_key, lang))
+        if stage_callback:
+            stage_callback(PIPELINE_STAGES[step_key], stage_progress)
+    
+    def sub_progress(start, span, step_key):
+        return lambda p, m: report(start + p * span, step_key, p)
+    
+    def run_stage(name, compute):
+        """Time one stage, or reuse its checkpointed output"""
+        if checkpoint:
+            output = checkpoint.load(name)
+            if output is not None:
+                resumed_stages.append(name)
+                return output
+        with job.stage(name):
+            output = compute()
+        if checkpoint:
+            checkpoint.save(name, output, seconds=round(job.timings[name], 3))
+        return output
+    
+    try:
+        # Step 1: Transcription
+        report(0.15, "step_transcribing")
+        with job.stage("decode"):
+            digest = (checkpoint and checkpoint.digest) or AudioTranscriber.content_hash(audio_path)
+            audio = AudioTranscriber.load_audio(audio_path, digest)
+        
+        plan = checkpoint.load("plan") if checkpoint else None
+        if plan is None:
+            plan = plan_job(
+                len(audio) / whisper.audio.SAMPLE_RATE,
+                ThroughputModel.load(),
+                model_size=model_size,
+                decoding_profile=decoding_profile,
+                deadline_seconds=deadline_seconds - sum(job.timings.values()) if deadline_seconds else None
+            )
+            if checkpoint:
+                checkpoint.save("plan", plan)
+        model_size, decoding_profile = plan["model_size"], plan["decoding_profile"]
+        log_event("job_planned", job_id=job.job_id, model_size=model_size, decoding_profile=decoding_profile,
+                  summary_mode=plan["summary_mode"], predicted_seconds=round(plan["predicted_total"], 3),
+                  deadline_seconds=plan["deadline_seconds"], meets_deadline=plan["meets_deadline"])
+        
+        with job.stage("model_load"):
+            if not (checkpoint and checkpoint.is_done("transcribe")):
+                load_whisper_model(AudioTranscriber.route(model_size, spoken_language, digest)[0])
+            analyzer = MeetingAnalyzer()
+        
+        if checkpoint and checkpoint.is_done("transcribe_partial") and not checkpoint.is_done("transcribe"):
+            resumed_stages.append("transcribe_partial")
+        
+        transcription = run_stage("transcribe", lambda: AudioTranscriber.transcribe(
+            audio,
+            model_size=model_size,
+            progress_callback=sub_progress(0.15, 0.15, "step_transcribing"),
+            language=spoken_language,
+            digest=digest,
+            decoding_profile=decoding_profile,
+            checkpoint=checkpoint
+        ))
+        transcript_text = transcription["text"]
+        
+        # Repetition loops and near-duplicates are left out of every analysis stage
+        cleanup = run_stage("dedup", lambda: TranscriptDeduplicator().clean(transcription))
+        analysis_text = cleanup.pop("text")
+        transcription["cleanup"] = cleanup
+        if cleanup["segments_removed"] or cleanup["collapsed"]:
+            log_event("transcript_deduplicated", job_id=job.job_id, segments_removed=cleanup["segments_removed"],
+                      segments_collapsed=len(cleanup["collapsed"]), words_removed=cleanup["words_removed"])
+        
+        if job.profiler:
+            job.profiler.record_inputs(
+                audio_file=str(audio_path),
+                audio_bytes=os.path.getsize(audio_path),
+                audio_samples=len(audio),
+                audio_seconds=len(audio) / whisper.audio.SAMPLE_RATE,
+                model_size=model_size,
+                whisper_model=transcription["model"],
+                decoding_profile=decoding_profile,
+                lang=lang,
+                spoken_language=transcription["language"],
+                segments=len(transcription["segments"]),
+                transcript_chars=len(transcript_text),
+                transcript_words=len(transcript_text.split()),
+            )
+        
+        # Step 2: Summary
+        report(0.35, "step_summarizing")
+        summary = run_stage("summarize", lambda: analyzer.summarize_text(
+            analysis_text,
+            progress_callback=sub_progress(0.35, 0.15, "step_summarizing"),
+            max_chunks=SUMMARY_MODES[plan["summary_mode"]]
+        ))
+        
+        # Step 3: Insights
+        report(0.50, "step_insights")
+        insights = run_stage("insights", lambda: analyzer.extract_insights(
+            analysis_text,
+            progress_callback=sub_progress(0.50, 0.15, "step_insights")
+        ))
+        
+        # Step 4: Action Items
+        report(0.65, "step_actions")
+        action_items = run_stage("actions", lambda: analyzer.extract_action_items(
+            analysis_text,
+            progress_callback=sub_progress(0.65, 0.15, "step_actions"),
+            max_candidates=plan["action_candidates"]
+        ))
+        
+        # Step 5: Key Takeaways
+        report(0.80, "step_takeaways")
+        takeaways = run_stage("takeaways", lambda: analyzer.identify_key_takeaways(
+            analysis_text,
+            progress_callback=sub_progress(0.80, 0.15, "step_takeaways"),
+            max_candidates=plan["takeaway_candidates"]
+        ))
+        
+        # Step 6: Generate Reports
+        report(0.95, "step_formatting")
+        with job.stage("render"):
+            text_report, json_report, pdf_future = render_reports(
+                meeting_info, summary, insights, action_items, takeaways, transcription, lang, job.job_id
+            )
+        
+        if stage_callback:
+            stage_callback("render", 1.0)
+    except JobCancelled:
+        job.finish("cancelled")
+        checkpoint.update_manifest(status="cancelled")
+        raise
+    except Exception as e:
+        job.finish("failed")
+        if checkpoint:
+            checkpoint.update_manifest(status="failed", error=str(e))
+        raise
+    finally:
+        governor.release(job.job_id)
+    
+    segments = transcription["segments"]
+    audio_seconds = segments[-1]["end"] if segments else 0.0
+    realtime_factor = job.finish("done", audio_seconds=audio_seconds)
+    if checkpoint:
+        checkpoint.update_manifest(status="done", resumed_stages=resumed_stages)
+    
+    # Resumed runs skipped stages, so their timings say nothing about throughput
+    if not resumed_stages:
+        try:
+            ThroughputModel.load().observe(plan["audio_seconds"], plan, job.timings, analyzer.calls,
+                                           len(analysis_text.split()))
+        except OSError as e:
+            log_event("throughput_stats_failed", job_id=job.job_id, error=str(e))
+    
+    return {
+        "job_id": job.job_id,
+        "text": text_report,
+        "json": json_report,
+        "pdf": None,
+        "pdf_available": False,
+        "pdf_error": None,
+        "pdf_future": pdf_future,
+        "meeting_info": meeting_info,
+        "summary": summary,
+        "insights": insights,
+        "action_items": action_items,
+        "takeaways": takeaways,
+        "transcription": transcription,
+        "timings": dict(job.timings),
+        "plan": plan,
+        "job_key": checkpoint.job_key if checkpoint else None,
+        "resumed_stages": resumed_stages,
+        "stats": {
+            "duration": AudioTranscriber.format_timestamp(audio_seconds),
+            "audio_seconds": audio_seconds,
+            "queue_wait_seconds": job.queue_wait,
+            "realtime_factor": realtime_factor,
+            "language": transcription["language"],
+            "language_source": transcription["language_source"],
+            "whisper_model": transcription["model"],
+            "decoding_profile": decoding_profile,
+            "fallback_windows": transcription["fallback_windows"],
+            "fallback_decodes": transcription["fallback_decodes"],
+            "segments": len(segments),
+            "segments_removed": cleanup["segments_removed"],
+            "words": len(transcript_text.split()),
+            "action_items": len(action_items),
+            "takeaways": len(takeaways)
+        }
+    }
+
+
+# ============================================================
+# LIVE MEETING INGESTION (Rolling-window transcription)
+# ============================================================
+
+# Every LIVE_STEP_SECONDS of new audio, the not yet committed audio is decoded
+# again. Segments ending within LIVE_OVERLAP_SECONDS of the live edge may
+# still change (a word cut off mid-way), so they are only committed once a
+# later window has heard past them; a window that reaches LIVE_WINDOW_SECONDS
+# (Whisper's context) commits all but its last segment.
+LIVE_WINDOW_SECONDS = float(os.environ.get("LIVE_WINDOW_SECONDS", "30"))
+LIVE_STEP_SECONDS = float(os.environ.get("LIVE_STEP_SECONDS", "5"))
+LIVE_OVERLAP_SECONDS = float(os.environ.get("LIVE_OVERLAP_SECONDS", "3"))
+
+# Live decoding favours latency; see DECODING_PROFILES
+LIVE_DECODING_PROFILE = os.environ.get("LIVE_DECODING_PROFILE", "fast")
+
+# A growing file that has not grown for this long is treated as finished
+LIVE_IDLE_SECONDS = float(os.environ.get("LIVE_IDLE_SECONDS", "30"))
+
+# Longest run of words compared when removing text repeated across windows
+LIVE_DEDUP_WORDS = 12
+
+# One second of 16 kHz mono 16-bit PCM
+LIVE_READ_BYTES = 32000
+
+def wav_data_offset(head):
+    """Offset of the samples in a WAV header, or None while the header is incomplete
+    
+    Live sources must send 16 kHz mono 16-bit PCM; anything else is rejected
+    rather than transcribed as noise.
+    """
+    offset = 12
+    while offset + 8 <= len(head):
+        chunk_id = head[offset:offset + 4]
+        size = int.from_bytes(head[offset + 4:offset + 8], "little")
+        if chunk_id == b"data":
+            return offset + 8
+        if chunk_id == b"fmt ":
+            if offset + 24 > len(head):
+                return None
+            fmt = head[offset + 8:offset + 24]
+            audio_format, channels = int.from_bytes(fmt[0:2], "little"), int.from_bytes(fmt[2:4], "little")
+            rate, bits = int.from_bytes(fmt[4:8], "little"), int.from_bytes(fmt[14:16], "little")
+            if (audio_format, channels, rate, bits) != (1, 1, whisper.audio.SAMPLE_RATE, 16):
+                raise ValueError(f"Live audio must be 16 kHz mono 16-bit PCM, got format {audio_format}, "
+                                 f"{channels} channel(s), {rate} Hz, {bits} bit")
+        offset += 8 + size + size % 2
+    return None
+
+def strip_wav_header(byte_chunks):
+    """Pass raw PCM through unchanged; for a WAV stream, check the format and skip the header"""
+    chunks = iter(byte_chunks)
+    head = b""
+    for data in chunks:
+        head += data
+        if not b"RIFF".startswith(head[:4]):
+            yield head
+            break
+        offset = wav_data_offset(head) if len(head) >= 12 else None
+        if offset is not None:
+            yield head[offset:]
+            break
+    yield from chunks
+
+def pcm16_chunks(byte_chunks):
+    """Turn a stream of 16-bit little-endian PCM bytes into float32 sample arrays
+    
+    A read can end in the middle of a sample; its first byte is carried
+    over to the next chunk.
+    """
+    carry = b""
+    for data in byte_chunks:
+        data = carry + data
+        usable = len(data) - len(data) % 2
+        carry = data[usable:]
+        if usable:
+            yield np.frombuffer(data[:usable], dtype="<i2").astype(np.float32) / 32768.0
+
+class GrowingFileSource:
+    """Audio appended to a file by a recorder (raw 16 kHz mono 16-bit PCM, or WAV)
+    
+    The file is read as it grows. The meeting ends when "<path>.done" is
+    created, or once the file has not grown for idle_seconds.
+    """
+    
+    def __init__(self, path, poll_seconds=0.2, idle_seconds=LIVE_IDLE_SECONDS):
+        self.path = Path(path)
+        self.done_path = Path(f"{path}.done")
+        self.poll_seconds = poll_seconds
+        self.idle_seconds = idle_seconds
+    
+    def _bytes(self):
+        last_growth = time.monotonic()
+        while not self.path.exists():
+            if self.done_path.exists() or time.monotonic() - last_growth > self.idle_seconds:
+                return
+            time.sleep(self.poll_seconds)
+        
+        with open(self.path, "rb") as f:
+            while True:
+                # Checked before reading, so bytes written before the marker are never missed
+                finished = self.done_path.exists() or time.monotonic() - last_growth > self.idle_seconds
+                data = f.read(LIVE_READ_BYTES)
+                if data:
+                    last_growth = time.monotonic()
+                    yield data
+                elif finished:
+                    return
+                else:
+                    time.sleep(self.poll_seconds)
+    
+    def __iter__(self):
+        return pcm16_chunks(strip_wav_header(self._bytes()))
+
+class SocketSource:
+    """Audio sent over one TCP connection to a local port (raw 16 kHz mono 16-bit PCM, or WAV)
+    
+    Listens from construction on (port 0 picks a free port, see .port); the
+    meeting ends when the sender closes the connection.
+    """
+    
+    def __init__(self, port, host="127.0.0.1"):
+        self.server = socket.create_server((host, port))
+        self.port = self.server.getsockname()[1]
+    
+    def _bytes(self):
+        with self.server:
+            connection, _ = self.server.accept()
+            with connection:
+                while data := connection.recv(LIVE_READ_BYTES):
+                    yield data
+    
+    def __iter__(self):
+        return pcm16_chunks(strip_wav_header(self._bytes()))
+
+def open_live_source(source):
+    """A port number listens on that local TCP port; anything else is a growing file path"""
+    return SocketSource(int(source)) if str(source).isdigit() else GrowingFileSource(source)
+
+def overlap_words(previous_text, text, max_words=LIVE_DEDUP_WORDS):
+    """How many leading words of text repeat the last words of previous_text
+    
+    Consecutive windows overlap, so the start of a new window can repeat
+    words already committed from the previous one. Words are compared
+    ignoring case and punctuation; the longest repeat wins.
+    """
+    def normalize(words):
+        return [re.sub(r"[^\w']", "", word.lower()) for word in words]
+    
+    previous = normalize(previous_text.split()[-max_words:])
+    current = normalize(text.split()[:max_words])
+    for n in range(min(len(previous), len(current)), 0, -1):
+        if previous[-n:] == current[:n]:
+            return n
+    return 0
+
+class LiveTranscriber:
+    """Transcribes and analyzes a meeting while it is still going on
+    
+    feed() audio as it arrives; every step_seconds of new audio, the audio
+    after the last committed segment is decoded. Segments that end at least
+    overlap_seconds before the live edge are committed, minus any words
+    repeated from the previous window (see overlap_words()); the rest stay
+    tentative and are decoded again with the next window.
+    
+    Committed text is deduplicated (see TranscriptDeduplicator) and analyzed
+    as it completes, with the same budgets as a full-depth batch job: action items and takeaway candidates per finished
+    sentence, the summary per 1024-character chunk, the insights once the
+    first 4096 characters are in. finish() is then left with the last
+    window and a few model calls, so the report is ready seconds after the
+    meeting ends.
+    """
+    
+    def __init__(self, meeting_info=None, model_size="base", lang="en", spoken_language=None,
+                 decoding_profile=LIVE_DECODING_PROFILE, window_seconds=LIVE_WINDOW_SECONDS,
+                 step_seconds=LIVE_STEP_SECONDS, overlap_seconds=LIVE_OVERLAP_SECONDS, instrumentation=None):
+        self.meeting_info = meeting_info or {}
+        self.model_size = model_size
+        self.lang = lang
+        self.decoding_profile = decoding_profile
+        self.options = DECODING_PROFILES[decoding_profile]
+        self.window_samples = int(window_seconds * whisper.audio.SAMPLE_RATE)
+        self.step_samples = int(step_seconds * whisper.audio.SAMPLE_RATE)
+        self.overlap_seconds = overlap_seconds
+        
+        # Without a hint the language is detected on the first window
+        self.model_name, self.language, self.language_source = AudioTranscriber.route(
+            model_size, spoken_language or lang
+        )
+        self.job = instrumentation or JobInstrumentation()
+        self.job.start()
+        with self.job.stage("model_load"):
+            self.model = load_whisper_model(self.model_name)
+            self.analyzer = MeetingAnalyzer()
+        self.governor = get_cpu_governor()
+        self.governor.register(self.job.job_id, "interactive")
+        
+        # Audio from the end of the last committed segment up to the live edge
+        self.buffer = np.zeros(0, dtype=np.float32)
+        self.buffer_start = 0
+        self.received = 0
+        self.decoded_at = 0
+        self.decodes = 0
+        self.segments = []
+        self.tentative = []
+        self.text = ""
+        # The committed text minus repetition loops and near-duplicates; what the analysis reads
+        self.dedup = TranscriptDeduplicator()
+        self.analysis_text = ""
+        
+        depth = ANALYSIS_DEPTHS[0]
+        self.action_budget = depth["action_candidates"]
+        self.takeaway_budget = depth["takeaway_candidates"]
+        self.analyzed_chars = 0
+        self.summarized_chars = 0
+        self.action_items = []
+        self.key_points = []
+        self.summaries = []
+        self.insights = None
+    
+    def feed(self, samples):
+        """Append 16 kHz float32 samples; returns True if this decoded a new window"""
+        self.buffer = np.concatenate([self.buffer, samples])
+        self.received += len(samples)
+        if self.received - self.decoded_at < self.step_samples:
+            return False
+        self._decode()
+        return True
+    
+    def _decode(self, final=False):
+        """Decode the uncommitted audio and commit the segments that have settled"""
+        self.governor.checkpoint(self.job.job_id)
+        self.decoded_at = self.received
+        offset = self.buffer_start / whisper.audio.SAMPLE_RATE
+        edge = self.received / whisper.audio.SAMPLE_RATE
+        
+        with self.job.stage("transcribe"):
+            if self.language is None:
+                self.language = AudioTranscriber.detect_language(self.model, self.buffer)
+            prompt = None
+            if self.options["condition_on_previous_text"] and self.segments:
+                prompt = "".join(segment["text"] for segment in self.segments[-8:])
+            # verbose=None: no progress bar for every window
+            result = self.model.transcribe(self.buffer, verbose=None, language=self.language,
+                                           initial_prompt=prompt, **self.options)
+        self.decodes += 1
+        segments = [
+            dict(segment, start=offset + segment["start"], end=min(offset + segment["end"], edge))
+            for segment in result["segments"]
+        ]
+        
+        settled = len(segments)
+        if not final:
+            settled = 0
+            while settled < len(segments) and segments[settled]["end"] <= edge - self.overlap_seconds:
+                settled += 1
+            if settled == 0 and len(self.buffer) >= self.window_samples:
+                # Nothing settled within a full window: keep only the segment at the edge open
+                settled = max(len(segments) - 1, 1)
+        committed, self.tentative = segments[:settled], segments[settled:]
+        
+        if committed:
+            commit_until = committed[-1]["end"]
+        elif not segments:
+            # Silence: keep just enough audio before the edge for a word that is starting
+            commit_until = edge - self.overlap_seconds
+        else:
+            commit_until = offset
+        cut = min(max(int(commit_until * whisper.audio.SAMPLE_RATE) - self.buffer_start, 0), len(self.buffer))
+        self.buffer = self.buffer[cut:]
+        self.buffer_start += cut
+        self._commit(committed)
+    
+    def _commit(self, segments):
+        """Append settled segments, minus words repeated from the previous window, then analyze"""
+        drop = overlap_words(self.text, "".join(segment["text"] for segment in segments))
+        for segment in segments:
+            text = segment["text"]
+            if drop:
+                words = text.split()
+                removed = min(drop, len(words))
+                drop -= removed
+                if removed == len(words):
+                    continue
+                text = " " + " ".join(words[removed:])
+            self.segments.append(dict(segment, id=len(self.segments), text=text))
+            self.text += text
+            kept = self.dedup.add(self.segments[-1])
+            if kept:
+                self.analysis_text += kept["text"]
+        self._analyze()
+    
+    def _analyze(self, final=False):
+        """Analyze the committed text that has completed since the last call"""
+        text = self.analysis_text
+        # Action items and takeaways are found per sentence, so only finished sentences are analyzed
+        end = len(text) if final else max(text.rfind(mark) for mark in ".?!") + 1
+        if end > self.analyzed_chars:
+            sentences = text[self.analyzed_chars:end]
+            self.analyzed_chars = end
+            if self.action_budget > 0:
+                with self.job.stage("actions"):
+                    items = self.analyzer.extract_action_items(sentences, max_candidates=self.action_budget)
+                self.action_budget -= len(items)
+                self.action_items.extend(items)
+            candidates = MeetingAnalyzer.takeaway_candidates(sentences)[:self.takeaway_budget]
+            if candidates:
+                with self.job.stage("takeaways"):
+                    self.key_points.extend(self.analyzer.score_key_points(candidates))
+                self.takeaway_budget -= len(candidates)
+        
+        # Same 1024-character chunks summarize_text() would cut from the whole transcript
+        while (len(text) - self.summarized_chars >= 1024
+               or (final and self.summarized_chars < len(text))):
+            chunk = text[self.summarized_chars:self.summarized_chars + 1024]
+            self.summarized_chars += len(chunk)
+            with self.job.stage("summarize"):
+                summary = self.analyzer.summarize_text(chunk)
+            if summary:
+                self.summaries.append(summary)
+        
+        # The insights only read the first 4096 characters
+        if self.insights is None and (final or len(text) >= 4096):
+            with self.job.stage("insights"):
+                self.insights = self.analyzer.extract_insights(text)
+    
+    def snapshot(self):
+        """Transcript and action items so far, for live displays"""
+        return {
+            "segments": list(self.segments),
+            "tentative": list(self.tentative),
+            "text": self.text + "".join(segment["text"] for segment in self.tentative),
+            "action_items": sorted(self.action_items, key=lambda x: ACTION_PRIORITY_ORDER.get(x["priority"], 1)),
+            "audio_seconds": self.received / whisper.audio.SAMPLE_RATE,
+            "committed_seconds": self.buffer_start / whisper.audio.SAMPLE_RATE,
+            "decodes": self.decodes,
+        }
+    
+    def run(self, source, on_update=None):
+        """Feed a live source until the meeting ends and return the report (see finish())
+        
+        on_update(snapshot) is called after every decoded window.
+        """
+        try:
+            for samples in source:
+                if self.feed(samples) and on_update:
+                    on_update(self.snapshot())
+        except BaseException:
+            # Also on a Streamlit rerun or stop, which end the script with a BaseException
+            self.job.finish("failed")
+            self.governor.release(self.job.job_id)
+            raise
+        return self.finish()
+    
+    def finish(self):
+        """Decode the remaining audio, complete the analysis and render the reports
+        
+        Returns the same report data as process_meeting(), plus
+        finalize_seconds: how long the report took once the meeting ended.
+        plan is None: a live meeting runs on the model and profile chosen when
+        it starts, and nothing is planned from its length.
+        """
+        finish_started = time.perf_counter()
+        try:
+            if len(self.buffer):
+                self._decode(final=True)
+            self._analyze(final=True)
+            
+            snapshot = self.snapshot()
+            action_items = snapshot["action_items"]
+            summary = " ".join(self.summaries)
+            takeaways = [item["text"] for item in sorted(self.key_points, key=lambda x: x["score"], reverse=True)[:5]]
+            transcription = {
+                "text": self.text,
+                "segments": self.segments,
+                "language": self.language,
+                "language_source": self.language_source,
+                "model": self.model_name,
+                "decoding_profile": self.decoding_profile,
+                "cleanup": self.dedup.record(),
+            }
+            transcription["fallback_windows"], transcription["fallback_decodes"] = count_fallbacks(
+                self.segments, self.options["temperature"]
+            )
+            with self.job.stage("render"):
+                text_report, json_report, pdf_future = render_reports(
+                    self.meeting_info, summary, self.insights, action_items, takeaways, transcription, self.lang,
+                    self.job.job_id
+                )
+        except Exception:
+            self.job.finish("failed")
+            raise
+        finally:
+            self.governor.release(self.job.job_id)
+        
+        audio_seconds = snapshot["audio_seconds"]
+        realtime_factor = self.job.finish("done", audio_seconds=audio_seconds)
+        finalize_seconds = time.perf_counter() - finish_started
+        log_event("live_meeting_finished", job_id=self.job.job_id, audio_seconds=round(audio_seconds, 3),
+                  decodes=self.decodes, finalize_seconds=round(finalize_seconds, 3))
+        
+        return {
+            "job_id": self.job.job_id,
+            "text": text_report,
+            "json": json_report,
+            "pdf": None,
+            "pdf_available": False,
+            "pdf_error": None,
+            "pdf_future": pdf_future,
+            "meeting_info": self.meeting_info,
+            "summary": summary,
+            "insights": self.insights,
+            "action_items": action_items,
+            "takeaways": takeaways,
+            "transcription": transcription,
+            "timings": dict(self.job.timings),
+            "plan": None,
+            "job_key": None,
+            "resumed_stages": [],
+            "finalize_seconds": finalize_seconds,
+            "stats": {
+                "duration": AudioTranscriber.format_timestamp(audio_seconds),
+                "audio_seconds": audio_seconds,
+                "queue_wait_seconds": None,
+                "realtime_factor": realtime_factor,
+                "language": self.language,
+                "language_source": self.language_source,
+                "whisper_model": self.model_name,
+                "decoding_profile": self.decoding_profile,
+                "fallback_windows": transcription["fallback_windows"],
+                "fallback_decodes": transcription["fallback_decodes"],
+                "segments": len(self.segments),
+                "segments_removed": len(self.dedup.removed),
+                "words": len(self.text.split()),
+                "action_items": len(action_items),
+                "takeaways": len(takeaways)
+            }
+        }
+
+
+# ============================================================
+# DURABLE JOB QUEUE (UI enqueues, queue-worker-script.py consumes)
+# ============================================================
+
+# SQLite database plus uploads/ and results/; must be storage every worker can reach
+QUEUE_DIR = os.environ.get("QUEUE_DIR", os.path.join(tempfile.gettempdir(), "meeting-transcriber", "queue"))
+
+# A worker that stops heartbeating loses its job after this long
+LEASE_SECONDS = float(os.environ.get("QUEUE_LEASE_SECONDS", "60"))
+MAX_ATTEMPTS = int(os.environ.get("QUEUE_MAX_ATTEMPTS", "3"))
+QUEUE_POLL_SECONDS = 1.0
+
+def queue_mode_enabled():
+    """True when the UI should hand jobs to queue workers instead of running them itself"""
+    return os.environ.get("JOB_QUEUE", "").lower() in ("1", "true", "yes")
+
+class JobQueue:
+    """Durable job queue in SQLite with leases, heartbeats and retries
+    
+    Workers lease the oldest runnable job and heartbeat to keep the lease.
+    A lease that runs out (worker crashed, host lost) makes the job runnable
+    again for another worker, up to max_attempts; the retry resumes from the
+    job's checkpoints. Every call opens its own connection, so the queue can
+    be used from any thread or process.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            lease_owner TEXT,
+            lease_expires REAL,
+            progress REAL NOT NULL DEFAULT 0,
+            message TEXT,
+            error TEXT,
+            created_at REAL NOT NULL,
+            started_at REAL,
+            finished_at REAL
+        )
+    """
+    
+    def __init__(self, queue_dir=QUEUE_DIR, lease_seconds=LEASE_SECONDS, max_attempts=MAX_ATTEMPTS):
+        self.queue_dir = Path(queue_dir)
+        self.db_path = self.queue_dir / "jobs.sqlite3"
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        (self.queue_dir / "uploads").mkdir(parents=True, exist_ok=True)
+        (self.queue_dir / "results").mkdir(parents=True, exist_ok=True)
+        with self._transaction() as db:
+            db.execute(self.SCHEMA)
+            db.execute("CREATE INDEX IF NOT EXISTS jobs_runnable ON jobs (status, created_at)")
+    
+    @contextmanager
+    def _transaction(self):
+        """One write-locked transaction (BEGIN IMMEDIATE serializes workers)"""
+        db = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        db.row_factory = sqlite3.Row
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            yield db
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        finally:
+            db.close()
+    
+    @staticmethod
+    def _as_job(row):
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        return job
+    
+    def result_dir(self, job_id):
+        return self.queue_dir / "results" / job_id
+    
+    def enqueue(self, audio_path, meeting_info, lang="en", **settings):
+        """Copy the recording into the queue's storage and add a queued job"""
+        job_id = uuid.uuid4().hex
+        stored_path = self.queue_dir / "uploads" / f"{job_id}{Path(audio_path).suffix}"
+        shutil.copyfile(audio_path, stored_path)
+        
+        checkpoint = JobCheckpoint.for_recording(stored_path, meeting_info, **settings)
+        with self._transaction() as db:
+            # A duplicate of a job still waiting or running gets a key of its own; the lock
+            # file cannot tell, as the job runs later in another process
+            if db.execute("SELECT 1 FROM jobs WHERE status IN ('queued', 'leased') "
+                          "AND json_extract(payload, '$.job_key') = ?", (checkpoint.job_key,)).fetchone():
+                checkpoint.separate()
+            checkpoint.submit(**settings)
+            checkpoint.release()
+            payload = {
+                "audio_path": str(stored_path),
+                "audio_sha256": checkpoint.digest,
+                "job_key": checkpoint.job_key,
+                "meeting_info": meeting_info,
+                "lang": lang,
+                "settings": settings,
+            }
+            db.execute("INSERT INTO jobs (id, status, payload, created_at) VALUES (?, 'queued', ?, ?)",
+                       (job_id, json.dumps(payload, ensure_ascii=False), time.time()))
+        return job_id
+    
+    def lease(self, worker_id):
+        """Claim the oldest queued or abandoned job; returns it as a dict, or None"""
+        now = time.time()
+        with self._transaction() as db:
+            expired = db.execute(
+                "SELECT * FROM jobs WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, self.max_attempts)
+            ).fetchall()
+            for row in expired:
+                self._finish(db, self._as_job(row), "failed",
+                             f"Lease expired on its last attempt ({row['attempts']}/{self.max_attempts})")
+            
+            row = db.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY created_at LIMIT 1",
+                (now,)
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1, "
+                "started_at = COALESCE(started_at, ?) WHERE id = ?",
+                (worker_id, now + self.lease_seconds, now, row["id"])
+            )
+            job = self._as_job(db.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone())
+        log_event("queue_job_leased", job_id=job["id"], worker=worker_id, attempt=job["attempts"])
+        return job
+    
+    def heartbeat(self, job_id, worker_id, progress=None, message=None):
+        """Extend the lease; False if this worker no longer holds it (expired or cancelled)"""
+        with self._transaction() as db:
+            updated = db.execute(
+                "UPDATE jobs SET lease_expires = ?, progress = COALESCE(?, progress), "
+                "message = COALESCE(?, message) WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (time.time() + self.lease_seconds, progress, message, job_id, worker_id)
+            ).rowcount
+        return updated == 1
+    
+    def _finish(self, db, job, status, error=None):
+        db.execute("UPDATE jobs SET status = ?, error = ?, finished_at = ?, lease_owner = NULL WHERE id = ?",
+                   (status, error, time.time(), job["id"]))
+        # The recording is only needed until the job can no longer run
+        Path(job["payload"]["audio_path"]).unlink(missing_ok=True)
+        log_event("queue_job_finished", job_id=job["id"], status=status, error=error)
+    
+    def _owned(self, db, job_id, worker_id):
+        row = db.execute("SELECT * FROM jobs WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                         (job_id, worker_id)).fetchone()
+        return self._as_job(row) if row else None
+    
+    def complete(self, job_id, worker_id, report_data):
+        """Store the report and mark the job done; False if the lease was lost meanwhile"""
+        # Outside the transaction: other workers keep using the queue while the PDF finishes
+        resolve_pdf(report_data)
+        with self._transaction() as db:
+            job = self._owned(db, job_id, worker_id)
+            if job is None:
+                return False
+            result_dir = self.result_dir(job_id)
+            result_dir.mkdir(parents=True, exist_ok=True)
+            if report_data["pdf_available"]:
+                (result_dir / "report.pdf").write_bytes(report_data["pdf"])
+            with open(result_dir / "result.json", "w", encoding="utf-8") as f:
+                json.dump({**report_data, "pdf": None, "json": None}, f, ensure_ascii=False)
+            db.execute("UPDATE jobs SET progress = 1.0 WHERE id = ?", (job_id,))
+            self._finish(db, job, "done")
+        return True
+    
+    def fail(self, job_id, worker_id, error):
+        """Give the job back for another attempt, or fail it after max_attempts"""
+        with self._transaction() as db:
+            job = self._owned(db, job_id, worker_id)
+            if job is None:
+                return
+            if job["attempts"] < self.max_attempts:
+                db.execute("UPDATE jobs SET status = 'queued', error = ?, lease_owner = NULL WHERE id = ?",
+                           (error, job_id))
+            else:
+                self._finish(db, job, "failed", error)
+    
+    def cancel(self, job_id):
+        """Cancel a queued or running job; a running one stops at its next progress update"""
+        with self._transaction() as db:
+            row = db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None or row["status"] not in ("queued", "leased"):
+                return False
+            job = self._as_job(row)
+            JobCheckpoint(job["payload"]["job_key"]).cancel()
+            self._finish(db, job, "cancelled")
+        return True
+    
+    def get(self, job_id):
+        db = sqlite3.connect(self.db_path, timeout=30)
+        db.row_factory = sqlite3.Row
+        try:
+            row = db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            job = self._as_job(row)
+            if job["status"] == "queued":
+                job["position"] = db.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status = 'queued' AND created_at < ?", (job["created_at"],)
+                ).fetchone()[0] + 1
+            return job
+        finally:
+            db.close()
+    
+    def counts(self):
+        db = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            return dict(db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        finally:
+            db.close()
+    
+    def load_result(self, job_id):
+        """The finished job's report_data, as process_meeting returned it"""
+        result_dir = self.result_dir(job_id)
+        with open(result_dir / "result.json", encoding="utf-8") as f:
+            report_data = json.load(f)
+        # The JSON report repeats the stored fields, so it is rebuilt rather than stored
+        report_data["json"] = "".join(export_chunks(report_data))
+        if report_data["pdf_available"]:
+            report_data["pdf"] = (result_dir / "report.pdf").read_bytes()
+        return report_data
+
 
 # ============================================================
 # STREAMLIT APP
 # ============================================================
 
+def wait_for_queued_job(job_id, lang):
+    """Poll the queue until a worker finishes job_id, then show its report"""
+    queue = JobQueue()
+    if st.button(t("cancel_job", lang), key="cancel_job"):
+        queue.cancel(job_id)
+    
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    while True:
+        job = queue.get(job_id)
+        if job is None or job["status"] in ("failed", "cancelled"):
+            st.session_state.queued_job = None
+            progress_bar.empty()
+            if job and job["status"] == "failed":
+                st.error(f"{t('error', lang)}: {job['error']}")
+            else:
+                st.info(t("job_cancelled", lang))
+            return
+        if job["status"] == "done":
+            st.session_state.report_data = queue.load_result(job_id)
+            st.session_state.report_generated = True
+            st.session_state.queued_job = None
+            st.rerun()
+        
+        if job["status"] == "queued":
+            status_text.text(t("queued", lang).format(position=job["position"]))
+        else:
+            status_text.text(job["message"] or "")
+        progress_bar.progress(min(job["progress"], 1.0))
+        time.sleep(QUEUE_POLL_SECONDS)
+
+def run_live_meeting(source, meeting_info, lang, model_size, spoken_language):
+    """Transcribe a live source in this script run, showing the transcript and action items as they grow"""
+    status = st.empty()
+    status.info(t("live_waiting", lang))
+    transcript = st.empty()
+    actions = st.empty()
+    
+    def show(snapshot):
+        status.info(t("live_status", lang).format(
+            audio=AudioTranscriber.format_timestamp(snapshot["audio_seconds"]),
+            committed=AudioTranscriber.format_timestamp(snapshot["committed_seconds"])
+        ))
+        # The newest text last, and only the tail so long meetings stay light to redraw
+        transcript.text(snapshot["text"][-3000:])
+        actions.markdown("\n".join(
+            f"- **{item['priority']}** {item['task']}" for item in snapshot["action_items"]
+        ))
+    
+    try:
+        live = LiveTranscriber(meeting_info, model_size=model_size, lang=lang, spoken_language=spoken_language)
+        report_data = live.run(open_live_source(source), on_update=show)
+    except Exception as e:
+        st.error(f"{t('error', lang)}: {str(e)}")
+        st.code(traceback.format_exc())
+        return
+    
+    st.session_state.report_data = report_data
+    st.session_state.report_generated = True
+    st.rerun()
+
 def main():
     # Page config
     st.set_page_config(
@@ -709,6 +3558,9 @@ def main():
         initial_sidebar_state="expanded"
     )
     
+    if WARMUP_MODELS:
+        start_model_warmup()
+    
     # Initialize session state
     if "report_generated" not in st.session_state:
         st.session_state.report_generated = False
@@ -717,12 +3569,29 @@ def main():
     
     # Sidebar - Language Selection
     st.sidebar.title("⚙️ Settings")
+    language_names = {"en": "English", "es": "Español", "fr": "Français", "zh": "中文", "de": "Deutsch", "bn": "বাংলা"}
     lang = st.sidebar.selectbox(
         "🌍 " + t("language", "en"),
-        options=["en", "es", "fr", "zh", "de", "bn"],
-        format_func=lambda x: {"en": "English", "es": "Español", "fr": "Français", "zh": "中文", "de": "Deutsch", "bn": "বাংলা"}[x]
+        options=list(language_names),
+        format_func=lambda x: language_names[x]
     )
     
+    # Admin-only profiling toggle
+    profile_job = profiling_enabled_by_env()
+    if os.environ.get("MEETING_ADMIN_MODE", "").lower() in ("1", "true", "yes"):
+        with st.sidebar.expander("🛠️ Admin"):
+            profile_job = st.checkbox(
+                "Profile next job",
+                value=profile_job,
+                help=f"Writes cProfile/torch profiler dumps to {PROFILE_DIR}/<job_id>/"
+            )
+            allocation = get_cpu_governor().allocation()
+            st.caption(f"CPU: {allocation['cores']} cores" + ("" if allocation["enabled"] else " (governor off)"))
+            if allocation["jobs"]:
+                st.table(allocation["jobs"])
+            bundle = get_model_bundle()
+            st.caption(f"Models: bundle {bundle.version}" if bundle else "Models: download cache")
+    
     # Main title
     st.title(t("title", lang))
     st.markdown(f"**{t('subtitle', lang)}**")
@@ -735,7 +3604,7 @@ def main():
         st.subheader(t("upload_audio", lang))
         audio_file = st.file_uploader(
             t("audio_help", lang),
-            type=["mp3", "wav", "m4a", "webm", "mp4", "flac", "ogg"],
+            type=SUPPORTED_AUDIO_FORMATS,
             help=t("audio_help", lang)
         )
         
@@ -751,6 +3620,27 @@ def main():
             index=1,
             help=t("model_help", lang)
         )
+        decoding_profile = st.selectbox(
+            t("decoding_profile", lang),
+            options=list(DECODING_PROFILES),
+            index=list(DECODING_PROFILES).index(DEFAULT_DECODING_PROFILE),
+            format_func=str.title,
+            help=t("profile_help", lang)
+        )
+        deadline_minutes = st.number_input(
+            t("deadline", lang),
+            min_value=0,
+            value=0,
+            step=5,
+            help=t("deadline_help", lang)
+        )
+        # Defaults to the UI language; a known language skips Whisper's detection pass
+        spoken_language = st.selectbox(
+            t("spoken_language", lang),
+            options=["auto"] + list(language_names),
+            index=1 + list(language_names).index(lang),
+            format_func=lambda x: t("auto_detect", lang) if x == "auto" else language_names[x]
+        )
     
     # Meeting details
     st.markdown("---")
@@ -775,130 +3665,86 @@ def main():
             help="Separate multiple attendees with commas"
         )
     
+    # Prepare meeting info
+    meeting_info = {
+        "title": meeting_title,
+        "date": meeting_date.strftime("%Y-%m-%d"),
+        "time": meeting_time.strftime("%H:%M"),
+        "location": location,
+        "organizer": organizer if organizer else "Not specified",
+        "attendees": attendees if attendees else "Not specified"
+    }
+    
+    # Live meeting: transcribe audio while it is still being recorded
+    with st.expander(t("live_title", lang)):
+        live_source = st.text_input(t("live_source", lang), help=t("live_source_help", lang))
+        start_live = st.button(t("live_start", lang), disabled=not live_source)
+    
     # Generate button
     st.markdown("---")
-    if st.button(t("generate_report", lang), type="primary", use_container_width=True):
+    if start_live:
+        run_live_meeting(live_source, meeting_info, lang, model_size, spoken_language)
+    elif st.button(t("generate_report", lang), type="primary", use_container_width=True):
         if audio_file is None:
             st.error(t("upload_file_first", lang))
         else:
-            # Prepare meeting info
-            meeting_info = {
-                "title": meeting_title,
-                "date": meeting_date.strftime("%Y-%m-%d"),
-                "time": meeting_time.strftime("%H:%M"),
-                "location": location,
-                "organizer": organizer if organizer else "Not specified",
-                "attendees": attendees if attendees else "Not specified"
-            }
-            
             # Process the audio
+            checkpoint = None
             try:
+                job = JobInstrumentation(profile=profile_job)
+                
                 # Save uploaded file temporarily
-                with tempfile.NamedTemporaryFile(delete=False, suffix=Path(audio_file.name).suffix) as tmp_file:
-                    tmp_file.write(audio_file.read())
-                    tmp_path = tmp_file.name
+                with job.stage("upload"):
+                    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(audio_file.name).suffix) as tmp_file:
+                        tmp_file.write(audio_file.read())
+                        tmp_path = tmp_file.name
+                
+                # Same recording + details + settings -> same job, so a rerun resumes from its checkpoints
+                job_settings = {
+                    "model_size": model_size,
+                    "decoding_profile": decoding_profile,
+                    "spoken_language": spoken_language,
+                    "deadline_seconds": deadline_minutes * 60 or None,
+                }
+                
+                if queue_mode_enabled():
+                    # Queue workers do the processing; this session only waits for the result
+                    st.session_state.queued_job = JobQueue().enqueue(tmp_path, meeting_info, lang=lang,
+                                                                     **job_settings)
+                    os.unlink(tmp_path)
+                    st.rerun()
+                
+                checkpoint = JobCheckpoint.for_recording(tmp_path, meeting_info, **job_settings)
+                checkpoint.submit(**job_settings)
+                st.session_state.active_job = checkpoint.job_key
+                # Clicking reruns the script, which stops this run at its next progress update
+                st.button(t("cancel_job", lang), key="cancel_job")
                 
                 # Progress tracking
                 progress_bar = st.progress(0)
                 status_text = st.empty()
                 
-                # Step 1: Transcription
-                status_text.text(t("step_transcribing", lang))
-                progress_bar.progress(0.15)
+                def update_progress(progress, message):
+                    status_text.text(message)
+                    progress_bar.progress(progress)
                 
-                transcription = AudioTranscriber.transcribe(
+                report_data = process_meeting(
                     tmp_path,
+                    meeting_info,
                     model_size=model_size,
-                    progress_callback=lambda p, m: progress_bar.progress(0.15 + p * 0.15)
-                )
-                transcript_text = transcription["text"]
-                
-                # Initialize analyzer
-                analyzer = MeetingAnalyzer()
-                
-                # Step 2: Summary
-                status_text.text(t("step_summarizing", lang))
-                progress_bar.progress(0.35)
-                
-                summary = analyzer.summarize_text(
-                    transcript_text,
-                    progress_callback=lambda p, m: progress_bar.progress(0.35 + p * 0.15)
-                )
-                
-                # Step 3: Insights
-                status_text.text(t("step_insights", lang))
-                progress_bar.progress(0.50)
-                
-                insights = analyzer.extract_insights(
-                    transcript_text,
-                    progress_callback=lambda p, m: progress_bar.progress(0.50 + p * 0.15)
-                )
-                
-                # Step 4: Action Items
-                status_text.text(t("step_actions", lang))
-                progress_bar.progress(0.65)
-                
-                action_items = analyzer.extract_action_items(
-                    transcript_text,
-                    progress_callback=lambda p, m: progress_bar.progress(0.65 + p * 0.15)
-                )
-                
-                # Step 5: Key Takeaways
-                status_text.text(t("step_takeaways", lang))
-                progress_bar.progress(0.80)
-                
-                takeaways = analyzer.identify_key_takeaways(
-                    transcript_text,
-                    progress_callback=lambda p, m: progress_bar.progress(0.80 + p * 0.15)
-                )
-                
-                # Step 6: Generate Reports
-                status_text.text(t("step_formatting", lang))
-                progress_bar.progress(0.95)
-                
-                generator = ReportGenerator(lang)
-                
-                # Generate all formats
-                text_report = generator.generate_text_report(
-                    meeting_info, summary, insights, action_items, takeaways, transcription
-                )
-                
-                json_report = generator.generate_json_report(
-                    meeting_info, summary, insights, action_items, takeaways, transcription
+                    lang=lang,
+                    progress_callback=update_progress,
+                    instrumentation=job,
+                    spoken_language=spoken_language,
+                    decoding_profile=decoding_profile,
+                    deadline_seconds=job_settings["deadline_seconds"],
+                    checkpoint=checkpoint
                 )
                 
-                # Try to generate PDF, but don't fail if it doesn't work
-                try:
-                    pdf_report = generator.generate_pdf_report(
-                        meeting_info, summary, insights, action_items, takeaways
-                    )
-                    pdf_available = True
-                except Exception as pdf_error:
-                    st.warning(f"⚠️ PDF generation failed: {str(pdf_error)}. PDF download will be unavailable.")
-                    pdf_report = None
-                    pdf_available = False
-                
                 # Store in session state
-                st.session_state.report_data = {
-                    "text": text_report,
-                    "json": json_report,
-                    "pdf": pdf_report,
-                    "pdf_available": pdf_available,
-                    "meeting_info": meeting_info,
-                    "summary": summary,
-                    "insights": insights,
-                    "action_items": action_items,
-                    "takeaways": takeaways,
-                    "transcription": transcription,
-                    "stats": {
-                        "duration": AudioTranscriber.format_timestamp(transcription["segments"][-1]["end"]),
-                        "segments": len(transcription["segments"]),
-                        "words": len(transcript_text.split()),
-                        "action_items": len(action_items),
-                        "takeaways": len(takeaways)
-                    }
-                }
+                st.session_state.report_data = report_data
                 st.session_state.report_generated = True
+                st.session_state.active_job = None
                 
                 # Complete
                 progress_bar.progress(1.0)
@@ -911,6 +3757,10 @@ def main():
                 st.success(t("success", lang))
                 st.rerun()
                 
+            except JobCancelled:
+                st.session_state.active_job = None
+                st.info(t("job_cancelled", lang))
+                os.unlink(tmp_path)
             except Exception as e:
                 st.error(f"{t('error', lang)}: {str(e)}")
                 st.code(traceback.format_exc())
@@ -919,6 +3769,19 @@ def main():
                     os.unlink(tmp_path)
                 except:
                     pass
+            finally:
+                if checkpoint:
+                    checkpoint.release()
+    elif st.session_state.get("queued_job"):
+        wait_for_queued_job(st.session_state.queued_job, lang)
+    elif st.session_state.get("active_job"):
+        # The last run stopped before finishing (rerun, disconnect or cancel click)
+        if st.button(t("cancel_job", lang), key="cancel_job"):
+            JobCheckpoint(st.session_state.active_job).cancel()
+            st.session_state.active_job = None
+            st.info(t("job_cancelled", lang))
+        else:
+            st.info(t("job_interrupted", lang))
     
     # Display report if generated
     if st.session_state.report_generated and st.session_state.report_data:
@@ -934,6 +3797,31 @@ def main():
         col3.metric(t("words", lang), stats["words"])
         col4.metric(t("action_items", lang), stats["action_items"])
         col5.metric(t("takeaways", lang), stats["takeaways"])
+        st.caption(
+            f"🗣️ {stats['language']} ({stats['language_source']}) · Whisper {stats['whisper_model']}"
+            f" · {stats['decoding_profile']} · {stats['fallback_decodes']} fallback re-decodes"
+            f" · {stats.get('segments_removed', 0)} repeated segments left out of the analysis"
+        )
+        
+        # Chosen plan with predicted vs actual stage times (live meetings are not planned)
+        plan = st.session_state.report_data["plan"]
+        timings = st.session_state.report_data["timings"]
+        if plan:
+            with st.expander(t("plan", lang), expanded=plan["adapted"] or not plan["meets_deadline"]):
+                st.markdown(
+                    f"**{plan['model_size']}** · {plan['decoding_profile']} · "
+                    f"summary: {plan['summary_mode']} · "
+                    f"candidates: {plan['action_candidates']} actions / {plan['takeaway_candidates']} takeaways"
+                )
+                if plan["deadline_seconds"] is not None and not plan["meets_deadline"]:
+                    st.warning(f"⚠️ Predicted {plan['predicted_total']:.0f}s exceeds the "
+                               f"{plan['deadline_seconds']:.0f}s remaining, even with the cheapest plan.")
+                rows = {stage: (predicted, timings.get(stage, 0.0)) for stage, predicted in plan["predicted"].items()}
+                rows["total"] = (plan["predicted_total"], sum(actual for _, actual in rows.values()))
+                st.table([
+                    {"stage": stage, t("predicted", lang): f"{predicted:.1f}s", t("actual", lang): f"{actual:.1f}s"}
+                    for stage, (predicted, actual) in rows.items()
+                ])
         
         # Download section
         st.markdown("---")
@@ -960,21 +3848,14 @@ def main():
             )
         
         with col3:
-            if st.session_state.report_data.get("pdf_available", False):
-                st.download_button(
-                    label=t("download_pdf", lang),
-                    data=st.session_state.report_data["pdf"],
-                    file_name=f"meeting_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-                    mime="application/pdf",
-                    use_container_width=True
-                )
-            else:
-                st.button(
-                    label="⚠️ PDF Unavailable",
-                    disabled=True,
-                    use_container_width=True,
-                    help="PDF generation failed. Please use TXT or Markdown format."
-                )
+            # Filled in at the end of the page once the background render finishes
+            pdf_slot = st.empty()
+            pdf_slot.button(
+                label="⏳ PDF",
+                disabled=True,
+                use_container_width=True,
+                help="The PDF is still rendering."
+            )
         
         with col4:
             st.download_button(
@@ -1058,6 +3939,24 @@ def main():
         # Full report in expander
         with st.expander("📄 View Full Text Report"):
             st.code(st.session_state.report_data["text"], language=None)
+        
+        # The rest of the page is already shown; wait for the PDF here
+        report_data = resolve_pdf(st.session_state.report_data)
+        if report_data["pdf_available"]:
+            pdf_slot.download_button(
+                label=t("download_pdf", lang),
+                data=report_data["pdf"],
+                file_name=f"meeting_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+                mime="application/pdf",
+                use_container_width=True
+            )
+        else:
+            pdf_slot.button(
+                label="⚠️ PDF Unavailable",
+                disabled=True,
+                use_container_width=True,
+                help=f"PDF generation failed ({report_data['pdf_error']}). Please use TXT or Markdown format."
+            )
     
     # Footer
     st.markdown("---")
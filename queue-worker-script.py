@@ -0,0 +1,189 @@
+"""
+Queue Worker
+============
+Consumes the durable job queue the Streamlit app fills when started with
+JOB_QUEUE=1. Start as many workers as the machines can hold, on any host
+that can reach QUEUE_DIR (and JOBS_DIR / AUDIO_CACHE_DIR, so a retry can
+resume the checkpoints an earlier attempt left behind).
+
+Each worker leases one job at a time and heartbeats while it runs. If a
+worker dies, its lease runs out after QUEUE_LEASE_SECONDS and the next free
+worker takes the job over, up to QUEUE_MAX_ATTEMPTS attempts. Cancelling a
+job in the UI stops the worker at its next progress update.
+
+Usage:
+    JOB_QUEUE=1 streamlit run meeting-transcription-app.py
+    python queue-worker-script.py --workers 2 --preload base
+"""
+
+import argparse
+import importlib.util
+import multiprocessing
+import os
+import socket
+import threading
+import time
+import traceback
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parent / "meeting-transcription-app.py"
+
+_app = None
+
+
+class LeaseLost(Exception):
+    """The queue handed this worker's job to someone else (lease expired or job cancelled)"""
+
+
+def load_app_module():
+    """Import the Streamlit app file as a module (its filename is not importable)"""
+    spec = importlib.util.spec_from_file_location("meeting_transcription_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def init_worker(preload=None, workers=1, preload_language=None):
+    """Import the app once per worker process and optionally load models up front
+    
+    preload is a model size; the checkpoint loaded is the one jobs in
+    preload_language are routed to (e.g. base.en for English).
+    """
+    global _app
+    _app = load_app_module()
+    # Worker processes on one host split its cores instead of each using all of them
+    governor = _app.get_cpu_governor()
+    governor.set_cores(governor.cores // workers)
+    if preload:
+        _app.load_whisper_model(_app.AudioTranscriber.route(preload, preload_language)[0])
+        _app.load_ai_models()
+
+
+class Heartbeat:
+    """Keeps a job's lease alive from a background thread and relays progress
+
+    The pipeline only reports progress between steps, which can be minutes
+    apart during transcription, so the lease is renewed on a timer instead.
+    """
+
+    def __init__(self, queue, job_id, worker_id):
+        self.queue = queue
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.progress = None
+        self.message = None
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.queue.lease_seconds / 3):
+            self.beat()
+
+    def beat(self):
+        if not self.queue.heartbeat(self.job_id, self.worker_id, self.progress, self.message):
+            self.lost = True
+
+    def progress_callback(self, progress, message):
+        self.progress, self.message = progress, message
+        if self.lost:
+            raise LeaseLost(self.job_id)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_job(queue, job, worker_id):
+    """Run one leased job through the pipeline and hand the result back to the queue"""
+    payload = job["payload"]
+    checkpoint = _app.JobCheckpoint(payload["job_key"], digest=payload["audio_sha256"])
+    instrumentation = _app.JobInstrumentation(job_id=job["id"], queued_at=job["created_at"])
+
+    try:
+        with Heartbeat(queue, job["id"], worker_id) as heartbeat:
+            report_data = _app.process_meeting(payload["audio_path"], payload["meeting_info"], lang=payload["lang"],
+                                               progress_callback=heartbeat.progress_callback,
+                                               instrumentation=instrumentation, checkpoint=checkpoint,
+                                               **payload["settings"])
+        if not queue.complete(job["id"], worker_id, report_data):
+            print(f"⚠️  {job['id']}: lease lost before the result was stored")
+            return "lost"
+        return "done"
+    except (LeaseLost, _app.JobCancelled):
+        # Whoever took the job over (another worker, or the cancel) owns its status now
+        return "lost"
+    except Exception as e:
+        traceback.print_exc()
+        queue.fail(job["id"], worker_id, str(e))
+        return "failed"
+
+
+def serve(poll_seconds, max_jobs=None):
+    """Lease and run jobs until interrupted (or after max_jobs)"""
+    queue = _app.JobQueue()
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    print(f"👷 Worker {worker_id} polling {queue.db_path}")
+
+    handled = 0
+    while max_jobs is None or handled < max_jobs:
+        job = queue.lease(worker_id)
+        if job is None:
+            time.sleep(poll_seconds)
+            continue
+
+        started = time.time()
+        print(f"▶️  {job['id']} (attempt {job['attempts']}/{queue.max_attempts})")
+        status = run_job(queue, job, worker_id)
+        print(f"{'✅' if status == 'done' else '❌'} {job['id']} {status} ({time.time() - started:.1f}s)")
+        handled += 1
+
+
+def worker_main(preload, workers, poll_seconds, max_jobs, preload_language):
+    init_worker(preload, workers, preload_language)
+    try:
+        serve(poll_seconds, max_jobs)
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Process meeting jobs from the durable queue")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes to start (default: 1)")
+    parser.add_argument("--poll-seconds", type=float, default=2.0,
+                        help="How long an idle worker waits before asking for a job again (default: 2)")
+    parser.add_argument("--preload", default=None, choices=["tiny", "base", "small", "medium", "large"],
+                        help="Load this Whisper model and the analysis models before taking jobs")
+    parser.add_argument("--preload-language", default="en",
+                        help="Spoken language of most jobs, or 'auto'; picks the checkpoint --preload loads "
+                             "(default: en, which loads the English-only <size>.en model)")
+    parser.add_argument("--max-jobs", type=int, default=None, help="Exit after this many jobs per worker")
+    args = parser.parse_args()
+
+    if args.workers == 1:
+        worker_main(args.preload, 1, args.poll_seconds, args.max_jobs, args.preload_language)
+        return
+
+    # Spawn keeps torch/OpenMP state out of the children
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=worker_main, args=(args.preload, args.workers, args.poll_seconds, args.max_jobs,
+                                                      args.preload_language))
+        for _ in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()